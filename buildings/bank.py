@@ -130,7 +130,7 @@ class BankInterface:
         self.load_transaction_history()
 
         # Monthly Summary Frame
-        summary_monthly_frame = tk.LabelFrame(main_frame, text="Monthly Summary",
+        summary_monthly_frame = tk.LabelFrame(main_frame, text="Monthly Summary (last 3 calendar months)",
                                              font=('Arial', 14, 'bold'), bg='#2a2a2a', fg='white')
         summary_monthly_frame.pack(pady=10, padx=20, fill='x')
 
@@ -291,14 +291,14 @@ class BankInterface:
         """Load monthly summary"""
         self.monthly_summary_text.delete('1.0', tk.END)
 
-        monthly_data = self.money_system.get_monthly_summary()
+        # Running totals from the save for whole calendar months, newest first
+        monthly_data = self.money_system.get_monthly_totals(3)
 
         if not monthly_data:
             self.monthly_summary_text.insert('1.0', "No transaction data available")
             return
 
-        # Sort by month
-        sorted_months = sorted(monthly_data.keys(), reverse=True)[:3]
+        sorted_months = list(monthly_data.keys())
 
         summary_lines = []
         for month in sorted_months:
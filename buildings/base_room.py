@@ -20,7 +20,7 @@ class BaseRoom:
         self.on_back = on_back
 
         # Initialize run platforms (load existing or create new)
-        self.run_platforms = RunPlatforms()
+        self.run_platforms = RunPlatforms(randomize=False)
         if not self.run_platforms.load_run():
             # New run - randomize platforms
             self.run_platforms.randomize_run()
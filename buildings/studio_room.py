@@ -1,13 +1,28 @@
 import tkinter as tk
-from tkinter import Canvas, messagebox, ttk
+from tkinter import Canvas, messagebox, simpledialog, ttk
 import math
+import time
 from systems.game_systems import TimeSystem, EnergySystem, SleepSchedule, HygieneSystem, HappinessSystem
 from systems.money_system import MoneySystem
+from systems.time_scheduler import TimeScheduler
+from systems.turbo_simulation import TurboSimulation
+from systems.state_history import StateHistory
 from buildings.base_room import BaseRoom
 from desktop.desktop_system import DesktopScreen
 from buildings.bank import BankInterface
 
 class StudioRoomScreen(BaseRoom):
+    # Status bar refresh interval - the clock text doesn't need 60 FPS
+    STATUS_REFRESH_MS = 100
+    # Repaint interval while a turbo simulation runs in the background
+    TURBO_REPAINT_MS = 250
+    # Autosave interval, and the sections changed in place - by the room and by the desktop apps it opens
+    # (the journal skips the ones that didn't change since it last wrote them)
+    AUTOSAVE_MS = 5000
+    AUTOSAVE_SECTIONS = ('time', 'energy_system', 'hygiene_system', 'happiness_system', 'player_data',
+                         'current_game', 'preloaded_adventure_data', 'saved_game_names', 'general_notes',
+                         'unlocks', 'last_desktop_use', 'studio_reputation', 'rng')
+
     def __init__(self, root, game_data, on_back=None):
         super().__init__(root, game_data, on_back)
 
@@ -40,9 +55,34 @@ class StudioRoomScreen(BaseRoom):
         self.happiness_system = HappinessSystem(game_data)
         self.money_system = MoneySystem(game_data)
 
+        # Monthly work runs when game time crosses a month, not every frame
+        self.scheduler = TimeScheduler(self.time_system)
+        self.scheduler.every('month', self.process_monthly_expenses)
+
+        # Day-by-day snapshots for rewinding, kept on game_data across visits to the room
+        # (attached after the scheduler, so each snapshot includes that day's monthly bills)
+        if getattr(game_data, 'history', None) is None:
+            game_data.history = StateHistory(game_data)
+        self.history = game_data.history
+        self.history.attach(self.time_system)
+        if not self.history.snapshots:
+            self.history.take()
+
+        # Background multi-year simulation (None until first used)
+        self.turbo = None
+
+        # Pending root.after callbacks by name, cancelled by close()
+        self.after_ids = {}
+
         self.setup_ui()
         self.draw_room()
+
+        # Settle the current month once on entry
+        self.process_monthly_expenses()
+
         self.start_game_loop()
+        self.start_status_refresh()
+        self.schedule('autosave', self.AUTOSAVE_MS, self.autosave)
 
     def setup_ui(self):
         # Clear existing widgets
@@ -101,6 +141,20 @@ class StudioRoomScreen(BaseRoom):
                                      padx=15, pady=5)
         self.speed_button.pack(side='right', padx=20)
 
+        # Turbo button - simulate years in the background
+        self.turbo_button = tk.Button(status_frame, text="⏭ Turbo",
+                                     command=self.toggle_turbo,
+                                     font=('Arial', 12, 'bold'), bg='#444', fg='white',
+                                     padx=15, pady=5)
+        self.turbo_button.pack(side='right')
+
+        # Rewind button - go back to an earlier day
+        self.rewind_button = tk.Button(status_frame, text="⏪ Rewind",
+                                      command=self.rewind_days,
+                                      font=('Arial', 12, 'bold'), bg='#444', fg='white',
+                                      padx=15, pady=5)
+        self.rewind_button.pack(side='right', padx=(0, 10))
+
         self.update_status_display()
 
         # Canvas for room
@@ -466,6 +520,7 @@ class StudioRoomScreen(BaseRoom):
     def go_to_bank(self, door_window):
         """Navigate to bank interface"""
         door_window.destroy()
+        self.close()
 
         # Clear the current UI
         for widget in self.root.winfo_children():
@@ -655,25 +710,78 @@ class StudioRoomScreen(BaseRoom):
                              self.player_x + self.player_radius,
                              self.player_y + self.player_radius)
 
+    def schedule(self, name, delay_ms, callback):
+        """root.after that remembers its id, so close() can cancel it"""
+        self.after_ids[name] = self.root.after(delay_ms, callback)
+
+    def close(self):
+        """Stop the room's timers, clock listeners and turbo run before another screen replaces it"""
+        turbo_pending = 'turbo' in self.after_ids
+        for after_id in self.after_ids.values():
+            self.root.after_cancel(after_id)
+        self.after_ids.clear()
+
+        # The turbo thread changes game data in place - it must be done before anything else reads it
+        if turbo_pending:
+            self.turbo.stop(wait=True)
+            self.finish_turbo()
+
+        self.scheduler.detach()
+        self.history.detach()
+
+    def back_to_menu(self):
+        """Go back to previous screen"""
+        self.close()
+        super().back_to_menu()
+
+    def is_turbo_running(self):
+        return self.turbo is not None and self.turbo.is_running()
+
     def start_game_loop(self):
         self.update_player_position()
-        # Update real-time clock
-        self.time_system.update_real_time()
-        self.update_status_display()
 
-        # Process monthly expenses (like rent)
-        self.process_monthly_expenses()
+        # The clock is paused while turbo owns game time
+        if not self.is_turbo_running():
+            # Update real-time clock
+            self.time_system.update_real_time()
+
+            # Catch up on time passed elsewhere (desktop, door menu) - fires month callbacks
+            self.scheduler.sync()
 
         # Schedule next update (60 FPS)
-        self.root.after(16, self.start_game_loop)
+        self.schedule('game_loop', 16, self.start_game_loop)
+
+    def autosave(self):
+        """Append what changed to the save's journal (a full save only when it has grown large)"""
+        journal = getattr(self.game_data, 'journal', None)
+        auto_save = self.game_data.data.get('settings', {}).get('auto_save_enabled', True)
+
+        if journal and auto_save and not self.is_turbo_running():
+            journal.mark_dirty(*self.AUTOSAVE_SECTIONS)
+            try:
+                journal.flush(self.game_data.data)
+                if journal.needs_compaction():
+                    journal.compact(self.game_data.data)
+            except Exception as e:
+                print(f"Autosave failed: {e}")
+
+        self.schedule('autosave', self.AUTOSAVE_MS, self.autosave)
+
+    def start_status_refresh(self):
+        """Refresh the status bar on its own, slower timer"""
+        if not self.is_turbo_running():
+            self.update_status_display()
+        self.schedule('status_refresh', self.STATUS_REFRESH_MS, self.start_status_refresh)
 
-    def process_monthly_expenses(self):
-        """Process monthly expenses like rent"""
-        # Get current date
-        if 'game_time' in self.game_data.data:
-            current_date = self.game_data.data['game_time'].get('current_date', '1984-01-01')
-        else:
-            current_date = '1984-01-01'
+    def process_monthly_expenses(self, boundaries=None):
+        """
+        Process monthly expenses like rent
+
+        Args:
+            boundaries: Crossed boundaries from the scheduler (None when called directly)
+        """
+        # Current game date from the clock
+        current_date = self.time_system.get_iso_date()
 
         # Process expenses
         result, message = self.money_system.process_monthly_expenses(current_date)
@@ -687,6 +795,83 @@ class StudioRoomScreen(BaseRoom):
                 # Rent issue - show warning
                 messagebox.showwarning("Rent Due", message)
 
+    def toggle_turbo(self):
+        """Start a multi-year turbo simulation, or stop the one running"""
+        if self.is_turbo_running():
+            self.turbo.stop()
+            return
+
+        years = simpledialog.askinteger("Turbo", "Simulate how many years?",
+                                        parent=self.root, minvalue=1, maxvalue=20)
+        if not years:
+            return
+
+        self.turbo = TurboSimulation(self.game_data, self.money_system)
+        self.turbo.start(years=years)
+        self.turbo_button.config(text="⏹ Stop")
+        self.poll_turbo()
+
+    def poll_turbo(self):
+        """Repaint a few times per second while turbo runs, then hand time back to the clock"""
+        with self.turbo.lock:
+            self.update_status_display()
+        progress = self.turbo.get_progress()
+        self.time_label.config(text=f"{self.time_label.cget('text')}  [TURBO {progress['fraction']:.0%}]")
+
+        if self.turbo.is_running():
+            self.schedule('turbo', self.TURBO_REPAINT_MS, self.poll_turbo)
+            return
+        self.after_ids.pop('turbo', None)
+
+        # Don't count the turbo run as real time passed, then catch up month callbacks
+        self.time_system.last_update_time = time.time()
+        self.scheduler.sync()
+
+        self.finish_turbo()
+        self.turbo_button.config(text="⏭ Turbo")
+        self.update_status_display()
+
+        progress = self.turbo.get_progress()
+        summary = f"Simulated {progress['days_done']} days in {progress['seconds']:.1f} seconds."
+        if progress['messages']:
+            summary += f"\n\n{len(progress['messages'])} payment problems, latest:\n{progress['messages'][-1]}"
+        messagebox.showinfo("Turbo Complete", summary)
+
+    def finish_turbo(self):
+        """Record what a finished (or stopped) turbo run changed"""
+        # Turbo changed money and bills in place - journal them whole at the next autosave
+        if getattr(self.game_data, 'journal', None):
+            self.game_data.journal.mark_dirty('money', 'bills')
+        self.history.take()
+
+    def rewind_days(self):
+        """Roll the studio back to an earlier day from the snapshot history"""
+        if self.is_turbo_running():
+            return
+
+        snapshots = self.history.list_snapshots()
+        if len(snapshots) < 2:
+            messagebox.showinfo("Rewind", "No earlier days to rewind to yet.")
+            return
+
+        steps = simpledialog.askinteger(
+            "Rewind", f"Rewind how many days? (back to {snapshots[0]} at most)",
+            parent=self.root, minvalue=1, maxvalue=len(snapshots) - 1)
+        if not steps:
+            return
+
+        label = self.history.rewind(steps)
+
+        # The whole data was replaced - journal every section at the next autosave
+        if getattr(self.game_data, 'journal', None):
+            self.game_data.journal.mark_dirty(*self.game_data.data.keys())
+
+        # Don't count the dialog as real time passed, and move the scheduler to the restored date
+        self.time_system.last_update_time = time.time()
+        self.scheduler.sync()
+        self.update_status_display()
+        messagebox.showinfo("Rewind", f"Rewound to {label}.")
+
     def cycle_speed(self):
         """Cycle through speed presets"""
         # Speed presets: 1x, Quick Day, Quick Week, Quick Month, Quick Quarter, MAX
@@ -40,7 +40,8 @@ class DevelopmentStageWindow:
 
     def __init__(self, root, game_data, stage: DevelopmentStage, developer_name: str,
                  developer_stats: Optional[DeveloperStats] = None,
-                 on_complete: Optional[Callable] = None):
+                 on_complete: Optional[Callable] = None,
+                 rng_system=None, project: Optional[str] = None):
         self.root = root
         self.game_data = game_data
         self.stage = stage
@@ -52,11 +53,20 @@ class DevelopmentStageWindow:
         from systems.points_generation import BounceCalculator
         from systems.stage_scoring import StageScoreCalculator
 
+        from systems.rng_system import RNGSystem
+
+        # Seeded per-project streams so the project can be replayed from the save
+        self.rng_system = rng_system or RNGSystem(game_data)
+
         self.bounce_calculator = BounceCalculator()
-        self.max_bounces, self.bounce_details = self.bounce_calculator.calculate_bounces(self.developer_stats)
+        self.max_bounces, self.bounce_details = self.bounce_calculator.calculate_bounces(
+            self.developer_stats, self.rng_system.stream(RNGSystem.BOUNCES, project)
+        )
 
         # Pre-calculate all scores for this stage
-        self.score_calculator = StageScoreCalculator(game_data)
+        self.score_calculator = StageScoreCalculator(
+            game_data, self.rng_system.stream(RNGSystem.STAGE_SCORING, project)
+        )
 
         # Get current year
         current_year = 1984
@@ -302,7 +312,11 @@ class DevelopmentStageWindow:
 
         # Points generator for skill-based points
         from systems.points_generation import PointsGenerator
-        self.points_generator = PointsGenerator(self.game_data)
+        self.points_generator = PointsGenerator(
+            self.game_data,
+            self.rng_system.stream(RNGSystem.POINTS, project),
+            self.rng_system.stream(RNGSystem.EVENTS, project)
+        )
 
         self.setup_ui()
         self.start_animation()
@@ -667,11 +681,10 @@ class DevelopmentStageWindow:
         points = self.generate_stage_points()
 
         # Chance to generate bugs (including Planning stage!)
+        bug_change = self.score_calculator.roll_bounce_bugs(self.score_stage, self.stage_scores.bugs)
         if self.stage != DevelopmentStage.BUG_SQUASHING:
-            # Higher chance in Planning stage for more chaos
-            bug_chance = 0.20 if self.stage == DevelopmentStage.PLANNING else 0.15
-            if random.random() < bug_chance:
-                bugs_generated = random.randint(1, 3)
+            if bug_change > 0:
+                bugs_generated = bug_change
                 self.stage_scores.bugs += bugs_generated
                 points['bugs'] = bugs_generated
                 print(f"[DEBUG] BUGS GENERATED! {bugs_generated} bugs created on bounce {self.bounce_count}")
@@ -691,8 +704,8 @@ class DevelopmentStageWindow:
                 self.bug_label.config(text=f"Bugs: {self.stage_scores.bugs}")
         else:
             # Bug squashing removes bugs
-            if self.stage_scores.bugs > 0:
-                bugs_fixed = min(self.stage_scores.bugs, random.randint(2, 5))
+            if bug_change < 0:
+                bugs_fixed = -bug_change
                 self.stage_scores.bugs -= bugs_fixed
                 points['bugs'] = -bugs_fixed  # Negative to show removal
                 self.bug_label.config(text=f"Bugs: {self.stage_scores.bugs}")
@@ -726,48 +739,8 @@ class DevelopmentStageWindow:
             # Fallback if we somehow run out
             total_points = 2
 
-        # Ensure minimum of 2 points per bounce
-        total_points = max(2, total_points)
-
-        # Initialize all categories to 0
-        all_points = {
-            'gameplay': 0,
-            'technical': 0,
-            'graphics': 0,
-            'innovation': 0,
-            'sound_audio': 0,
-            'story': 0
-        }
-
-        # If we have 2 or fewer points, distribute them randomly
-        if total_points <= 2:
-            categories = list(all_points.keys())
-            if total_points == 1:
-                # Give 1 point to a random category
-                chosen = random.choice(categories)
-                all_points[chosen] = 1
-            else:  # total_points == 2
-                # Either give 2 to one category or 1 each to two categories
-                if random.random() < 0.5:
-                    # Give 2 points to one category
-                    chosen = random.choice(categories)
-                    all_points[chosen] = 2
-                else:
-                    # Give 1 point each to two different categories
-                    chosen_cats = random.sample(categories, 2)
-                    all_points[chosen_cats[0]] = 1
-                    all_points[chosen_cats[1]] = 1
-        else:
-            # Use the normal distribution for higher point values
-            points = self.score_calculator.distribute_points_to_categories(
-                total_points,
-                self.score_stage
-            )
-            # Update with actual points
-            for category, value in points.items():
-                all_points[category] = value
-
-        return all_points
+        # Spread the bounce's points over the categories (minimum 2 points per bounce)
+        return self.score_calculator.split_bounce_points(total_points, self.score_stage)
 
     def show_event_popup(self, event):
         """Show a popup for random events"""
@@ -1588,6 +1561,11 @@ class MultiStageDevelopment:
         self.game_topic = game_topic
         self.preloaded_adventure_data = preloaded_adventure_data
 
+        # Record this project's seed in the save so it can be replayed
+        from systems.rng_system import RNGSystem
+        self.rng_system = RNGSystem(game_data)
+        self.project = self.rng_system.new_project(game_name)
+
         # Total scores across all stages
         self.total_scores = StageScores()
 
@@ -1716,7 +1694,9 @@ class MultiStageDevelopment:
                 stage,
                 developer,
                 developer_stats=developer_stats,
-                on_complete=self.on_stage_complete
+                on_complete=self.on_stage_complete,
+                rng_system=self.rng_system,
+                project=self.project
             )
 
         start_btn = tk.Button(
@@ -1774,7 +1754,9 @@ class MultiStageDevelopment:
             DevelopmentStage.BUG_SQUASHING,
             developer_name,
             developer_stats=team_stats,
-            on_complete=self.on_stage_complete
+            on_complete=self.on_stage_complete,
+            rng_system=self.rng_system,
+            project=self.project
         )
 
     def skip_stage(self, window):
@@ -1836,6 +1818,7 @@ class MultiStageDevelopment:
         """Complete the development process and show results"""
         # Import here to avoid circular imports
         from systems.game_development import GameDevelopment, GameScore
+        from systems.rng_system import RNGSystem
 
         # Convert StageScores to GameScore
         final_score = GameScore(
@@ -1848,8 +1831,11 @@ class MultiStageDevelopment:
         )
 
         # Get rating
-        game_dev = GameDevelopment(self.game_data)
+        game_dev = GameDevelopment(
+            self.game_data, self.rng_system.stream(RNGSystem.GAME_DEVELOPMENT, self.project)
+        )
         rating = game_dev.get_game_rating(final_score)
+        self.rng_system.release_project(self.project)
         description = game_dev.get_rating_description(rating)
 
         # Show results window
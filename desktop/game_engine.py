@@ -636,6 +636,8 @@ class GameEngineWindow:
             'date': self.game_data.data.get('game_time', {}).get('current_date', 'Unknown')
         }
         self.game_data.data['game_history'].append(game_record)
+        if getattr(self.game_data, 'journal', None):
+            self.game_data.journal.record_append(['game_history'], game_record)
 
         # Check for unlocks
         unlocks = self.unlock_system.check_game_creation_unlocks(game_name, self.selected_topic, self.selected_type)
@@ -3,12 +3,14 @@ Game Rating System
 Handles all game review scores and ratings throughout different eras
 """
 
+import math
 import random
 from datetime import datetime
 
 class GameRatingSystem:
-    def __init__(self, game_data):
+    def __init__(self, game_data, rng=None):
         self.game_data = game_data
+        self.rng = rng or random  # random.Random stream (see RNGSystem), or the global module
 
         # Rating categories with weights and visibility rules
         # Note: Random/X-Factor and Studio Reputation are applied AFTER the total calculation
@@ -67,6 +69,9 @@ class GameRatingSystem:
         self.random_factor = {
             'name': 'X-Factor',
             'range': (-15, 15),  # Can adjust final score by -15 to +15 points
+            'percentile_mean': 50,  # Luck percentile is drawn from a bell curve
+            'percentile_std_dev': 20,
+            'perfect_percentile': 85,  # Below this percentile the final score caps at 99
             'visible': False,
             'description': 'Unpredictable market reception and timing'
         }
@@ -301,15 +306,20 @@ class GameRatingSystem:
         """
         # Generate a normal distribution (bell curve) value
         # Mean = 50th percentile, std dev chosen for good spread
-        import numpy as np
-
-        # Generate percentile (0-100)
-        percentile = np.random.normal(50, 20)  # Mean 50, std dev 20
+        percentile = self.rng.gauss(self.random_factor['percentile_mean'],
+                                    self.random_factor['percentile_std_dev'])  # Mean 50, std dev 20
         percentile = max(0, min(100, percentile))  # Clamp to 0-100
 
         # Store percentile for reference
         self.last_random_percentile = percentile
 
+        return self.percentile_to_modifier(percentile)
+
+    def percentile_to_modifier(self, percentile):
+        """
+        Convert an X-Factor percentile (0-100) to the score modifier (-15 to +15)
+        Includes the year's market volatility
+        """
         # Convert percentile to modifier range (-15 to +15)
         if percentile < 15:  # Bottom 15% - very bad luck
             modifier = -15 + (percentile / 15) * 5  # -15 to -10
@@ -414,13 +424,13 @@ class GameRatingSystem:
             else:
                 rep_data['score'] = min(5, rep_data['score'] + 0.1)
 
-    def calculate_overall_rating(self, game_specs):
+    def calculate_base_rating(self, game_specs):
         """
-        Calculate the overall game rating combining all factors
-        Returns both the final score and component breakdown
-        """
-        current_year = self.game_data.data['time'].get('year', 1978)
+        Calculate the deterministic part of the rating (categories and bug penalty)
 
+        Returns:
+            (scores, rating_after_bugs, bugs, critical_bugs, total_bug_penalty)
+        """
         # Calculate individual scores (only base categories, not modifiers)
         gameplay_score = self.calculate_gameplay_score(game_specs)
         technical_score = self.calculate_technical_score(game_specs)
@@ -429,10 +439,6 @@ class GameRatingSystem:
         sound_score = self.calculate_sound_score(game_specs)
         story_score = self.calculate_story_score(game_specs)
 
-        # Check visibility for studio reputation modifier
-        if current_year >= self.reputation_modifier['visible_after_year']:
-            self.reputation_modifier['visible'] = True
-
         # Calculate weighted average
         total_weight = 0
         weighted_sum = 0
@@ -471,6 +477,21 @@ class GameRatingSystem:
         # Apply bug penalty
         rating_after_bugs = max(0, overall_rating - total_bug_penalty)
 
+        return scores, rating_after_bugs, bugs, critical_bugs, total_bug_penalty
+
+    def calculate_overall_rating(self, game_specs):
+        """
+        Calculate the overall game rating combining all factors
+        Returns both the final score and component breakdown
+        """
+        current_year = self.game_data.data['time'].get('year', 1978)
+
+        # Check visibility for studio reputation modifier
+        if current_year >= self.reputation_modifier['visible_after_year']:
+            self.reputation_modifier['visible'] = True
+
+        scores, rating_after_bugs, bugs, critical_bugs, total_bug_penalty = self.calculate_base_rating(game_specs)
+
         # Apply post-calculation modifiers
         random_modifier = self.calculate_random_modifier()
         reputation_modifier = self.calculate_reputation_modifier()
@@ -480,7 +501,7 @@ class GameRatingSystem:
 
         # CRITICAL: If random percentile is below 85%, cap at 99%
         # Only games with 85th percentile or higher random factor can achieve 100%
-        if hasattr(self, 'last_random_percentile') and self.last_random_percentile < 85:
+        if hasattr(self, 'last_random_percentile') and self.last_random_percentile < self.random_factor['perfect_percentile']:
             final_rating = min(99, final_rating_raw)
         else:
             final_rating = min(100, final_rating_raw)  # Can reach 100% with good luck
@@ -516,7 +537,7 @@ class GameRatingSystem:
                 'random_percentile': round(self.last_random_percentile, 1) if hasattr(self, 'last_random_percentile') else 50,
                 'reputation_modifier': round(reputation_modifier, 1),
                 'raw_final_score': round(final_rating_raw, 1),  # Can be >100
-                'capped_at_99': self.last_random_percentile < 85 if hasattr(self, 'last_random_percentile') else False
+                'capped_at_99': self.last_random_percentile < self.random_factor['perfect_percentile'] if hasattr(self, 'last_random_percentile') else False
             },
             'base_score_before_modifiers': round(rating_after_bugs, 1),
             'reputation_visible': self.reputation_modifier['visible'],
@@ -524,6 +545,107 @@ class GameRatingSystem:
             'year': current_year
         }
 
+    def final_rating_for_percentile(self, rating_after_bugs, percentile, reputation_modifier):
+        """Final rating for a given X-Factor percentile (same rules as calculate_overall_rating)"""
+        final_rating_raw = rating_after_bugs + self.percentile_to_modifier(percentile) + reputation_modifier
+        if percentile < self.random_factor['perfect_percentile']:
+            return min(99, final_rating_raw)
+        return min(100, final_rating_raw)
+
+    def get_rating_distribution(self, game_specs):
+        """
+        Exact probability distribution of the final rating, without sampling
+        Categories, bugs and reputation are fixed for a given game, so the only
+        random input is the X-Factor percentile; the final rating never decreases
+        as the percentile rises, so each probability comes from inverting it
+        against the percentile's bell curve.
+        Does not touch studio reputation.
+
+        Returns:
+            Dict with expected rating, chances per description band, the chance of
+            a perfect 100 and of the 99 cap, and a per-point histogram
+        """
+        _, rating_after_bugs, _, _, _ = self.calculate_base_rating(game_specs)
+        reputation_modifier = self.calculate_reputation_modifier()
+
+        mean = self.random_factor['percentile_mean']
+        std_dev = self.random_factor['percentile_std_dev']
+        perfect_percentile = self.random_factor['perfect_percentile']
+
+        def rating_at(percentile):
+            return self.final_rating_for_percentile(rating_after_bugs, percentile, reputation_modifier)
+
+        def normal_cdf(percentile):
+            return 0.5 * (1 + math.erf((percentile - mean) / (std_dev * math.sqrt(2))))
+
+        def chance_below(rating):
+            """P(final rating < rating)"""
+            if rating_at(100) < rating:
+                return 1.0
+            if rating_at(0) >= rating:
+                return 0.0
+
+            # Smallest percentile reaching the rating (percentile is clamped to 0-100)
+            low, high = 0.0, 100.0
+            for _ in range(50):
+                middle = (low + high) / 2
+                if rating_at(middle) >= rating:
+                    high = middle
+                else:
+                    low = middle
+            return normal_cdf(high)
+
+        def expected_between(start, end, steps=200):
+            """Simpson's rule for the rating weighted by the bell curve"""
+            step = (end - start) / steps
+            density_scale = 1 / (std_dev * math.sqrt(2 * math.pi))
+            total = 0.0
+            for index in range(steps + 1):
+                percentile = start + index * step
+                weight = 1 if index in (0, steps) else (4 if index % 2 else 2)
+                density = density_scale * math.exp(-0.5 * ((percentile - mean) / std_dev) ** 2)
+                total += weight * rating_at(percentile) * density
+            return total * step / 3
+
+        lowest = rating_at(0)
+        highest = rating_at(100)
+
+        # Expected rating: clamped tails plus the curve, split at the cap jump
+        expected = normal_cdf(0) * lowest + (1 - normal_cdf(100)) * highest
+        expected += expected_between(0, perfect_percentile)
+        expected += expected_between(perfect_percentile, 100)
+
+        # Chance of landing in each description band
+        bands = [(90, 'Masterpiece'), (80, 'Excellent'), (70, 'Good'), (60, 'Above Average'),
+                 (50, 'Average'), (40, 'Below Average'), (30, 'Poor'), (20, 'Bad')]
+        description_chances = {}
+        upper_chance = 1.0
+        for threshold, description in bands:
+            below = chance_below(threshold)
+            description_chances[description] = upper_chance - below
+            upper_chance = below
+        description_chances['Terrible'] = upper_chance
+
+        # Chance of each whole-point score (as shown, e.g. "87%")
+        histogram = {}
+        for score in range(math.floor(lowest), math.floor(highest) + 1):
+            chance = chance_below(score + 1) - chance_below(score)
+            if chance > 0:
+                histogram[score] = chance
+
+        return {
+            'base_score': round(rating_after_bugs, 1),
+            'reputation_modifier': round(reputation_modifier, 1),
+            'expected_rating': expected,
+            'lowest_rating': lowest,
+            'highest_rating': highest,
+            'masterpiece_chance': description_chances['Masterpiece'],
+            'perfect_chance': 1 - chance_below(100),
+            'capped_at_99_chance': normal_cdf(perfect_percentile),
+            'description_chances': description_chances,
+            'histogram': histogram
+        }
+
     def get_letter_grade(self, score):
         """Get letter grade for score (0-100)"""
         if score >= 97: return 'A+'
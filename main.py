@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import yaml
+import glob
+import json
 import os
+import re
 import argparse
 from datetime import datetime
 from pathlib import Path
@@ -10,59 +12,201 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from deepseek.services.naming import get_random_studio_names, get_random_player_names, get_competitor_companies, get_default_competitor_companies
 from buildings.studio_room import StudioRoomScreen
 from systems.dev_menu import DevMenu
+from systems.game_state import wrap_state
+from systems.money_system import MoneySystem
+from systems.save_formats import DEFAULT_FORMAT, get_format, load_save, save_extensions
+from systems.save_journal import SaveJournal
+from systems.save_writer import SaveWriter
 
 class SaveManager:
+    # Sidecar with each save's header, so listing saves doesn't parse them
+    INDEX_FILE = ".save_index"
+
     def __init__(self):
         self.save_dir = Path("saves")
         self.save_dir.mkdir(exist_ok=True)
+        self.index_path = self.save_dir / self.INDEX_FILE
+
+        # New saves are written in the fast format; older formats still load
+        self.save_format = get_format(DEFAULT_FORMAT)
+
+    def save_files(self):
+        """Every save file, the newest one when a save exists in more than one format"""
+        newest = {}
+        for extension in save_extensions():
+            for file in self.save_dir.glob(f"*{extension}"):
+                if file.stem not in newest or file.stat().st_mtime_ns > newest[file.stem].stat().st_mtime_ns:
+                    newest[file.stem] = file
+        return list(newest.values())
+
+    def journal_path(self, filename, base_id):
+        """Path of the change journal continuing one full save (named by its journal_base)"""
+        return self.save_dir / f"{filename}.{base_id}{SaveJournal.EXTENSION}"
+
+    def journal_paths(self, filename):
+        """Every journal file kept beside a save (only its own - "Studio" doesn't match "Studio.v2")"""
+        pattern = re.compile(re.escape(filename) + r'\.(?:[0-9a-f]{32}|None)' + re.escape(SaveJournal.EXTENSION))
+        return [path for path in self.save_dir.glob(f"{glob.escape(filename)}.*{SaveJournal.EXTENSION}")
+                if pattern.fullmatch(path.name)]
+
+    def get_save_path(self, filename):
+        """Path of a save by name, in whichever format it was written"""
+        for file in self.save_files():
+            if file.stem == filename:
+                return file
+        return None
+
+    @staticmethod
+    def read_header(data):
+        """Pull the fields the Load menu shows out of full save data"""
+        return {
+            'studio_name': data.get('player_data', {}).get('studio_name', 'Unknown Studio'),
+            'last_played': data.get('game_metadata', {}).get('last_played', 'Unknown'),
+            'playtime': data.get('game_metadata', {}).get('playtime_hours', 0)
+        }
+
+    def load_index(self):
+        """Load the header index ({filename: header + mtime_ns + size})"""
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def write_index(self, index):
+        """Write the header index (via a temp file, so a crash can't leave it half written)"""
+        temp_path = self.index_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(index, f, indent=2)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"Error writing save index: {e}")
+
+    def index_entry(self, file, header):
+        """Header plus the file stamp that proves it's still current"""
+        stat = file.stat()
+        return dict(header, path=file.name, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
 
     def list_saves(self):
         """Return list of available save files"""
+        index = self.load_index()
+        changed = False
+
         save_files = []
-        for file in self.save_dir.glob("*.yaml"):
+        live = set()
+        for file in self.save_files():
+            live.add(file.stem)
             try:
-                with open(file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    save_info = {
-                        'filename': file.stem,
-                        'path': str(file),
-                        'studio_name': data.get('player_data', {}).get('studio_name', 'Unknown Studio'),
-                        'last_played': data.get('game_metadata', {}).get('last_played', 'Unknown'),
-                        'playtime': data.get('game_metadata', {}).get('playtime_hours', 0)
-                    }
-                    save_files.append(save_info)
+                # Only parse saves whose stamp doesn't match the index
+                stat = file.stat()
+                entry = index.get(file.stem)
+                if (not entry or entry.get('path') != file.name or
+                        entry.get('mtime_ns') != stat.st_mtime_ns or entry.get('size') != stat.st_size):
+                    data = load_save(file)
+                    entry = self.index_entry(file, self.read_header(data))
+                    index[file.stem] = entry
+                    changed = True
+
+                save_info = {
+                    'filename': file.stem,
+                    'path': str(file),
+                    'studio_name': entry['studio_name'],
+                    'last_played': entry['last_played'],
+                    'playtime': entry['playtime']
+                }
+                save_files.append(save_info)
             except Exception as e:
                 print(f"Error reading save file {file}: {e}")
+
+        # Forget saves that were deleted
+        for filename in [filename for filename in index if filename not in live]:
+            del index[filename]
+            changed = True
+
+        if changed:
+            self.write_index(index)
         return save_files
 
     def load_game(self, filename):
         """Load game data from save file"""
-        save_path = self.save_dir / f"{filename}.yaml"
+        save_path = self.get_save_path(filename)
         try:
-            with open(save_path, 'r') as f:
-                return yaml.safe_load(f)
+            if save_path is None:
+                raise FileNotFoundError(f"No save named '{filename}'")
+            # Format is detected from the file
+            data = load_save(save_path)
+
+            # Bring back changes autosaved after the last full save
+            base_id = data.get('game_metadata', {}).get('journal_base')
+            replayed = SaveJournal.replay(self.journal_path(filename, base_id), data)
+            if replayed:
+                print(f"Recovered {replayed} autosaved changes for {filename}")
+            return data
         except Exception as e:
             raise Exception(f"Failed to load save file: {e}")
 
+    def prepare_save(self, game_data):
+        """Stamp the metadata of a save about to be written (on the live data, before any snapshot)"""
+        game_data['game_metadata']['last_played'] = datetime.now().isoformat()
+        # Expired transactions are otherwise only dropped in batches - keep them out of the file
+        if 'money' in game_data:
+            MoneySystem.trim_expired(game_data)
+        # New journal base - journals of older saves no longer apply
+        game_data['game_metadata']['journal_base'] = SaveJournal.new_base_id()
+
+    def write_save(self, filename, game_data, on_progress=None):
+        """
+        Write prepared game data to the save file, atomically
+
+        Args:
+            filename: Save name
+            game_data: Data stamped by prepare_save (may be a snapshot)
+            on_progress: Optional callback(fraction, message)
+        """
+        save_path = self.save_dir / f"{filename}{self.save_format.extension}"
+        progress = on_progress or (lambda fraction, message: None)
+
+        progress(0.1, "Writing save...")
+        self.save_format.dump_atomic(game_data, save_path)
+
+        # Everything in older journals is in the full save now
+        progress(0.8, "Cleaning up...")
+        current_journal = self.journal_path(filename, game_data['game_metadata']['journal_base'])
+        for journal_path in self.journal_paths(filename):
+            if journal_path != current_journal:
+                journal_path.unlink(missing_ok=True)
+
+        # The same save in an older format is now out of date
+        for extension in save_extensions():
+            old_path = save_path.with_suffix(extension)
+            if old_path != save_path and old_path.exists():
+                old_path.unlink()
+
+        # Keep the Load menu's index current without re-reading the file
+        index = self.load_index()
+        index[save_path.stem] = self.index_entry(save_path, self.read_header(game_data))
+        self.write_index(index)
+        progress(1.0, "Saved")
+
     def save_game(self, filename, game_data):
         """Save game data to file"""
-        save_path = self.save_dir / f"{filename}.yaml"
         try:
-            # Update metadata
-            game_data['game_metadata']['last_played'] = datetime.now().isoformat()
-
-            with open(save_path, 'w') as f:
-                yaml.dump(game_data, f, default_flow_style=False, indent=2)
+            self.prepare_save(game_data)
+            self.write_save(filename, game_data)
             return True
         except Exception as e:
             raise Exception(f"Failed to save game: {e}")
 
 class GameData:
     def __init__(self):
+        self.journal = None  # SaveJournal for autosave, once the game has a save name
         self.reset_to_defaults()
 
     def reset_to_defaults(self):
         """Initialize with default game data"""
+        self.history = None  # StateHistory for rewinding, created by the studio room
         self.data = {
             'game_metadata': {
                 'version': '1.0.0',
@@ -107,10 +251,12 @@ class GameData:
                 'tutorial_completed': False
             }
         }
+        wrap_state(self.data)
 
     def load_from_dict(self, data):
-        """Load game data from dictionary"""
-        self.data = data
+        """Load game data from dictionary (time, money, player and employees become typed records)"""
+        self.data = wrap_state(data)
+        self.history = None
 
     def get(self, *keys):
         """Get nested value from data"""
@@ -128,6 +274,21 @@ class GameData:
             current = current[key]
         current[keys[-1]] = value
 
+        if self.journal:
+            self.journal.record_set(keys, value)
+
+    def append(self, value, *keys):
+        """Append to a nested list in data (created if missing)"""
+        current = self.data
+        for key in keys[:-1]:
+            if key not in current:
+                current[key] = {}
+            current = current[key]
+        current.setdefault(keys[-1], []).append(value)
+
+        if self.journal:
+            self.journal.record_append(keys, value)
+
 class StartMenu:
     def __init__(self, parent, on_new_game, on_load_game, on_options, on_quit, on_quick_start=None):
         self.parent = parent
@@ -265,8 +426,10 @@ class LoadGameMenu:
 
         if messagebox.askyesno("Confirm Delete", f"Delete save file '{filename}'?"):
             try:
-                save_path = self.save_manager.save_dir / f"{filename}.yaml"
+                save_path = self.save_manager.get_save_path(filename)
                 save_path.unlink()
+                for journal_path in self.save_manager.journal_paths(filename):
+                    journal_path.unlink()
                 self.refresh_saves()
                 messagebox.showinfo("Deleted", "Save file deleted successfully.")
             except Exception as e:
@@ -799,10 +962,12 @@ class GameDevStudioApp:
 
         # Initialize managers and data
         self.save_manager = SaveManager()
+        self.save_writer = SaveWriter(self.save_manager)
         self.game_data = GameData()
 
         # Initialize UI components
         self.current_screen = None
+        self.studio_room = None
         self.start_menu = StartMenu(self.root,
                                   self.show_new_game_screen,
                                   self.show_load_menu,
@@ -867,8 +1032,15 @@ class GameDevStudioApp:
         """Show options menu"""
         messagebox.showinfo("Options", "Options menu coming soon!")
 
+    def close_studio_room(self):
+        """Stop the studio room's timers once it's no longer shown"""
+        if self.studio_room is not None:
+            self.studio_room.close()
+            self.studio_room = None
+
     def clear_screen(self):
         """Clear all widgets from the main window"""
+        self.close_studio_room()
         for widget in self.root.winfo_children():
             widget.destroy()
 
@@ -913,6 +1085,7 @@ class GameDevStudioApp:
         progress_label.config(text="✓ Initializing game data...")
         self.root.update()
         self.game_data.reset_to_defaults()
+        self.game_data.journal = None  # No save name yet
         self.game_data.set(studio_name, 'player_data', 'studio_name')
         self.game_data.set(player_name, 'player_data', 'player_name')
         self.game_data.set("Normal", 'settings', 'difficulty')
@@ -993,17 +1166,29 @@ class GameDevStudioApp:
 
     def load_game(self, filename):
         """Load a game from save file"""
+        # A turbo run still changing the old game data has to finish first, and so does a save being written
+        self.close_studio_room()
+        self.save_writer.wait()
         try:
             save_data = self.save_manager.load_game(filename)
             self.game_data.load_from_dict(save_data)
+            self.attach_journal(filename)
             self.show_main_game()
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load game: {str(e)}")
 
+    def attach_journal(self, filename):
+        """Autosave changes to this save's journal from now on"""
+        base_id = self.game_data.data.get('game_metadata', {}).get('journal_base')
+        self.game_data.journal = SaveJournal(self.save_manager, filename, base_id, self.save_writer)
+
     def save_current_game(self):
         """Save the current game"""
         if self.current_screen != "game":
             return
+        if self.studio_room is not None and self.studio_room.is_turbo_running():
+            messagebox.showwarning("Save Game", "Stop the turbo simulation before saving.")
+            return
 
         # Show save dialog
         dialog = tk.Toplevel(self.root)
@@ -1016,13 +1201,42 @@ class GameDevStudioApp:
         save_name_var = tk.StringVar(value=self.game_data.get('player_data', 'studio_name'))
         ttk.Entry(dialog, textvariable=save_name_var, width=30).pack(pady=5)
 
+        progress_label = ttk.Label(dialog, text="")
+
+        def poll_save():
+            """Follow the background write, then report it"""
+            if self.save_writer.is_busy():
+                progress = self.save_writer.get_progress()
+                progress_label.config(text=f"{progress['message']} {progress['fraction']:.0%}")
+                dialog.after(100, poll_save)
+                return
+
+            error = self.save_writer.get_progress()['error']
+            # Autosave continues in the new save's journal only once the save is on disk
+            if self.game_data.journal:
+                self.game_data.journal.settle(self.game_data.data)
+            elif not error:
+                self.attach_journal(save_name_var.get())
+            dialog.destroy()
+            if error:
+                messagebox.showerror("Save Error", f"Failed to save game: {error}")
+            else:
+                messagebox.showinfo("Saved", "Game saved successfully!")
+
         def do_save():
             try:
-                self.save_manager.save_game(save_name_var.get(), self.game_data.data)
-                dialog.destroy()
-                messagebox.showinfo("Saved", "Game saved successfully!")
+                # Snapshot now, serialize and write on the writer thread
+                if self.game_data.journal:
+                    self.game_data.journal.save_full(self.game_data.data, save_name_var.get())
+                else:
+                    self.save_writer.save(save_name_var.get(), self.game_data.data)
             except Exception as e:
                 messagebox.showerror("Save Error", f"Failed to save game: {str(e)}")
+                return
+
+            button_frame.pack_forget()
+            progress_label.pack(pady=20)
+            poll_save()
 
         button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=20)
@@ -1033,6 +1247,8 @@ class GameDevStudioApp:
     def quit_game(self):
         """Quit the application"""
         if messagebox.askyesno("Quit", "Are you sure you want to quit?"):
+            # Let a save in progress finish first
+            self.save_writer.wait()
             self.root.quit()
 
     def apply_dev_args(self, args):
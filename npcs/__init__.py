@@ -5,12 +5,15 @@ Contains all NPC-related data and generation systems for the game
 
 from .npc_database import (
     NPCGenerator,
+    BulkNPCGenerator,
     generate_all_npcs,
     FIRST_NAMES,
     LAST_NAMES,
     COMPANY_NAMES
 )
 
+from .roster_cache import RosterCache
+
 from .game_names_database import (
     get_names_for_year,
     get_all_period_names,
@@ -20,7 +23,9 @@ from .game_names_database import (
 
 __all__ = [
     'NPCGenerator',
+    'BulkNPCGenerator',
     'generate_all_npcs',
+    'RosterCache',
     'get_names_for_year',
     'get_all_period_names',
     'get_total_names',
@@ -3,11 +3,15 @@ NPC Database and Generator
 Contains name lists and NPC generation logic
 """
 
+import json
+from json.encoder import encode_basestring_ascii
 import random
-import yaml
+import string
 import os
 from pathlib import Path
 
+from npcs.roster_cache import RosterCache
+
 # Company names for game industry
 COMPANY_NAMES = [
     "Vertex Studios", "Pixel Forge", "Binary Dreams", "Quantum Games", "Atlas Interactive",
@@ -85,23 +89,120 @@ LAST_NAMES = [
     "Richmond", "Mckay", "Marks"
 ]
 
+class IndexPermutation:
+    """
+    A shuffled order of range(size), computed one position at a time
+    A small Feistel network over the next even power of two, walking past values >= size,
+    so nothing the size of the name space is ever built or shuffled
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, size, rng):
+        """
+        Args:
+            size: Number of values to permute
+            rng: random.Random used to pick this permutation's round keys
+        """
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        bits += bits % 2
+        self.half_bits = bits // 2
+        self.mask = (1 << self.half_bits) - 1
+        self.keys = [rng.getrandbits(32) for _ in range(self.ROUNDS)]
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, position):
+        """Value at a position of the permutation (position in range(size))"""
+        half_bits, mask, keys = self.half_bits, self.mask, self.keys
+        value = position
+        while True:
+            left, right = value >> half_bits, value & mask
+            for key in keys:
+                left, right = right, left ^ ((((right ^ key) * 0x9E3779B1) >> 7) & mask)
+            value = (left << half_bits) | right
+            # Values outside the range walk on until they land inside it (a bijection on range(size))
+            if value < self.size:
+                return value
+
+
+class NameSpace:
+    """
+    Every first x last name pair in a lazily shuffled order
+    Once all pairs are used, further passes add a middle initial ("Mary J. Brown")
+    """
+
+    MIDDLE_INITIALS = string.ascii_uppercase
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: random.Random to shuffle with (a new unseeded one if not given)
+        """
+        self.rng = rng or random.Random()
+        self.first_names = [(name, gender) for gender in ("male", "female") for name in FIRST_NAMES[gender]]
+        self.last_names = list(dict.fromkeys(LAST_NAMES))
+        self.pairs = len(self.first_names) * len(self.last_names)
+        self.capacity = self.pairs * (1 + len(self.MIDDLE_INITIALS))
+
+        self.drawn = 0
+        self.permutation = None
+
+    def next_name(self):
+        """
+        The next unused name
+
+        Returns:
+            (full name, gender)
+
+        Raises:
+            ValueError: When every name (with every middle initial) has been used
+        """
+        if self.drawn >= self.capacity:
+            raise ValueError(f"All {self.capacity} NPC names are used")
+
+        name_pass, position = divmod(self.drawn, self.pairs)
+        if position == 0:
+            # Each pass goes through the pairs in a new order
+            self.permutation = IndexPermutation(self.pairs, self.rng)
+        self.drawn += 1
+
+        first_index, last_index = divmod(self.permutation[position], len(self.last_names))
+        first_name, gender = self.first_names[first_index]
+        last_name = self.last_names[last_index]
+        if name_pass == 0:
+            return f"{first_name} {last_name}", gender
+        return f"{first_name} {self.MIDDLE_INITIALS[name_pass - 1]}. {last_name}", gender
+
+
+def load_jobs(jobs_file=Path("npcs/jobs")):
+    """Load jobs from the jobs file (one per line)"""
+    jobs_file = Path(jobs_file)
+    if jobs_file.exists():
+        with open(jobs_file, 'r') as f:
+            return [line.strip() for line in f.readlines() if line.strip()]
+    return []
+
+
 class NPCGenerator:
     """Generator for creating random NPCs"""
 
     def __init__(self):
         self.used_names = set()
         self.npc_data_path = Path("npcs/npcslist")
+        self.name_space = None  # Created on first use
+        self._jobs = None
 
     def generate_npc(self, npc_id):
         """Generate a random NPC with unique name"""
-        gender = random.choice(["male", "female"])
+        if self.name_space is None:
+            self.name_space = NameSpace()
 
-        # Keep trying until we get a unique name
+        # Draw from the shuffled name space - only names already taken elsewhere are skipped
         while True:
-            first_name = random.choice(FIRST_NAMES[gender])
-            last_name = random.choice(LAST_NAMES)
-            full_name = f"{first_name} {last_name}"
-
+            full_name, gender = self.name_space.next_name()
             if full_name not in self.used_names:
                 self.used_names.add(full_name)
                 break
@@ -118,32 +219,87 @@ class NPCGenerator:
         }
 
     def load_jobs(self):
-        """Load jobs from the jobs file"""
-        jobs_file = Path("npcs/jobs")
-        if jobs_file.exists():
-            with open(jobs_file, 'r') as f:
-                return [line.strip() for line in f.readlines() if line.strip()]
-        return []
+        """Load jobs from the jobs file (read once per generator)"""
+        if self._jobs is None:
+            self._jobs = load_jobs()
+        return self._jobs
 
     def load_existing_npcs(self):
-        """Load NPCs from yaml files in npcslist directory"""
-        npcs = []
-        if self.npc_data_path.exists():
-            for yaml_file in self.npc_data_path.glob("*.yml"):
-                try:
-                    with open(yaml_file, 'r') as f:
-                        data = yaml.safe_load(f)
-                        if data and 'character' in data:
-                            char = data['character']
-                            npcs.append({
-                                "id": char.get('id'),
-                                "name": char.get('name'),
-                                "gender": char.get('gender'),
-                                "job": char.get('job')
-                            })
-                except Exception as e:
-                    print(f"Error loading {yaml_file}: {e}")
-        return npcs
+        """Load NPCs from yaml files in npcslist directory (through the compiled roster cache)"""
+        return RosterCache(self.npc_data_path).load()
+
+
+class BulkNPCGenerator:
+    """Generates large numbers of unique NPCs quickly, for big worlds and stress tests"""
+
+    def __init__(self, seed=None, jobs=None, taken_names=()):
+        """
+        Args:
+            seed: Seed for names, genders and jobs (same seed, same NPCs)
+            jobs: Job list (loaded once from npcs/jobs if not given)
+            taken_names: Names already in use (e.g. the existing roster) - never generated
+        """
+        self.rng = random.Random(seed)
+        self.name_space = NameSpace(self.rng)
+        self.jobs = list(jobs) if jobs is not None else load_jobs()
+        self.taken_names = set(taken_names)
+
+    def generate(self, count, start_id=1):
+        """
+        Yield `count` NPC dicts with consecutive ids
+
+        Raises:
+            ValueError: If the name space runs out first
+        """
+        next_name = self.name_space.next_name
+        taken = self.taken_names
+        jobs = self.jobs or ["Game Developer"]
+        choice = self.rng.choice
+
+        for npc_id in range(start_id, start_id + count):
+            full_name, gender = next_name()
+            while full_name in taken:
+                full_name, gender = next_name()
+            yield {"id": npc_id, "name": full_name, "gender": gender, "job": choice(jobs)}
+
+    def write_jsonl(self, path, count, start_id=1, batch_size=10000):
+        """
+        Stream NPCs to a JSON lines file without holding them all in memory
+
+        Args:
+            path: Output file (one NPC object per line)
+            count: Number of NPCs
+            start_id: Id of the first NPC
+            batch_size: NPCs per write
+
+        Returns:
+            Number of NPCs written
+        """
+        # Lines are formatted directly - same output as compact json.dumps, several times faster
+        quote = encode_basestring_ascii
+        written = 0
+        batch = []
+        with open(path, 'w', encoding='utf-8') as f:
+            for npc in self.generate(count, start_id):
+                batch.append(f'{{"id":{npc["id"]},"name":{quote(npc["name"])},'
+                             f'"gender":{quote(npc["gender"])},"job":{quote(npc["job"])}}}')
+                if len(batch) >= batch_size:
+                    f.write('\n'.join(batch) + '\n')
+                    written += len(batch)
+                    batch = []
+            if batch:
+                f.write('\n'.join(batch) + '\n')
+                written += len(batch)
+        return written
+
+
+def read_npcs_jsonl(path):
+    """Yield the NPCs of a file written by BulkNPCGenerator.write_jsonl"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
 
 def generate_all_npcs(count=200):
     """Generate a list of NPCs"""
@@ -158,4 +314,22 @@ def generate_all_npcs(count=200):
     npcs = []
     for i in range(1, count + 1):
         npcs.append(generator.generate_npc(i))
-    return npcs
\ No newline at end of file
+    return npcs
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    generator = BulkNPCGenerator(seed=42)
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = Path(work_dir) / "npcs.jsonl"
+        start = time.perf_counter()
+        written = generator.write_jsonl(path, 100000)
+        elapsed = time.perf_counter() - start
+
+        names = {npc["name"] for npc in read_npcs_jsonl(path)}
+        print(f"Wrote {written} NPCs in {elapsed:.2f}s ({path.stat().st_size / 1024 / 1024:.1f} MB), "
+              f"unique names: {len(names) == written}")
+        print(f"Name space: {generator.name_space.capacity} names")
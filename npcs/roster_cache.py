@@ -0,0 +1,184 @@
+"""
+NPC Roster Cache
+Compiles the npcs/npcslist YAML files into one SQLite file, re-parsing only the files that changed
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import yaml
+
+# libyaml is much faster when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class RosterCache:
+    """
+    One row per NPC file, stamped with the file's mtime and size
+    Loading stats the directory and parses only new or changed files; deleted files drop out
+    """
+
+    # Bump when the rows change shape - the cache is then rebuilt from scratch
+    SCHEMA_VERSION = 2
+    CACHE_FILE = ".roster_cache.sqlite"
+
+    def __init__(self, npc_dir="npcs/npcslist", cache_path=None):
+        """
+        Args:
+            npc_dir: Directory of NPC .yml files
+            cache_path: SQLite file (defaults to .roster_cache.sqlite inside npc_dir)
+        """
+        self.npc_dir = Path(npc_dir)
+        self.cache_path = Path(cache_path) if cache_path else self.npc_dir / self.CACHE_FILE
+        self.last_parsed = 0  # Files parsed by the last load (0 when everything came from the cache)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.cache_path)
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS npcs")
+            connection.execute("""
+                CREATE TABLE npcs (
+                    file TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    id INTEGER,
+                    name TEXT,
+                    gender TEXT,
+                    job TEXT,
+                    has_character INTEGER NOT NULL
+                )
+            """)
+            connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            connection.commit()
+        return connection
+
+    def _scan(self):
+        """{file name: (mtime_ns, size)} of every .yml in the directory"""
+        stamps = {}
+        with os.scandir(self.npc_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.yml') and entry.is_file():
+                    stat = entry.stat()
+                    stamps[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    @staticmethod
+    def parse_file(path):
+        """
+        Read one NPC file
+
+        Returns:
+            The 'character' dict, or None if the file has none
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=YAML_LOADER)
+        if data and 'character' in data:
+            return data['character']
+        return None
+
+    def refresh(self, connection):
+        """Bring the cache in line with the directory - parse new and changed files, forget deleted ones"""
+        stamps = self._scan()
+        cached = {file: (mtime_ns, size)
+                  for file, mtime_ns, size in connection.execute("SELECT file, mtime_ns, size FROM npcs")}
+
+        parsed = 0
+        with connection:
+            for file in cached.keys() - stamps.keys():
+                connection.execute("DELETE FROM npcs WHERE file = ?", (file,))
+
+            for file, stamp in stamps.items():
+                if cached.get(file) == stamp:
+                    continue
+                try:
+                    character = self.parse_file(self.npc_dir / file)
+                except Exception as e:
+                    # Not cached, so the file is tried again once it's fixed
+                    print(f"Error loading {self.npc_dir / file}: {e}")
+                    connection.execute("DELETE FROM npcs WHERE file = ?", (file,))
+                    continue
+
+                parsed += 1
+                row = (None, None, None, None, 0)
+                if character is not None:
+                    row = (character.get('id'), character.get('name'), character.get('gender'),
+                           character.get('job'), 1)
+                connection.execute("INSERT OR REPLACE INTO npcs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                   (file, stamp[0], stamp[1]) + row)
+
+        self.last_parsed = parsed
+
+    def load(self):
+        """
+        NPC summaries ('id', 'name', 'gender', 'job') of every file with a character,
+        by id (NPCs without an id last, then by file name)
+
+        Returns:
+            List of NPC dicts (empty if the directory doesn't exist)
+        """
+        if not self.npc_dir.exists():
+            return []
+        rows = self._query("SELECT id, name, gender, job FROM npcs WHERE has_character "
+                           "ORDER BY id IS NULL, id, file")
+        if rows is None:
+            return [{"id": character.get('id'), "name": character.get('name'),
+                     "gender": character.get('gender'), "job": character.get('job')}
+                    for character in self._parse_all()]
+        return [{"id": npc_id, "name": name, "gender": gender, "job": job} for npc_id, name, gender, job in rows]
+
+    def _query(self, sql):
+        """Refresh the cache and run a query, or None if the cache can't be used (e.g. read-only folder)"""
+        try:
+            connection = self._connect()
+        except sqlite3.Error as e:
+            print(f"NPC roster cache unavailable ({e}), reading the YAML files")
+            return None
+        try:
+            self.refresh(connection)
+            return connection.execute(sql).fetchall()
+        except sqlite3.Error as e:
+            print(f"NPC roster cache unavailable ({e}), reading the YAML files")
+            return None
+        finally:
+            connection.close()
+
+    def _parse_all(self):
+        """Uncached fallback: parse every file (same order as the cached query)"""
+        characters = []
+        for file in sorted(self._scan()):
+            try:
+                character = self.parse_file(self.npc_dir / file)
+            except Exception as e:
+                print(f"Error loading {self.npc_dir / file}: {e}")
+                continue
+            if character is not None:
+                characters.append(character)
+        self.last_parsed = len(characters)
+        return sorted(characters, key=lambda character: (character.get('id') is None, character.get('id') or 0))
+
+
+# Example usage
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        npc_dir = Path(work_dir) / "npcslist"
+        shutil.copytree(Path(__file__).parent / "npcslist", npc_dir)
+        cache = RosterCache(npc_dir)
+
+        for label in ("First load (builds the cache)", "Second load (all cached)"):
+            start = time.perf_counter()
+            npcs = cache.load()
+            print(f"{label}: {len(npcs)} NPCs, {cache.last_parsed} parsed, "
+                  f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+        # Touch one file - only it is parsed again
+        changed = sorted(npc_dir.glob("*.yml"))[0]
+        os.utime(changed, ns=(changed.stat().st_atime_ns, changed.stat().st_mtime_ns + 1))
+        start = time.perf_counter()
+        cache.load()
+        print(f"After editing {changed.name}: {cache.last_parsed} parsed, {(time.perf_counter() - start) * 1000:.1f} ms")
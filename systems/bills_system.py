@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
+from systems.game_state import EmployeeState
+
 class BillType(Enum):
     """Types of bills"""
     OFFICE_RENT = "Office Rent"
@@ -26,9 +28,13 @@ class BillStatus(Enum):
 class BillsSystem:
     """Manages all bills and financial obligations"""
 
+    # How far ahead generate_warnings looks for the money running out
+    FORECAST_WARNING_MONTHS = 6
+
     def __init__(self, game_data, money_system=None):
         self.game_data = game_data
         self.money_system = money_system
+        self.bill_ledger = None  # Memoized bills and totals (see get_bill_ledger)
         self.initialize_bills_data()
 
     def initialize_bills_data(self):
@@ -47,6 +53,183 @@ class BillsSystem:
 
     def calculate_monthly_bills(self) -> List[Dict]:
         """Calculate all bills due for the current month"""
+        ledger = self.get_bill_ledger()
+        if ledger['bills'] is None:
+            ledger['bills'] = self.build_monthly_bills()
+        return list(ledger['bills'])
+
+    def _ledger_key(self) -> Tuple:
+        """
+        What the memoized bills depend on, checked in constant time: the bills version
+        (bumped by every change to employees or loans, see bump_bills_version), the office and the rent
+        """
+        data = self.game_data.data
+        office = data.get('office', {})
+        return (getattr(self.game_data, 'bills_version', 0), office.get('has_office', False),
+                office.get('size', 'small'), data.get('money', {}).get('monthly_rent', 150))
+
+    def get_bill_ledger(self) -> Dict:
+        """
+        Get the memoized bill ledger, rebuilt only when employees, loans or the office change
+
+        Returns:
+            Dict with 'bills' (None until listed), 'total', 'mandatory', 'salaries' and 'active_employees'
+        """
+        key = self._ledger_key()
+        ledger = self.bill_ledger
+        # A loaded or rewound game replaces the data dict, so the ledger is tied to the one it was built from
+        if ledger is None or ledger['key'] != key or ledger['data'] is not self.game_data.data:
+            bills = self.build_monthly_bills()
+            salary_bills = [bill for bill in bills if bill['type'] == BillType.EMPLOYEE_SALARY.value]
+            self.bill_ledger = ledger = {
+                'key': key,
+                'data': self.game_data.data,
+                'bills': bills,
+                'total': sum(bill['amount'] for bill in bills),
+                'mandatory': sum(bill['amount'] for bill in bills if bill.get('mandatory', True)),
+                'salaries': sum(bill['amount'] for bill in salary_bills),
+                'active_employees': len(salary_bills)
+            }
+        return ledger
+
+    def bump_bills_version(self):
+        """
+        Mark employees or loans changed, so every BillsSystem of this game rebuilds its bills
+        Call it after editing employees or loans in place (the methods below do it themselves)
+        """
+        self.game_data.bills_version = getattr(self.game_data, 'bills_version', 0) + 1
+
+    def invalidate_bills(self):
+        """Forget the memoized bills, here and in every other BillsSystem of this game"""
+        self.bump_bills_version()
+        self.bill_ledger = None
+
+    def _apply_bill_delta(self, amount: int, mandatory: bool = True, salary: bool = False,
+                          employees: int = 0):
+        """Move the ledger totals by one bill's change (the bill list is rebuilt when next needed)"""
+        ledger = self.bill_ledger
+        ledger['total'] += amount
+        if mandatory:
+            ledger['mandatory'] += amount
+        if salary:
+            ledger['salaries'] += amount
+            ledger['active_employees'] += employees
+        ledger['bills'] = None
+
+    def _changed(self):
+        """Bump the bills version after a delta, keeping this ledger (already up to date) valid"""
+        self.bump_bills_version()
+        self.bill_ledger['key'] = self._ledger_key()
+
+    def hire_employee(self, employee: Dict):
+        """
+        Add an employee and update bill totals without a rebuild
+
+        Args:
+            employee: Employee dict ('id', 'name', 'salary', 'active')
+        """
+        self.get_bill_ledger()
+        employee = EmployeeState.from_dict(employee)
+        self.game_data.data.setdefault('employees', []).append(employee)
+        self._journal('record_append', ['employees'], employee)
+
+        if employee.get('active', True):
+            self._apply_bill_delta(employee.get('salary', 500), salary=True, employees=1)
+        if self.has_office():
+            # Utilities count every employee on the books (optional bill)
+            self._apply_bill_delta(10, mandatory=False)
+        self._changed()
+
+    def fire_employee(self, employee_id) -> bool:
+        """
+        Remove an employee and update bill totals without a rebuild
+
+        Returns:
+            True if the employee was found
+        """
+        employees = self.game_data.data.get('employees', [])
+        for index, employee in enumerate(employees):
+            if employee.get('id') == employee_id:
+                break
+        else:
+            return False
+
+        self.get_bill_ledger()
+        employees.pop(index)
+        self._journal('record_set', ['employees'], employees)
+
+        if employee.get('active', True):
+            self._apply_bill_delta(-employee.get('salary', 500), salary=True, employees=-1)
+        if self.has_office():
+            self._apply_bill_delta(-10, mandatory=False)
+        self._changed()
+        return True
+
+    def update_employee(self, employee_id, **changes) -> bool:
+        """
+        Change an employee (a raise, a leave of absence...) and update bill totals without a rebuild
+
+        Args:
+            employee_id: Employee to change
+            **changes: Fields to set, e.g. salary=1500 or active=False
+
+        Returns:
+            True if the employee was found
+        """
+        for employee in self.game_data.data.get('employees', []):
+            if employee.get('id') == employee_id:
+                break
+        else:
+            return False
+
+        self.get_bill_ledger()
+        was_active, old_salary = employee.get('active', True), employee.get('salary', 500)
+        for key, value in changes.items():
+            employee[key] = value
+        self._journal('record_set', ['employees'], self.game_data.data['employees'])
+
+        if was_active:
+            self._apply_bill_delta(-old_salary, salary=True, employees=-1)
+        if employee.get('active', True):
+            self._apply_bill_delta(employee.get('salary', 500), salary=True, employees=1)
+        self._changed()
+        return True
+
+    def add_loan(self, loan: Dict):
+        """Add a loan and its monthly payment to the bill totals"""
+        self.get_bill_ledger()
+        self.game_data.data.setdefault('loans', []).append(loan)
+        self._journal('record_append', ['loans'], loan)
+
+        if loan.get('active', False):
+            self._apply_bill_delta(loan.get('monthly_payment', 0))
+        self._changed()
+
+    def close_loan(self, loan_id) -> bool:
+        """
+        Mark a loan paid off and drop its payment from the bill totals
+
+        Returns:
+            True if an active loan was found
+        """
+        for loan in self.game_data.data.get('loans', []):
+            if loan.get('id') == loan_id and loan.get('active', False):
+                self.get_bill_ledger()
+                loan['active'] = False
+                self._apply_bill_delta(-loan.get('monthly_payment', 0))
+                self._changed()
+                self._journal('record_set', ['loans'], self.game_data.data['loans'])
+                return True
+        return False
+
+    def _journal(self, method: str, keys: List[str], value):
+        """Pass a change on to the autosave journal, when the game has one"""
+        journal = getattr(self.game_data, 'journal', None)
+        if journal:
+            getattr(journal, method)(keys, value)
+
+    def build_monthly_bills(self) -> List[Dict]:
+        """Build the bill list from scratch, walking every employee and loan"""
         bills = []
 
         # Apartment rent (always present)
@@ -108,13 +291,11 @@ class BillsSystem:
 
     def get_total_monthly_bills(self) -> int:
         """Get total amount of all monthly bills"""
-        bills = self.calculate_monthly_bills()
-        return sum(bill['amount'] for bill in bills)
+        return self.get_bill_ledger()['total']
 
     def get_mandatory_bills_total(self) -> int:
         """Get total of mandatory bills only"""
-        bills = self.calculate_monthly_bills()
-        return sum(bill['amount'] for bill in bills if bill.get('mandatory', True))
+        return self.get_bill_ledger()['mandatory']
 
     def process_monthly_bills(self, current_date: str) -> Tuple[bool, List[str]]:
         """
@@ -141,8 +322,8 @@ class BillsSystem:
             total_funds = self.game_data.data.get('money', {}).get('bank_balance', 0)
             bank_funds = total_funds
 
-        total_bills = sum(bill['amount'] for bill in bills)
-        mandatory_total = sum(bill['amount'] for bill in bills if bill.get('mandatory', True))
+        total_bills = self.get_total_monthly_bills()
+        mandatory_total = self.get_mandatory_bills_total()
 
         # Check if player can afford bills
         if total_funds < mandatory_total:
@@ -194,6 +375,7 @@ class BillsSystem:
 
         # Update last payment month
         self.game_data.data['bills']['last_payment_month'] = current_month
+        self._journal('record_set', ['bills'], self.game_data.data['bills'])
 
         # Generate warnings if needed
         warning_messages = self.generate_warnings(total_funds, mandatory_total)
@@ -278,6 +460,12 @@ class BillsSystem:
             if available_funds < required_funds * 2:
                 messages.append("WARNING: Low funds - may struggle with next month's bills!")
 
+            # Look ahead with raises and loan payments, not just this month
+            from systems.cash_flow_forecast import CashFlowForecast
+            forecast = CashFlowForecast(self).forecast(self.FORECAST_WARNING_MONTHS)
+            if forecast['insolvency_date']:
+                messages.append(f"Forecast: without new income, funds run out in {forecast['insolvency_date']}")
+
         elif consecutive_missed == 1:
             messages.append("WARNING: 1 month of missed payments - 2 more leads to BANKRUPTCY!")
             messages.append("Consider: Taking a loan, selling assets, or reducing expenses")
@@ -405,16 +593,11 @@ class BillsSystem:
 
     def has_employees(self) -> bool:
         """Check if player has any employees"""
-        employees = self.game_data.data.get('employees', [])
-        return any(emp.get('active', True) for emp in employees)
+        return self.get_bill_ledger()['active_employees'] > 0
 
     def get_total_salaries(self) -> int:
         """Get total monthly salary expenses"""
-        total = 0
-        for emp in self.game_data.data.get('employees', []):
-            if emp.get('active', True):
-                total += emp.get('salary', 500)
-        return total
+        return self.get_bill_ledger()['salaries']
 
     def get_payment_history(self, months: int = 3) -> List[Dict]:
         """Get payment history for last N months"""
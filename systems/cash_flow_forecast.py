@@ -0,0 +1,204 @@
+"""
+Cash Flow Forecast
+Projects rent, office, salaries, loans and funds months ahead to predict when the studio goes broke
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from systems.salary_system import SalarySystem
+from systems.bills_system import BillsSystem
+
+
+class CashFlowForecast:
+    """Month-by-month projection of the bills, as arrays"""
+
+    # Raise applied to every salary each January (SalarySystem's annual increase)
+    RAISE_RATE = SalarySystem.ANNUAL_INCREASE_RATE
+
+    # Utilities charged per employee when there is an office (see BillsSystem.calculate_utilities)
+    UTILITIES_PER_EMPLOYEE = 10
+
+    def __init__(self, bills_system: BillsSystem):
+        """
+        Args:
+            bills_system: BillsSystem to read bills from (its money_system, if any, gives the funds)
+        """
+        self.bills_system = bills_system
+        self.game_data = bills_system.game_data
+
+    def _current_funds(self) -> float:
+        """Cash plus bank balance right now"""
+        if self.bills_system.money_system:
+            return self.bills_system.money_system.get_total_money()
+        money_data = self.game_data.data.get('money', {})
+        return money_data.get('bank_balance', 0) + money_data.get('cash_on_hand', 0)
+
+    def _start_month(self):
+        """(year, month) of the first bills in the forecast - next month's"""
+        time_data = self.game_data.data.get('time')
+        if time_data:
+            year, month = time_data.get('year', 1978), time_data.get('month', 1)
+        else:
+            current_date = self.game_data.data.get('game_time', {}).get('current_date', '1984-01-01')
+            year, month = int(current_date[:4]), int(current_date[5:7])
+        return (year, month + 1) if month < 12 else (year + 1, 1)
+
+    def _loan_payments(self, months: int) -> np.ndarray:
+        """Payments per month for all active loans, stopping when each is paid off"""
+        loans = [loan for loan in self.game_data.data.get('loans', []) if loan.get('active', False)]
+        if not loans:
+            return np.zeros(months)
+
+        payments = np.array([loan.get('monthly_payment', 0) for loan in loans], dtype=float)
+
+        # Payments left: explicit count, else what's left of the term, else until the horizon
+        remaining = np.array([
+            loan.get('remaining_payments',
+                     loan['term_months'] - loan.get('payments_made', 0) if 'term_months' in loan else months)
+            for loan in loans
+        ])
+
+        month_index = np.arange(months)
+        return (payments[:, None] * (month_index[None, :] < remaining[:, None])).sum(axis=0)
+
+    def forecast(self, months: int = 24, monthly_income: float = 0) -> Dict:
+        """
+        Project every bill and the remaining funds
+
+        Args:
+            months: Number of months to project
+            monthly_income: Expected income per month (scalar or array of length months)
+
+        Returns:
+            Dict of arrays per month ('rent', 'office', 'utilities', 'salaries', 'loans',
+            'mandatory', 'outflow', 'funds_before', 'funds_after') plus 'months' labels,
+            'raise_factor', 'insolvency_month' (index, or None) and 'insolvency_date'
+        """
+        ledger = self.bills_system.get_bill_ledger()
+        has_office = self.bills_system.has_office()
+
+        start_year, start_month = self._start_month()
+        month_numbers = start_month - 1 + np.arange(months)
+        years = start_year + month_numbers // 12
+
+        # Salaries rise each January
+        raise_factor = (1 + self.RAISE_RATE) ** (years - start_year)
+
+        rent = np.full(months, float(self.game_data.data.get('money', {}).get('monthly_rent', 150)))
+        office = np.full(months, float(self.bills_system.get_office_rent() if has_office else 0))
+        utilities = np.full(months, float(self.bills_system.calculate_utilities()))
+        salaries = ledger['salaries'] * raise_factor
+        loans = self._loan_payments(months)
+
+        mandatory = rent + office + salaries + loans
+        outflow = mandatory + utilities
+
+        # Funds on hand before each month's bills, assuming every bill gets paid
+        income = np.broadcast_to(np.asarray(monthly_income, dtype=float), (months,))
+        funds_after = self._current_funds() + np.cumsum(income - outflow)
+        funds_before = funds_after + outflow
+
+        insolvency_month = self._first_insolvent(funds_before[None, :], mandatory[None, :])[0]
+
+        return {
+            'months': [f"{year}-{month % 12 + 1:02d}" for year, month in zip(years, month_numbers)],
+            'raise_factor': raise_factor,
+            'rent': rent,
+            'office': office,
+            'utilities': utilities,
+            'salaries': salaries,
+            'loans': loans,
+            'mandatory': mandatory,
+            'outflow': outflow,
+            'funds_before': funds_before,
+            'funds_after': funds_after,
+            'insolvency_month': insolvency_month,
+            'insolvency_date': None if insolvency_month is None else
+                f"{years[insolvency_month]}-{month_numbers[insolvency_month] % 12 + 1:02d}"
+        }
+
+    @staticmethod
+    def _first_insolvent(funds_before: np.ndarray, mandatory: np.ndarray) -> List[Optional[int]]:
+        """First month per row where the funds can't cover the mandatory bills"""
+        short = funds_before < mandatory
+        first = short.argmax(axis=1)
+        return [int(month) if short[row, month] else None for row, month in enumerate(first)]
+
+    def hiring_sensitivity(self, salaries, months: int = 24, monthly_income: float = 0) -> Dict:
+        """
+        Insolvency month for each candidate hire, all at once
+
+        Args:
+            salaries: Monthly salaries of the candidates (each considered alone)
+            months: Number of months to project
+            monthly_income: Expected income per month
+
+        Returns:
+            Dict with 'baseline' insolvency month, 'with_hire' (one per candidate),
+            'months_lost' (None where neither goes broke) and 'max_affordable_salary'
+            (largest salary that doesn't go broke within the horizon)
+        """
+        base = self.forecast(months, monthly_income)
+        candidates = np.asarray(salaries, dtype=float)
+        raise_factor = base['raise_factor']
+
+        # Each hire adds its raised salary, plus a utilities share when there's an office
+        extra_utilities = self.UTILITIES_PER_EMPLOYEE if self.bills_system.has_office() else 0
+        extra_mandatory = candidates[:, None] * raise_factor[None, :]
+        extra_outflow = extra_mandatory + extra_utilities
+
+        # Funds before month i lose every extra payment of the months before it
+        extra_paid_before = np.cumsum(extra_outflow, axis=1) - extra_outflow
+        funds_before = base['funds_before'][None, :] - extra_paid_before
+        with_hire = self._first_insolvent(funds_before, base['mandatory'][None, :] + extra_mandatory)
+
+        baseline = base['insolvency_month']
+        horizon = months if baseline is None else baseline
+        months_lost = [None if month is None else horizon - month for month in with_hire]
+
+        return {
+            'baseline': baseline,
+            'with_hire': with_hire,
+            'months_lost': months_lost,
+            'max_affordable_salary': self.max_affordable_salary(base, extra_utilities)
+        }
+
+    @staticmethod
+    def max_affordable_salary(base: Dict, extra_utilities: float = 0) -> float:
+        """
+        Largest salary a new hire could have without going broke within the forecast
+
+        Month i stays solvent while funds_before[i] - s * F[i] - u * i >= mandatory[i] + s * f[i],
+        where f is the raise factor and F its running total over earlier months
+        """
+        factor = base['raise_factor']
+        earlier_factor = np.cumsum(factor) - factor
+        earlier_utilities = extra_utilities * np.arange(len(factor))
+
+        headroom = base['funds_before'] - earlier_utilities - base['mandatory']
+        limits = headroom / (earlier_factor + factor)
+        return max(0.0, float(limits.min())) if len(limits) else 0.0
+
+
+# Example usage
+if __name__ == "__main__":
+    class DemoGameData:
+        def __init__(self):
+            self.data = {
+                'money': {'cash_on_hand': 30, 'bank_balance': 90000, 'monthly_rent': 150},
+                'office': {'has_office': True, 'size': 'small'},
+                'employees': [{'id': 1, 'name': 'Ada', 'salary': 1200}],
+                'loans': [{'id': 1, 'active': True, 'monthly_payment': 400, 'term_months': 12, 'payments_made': 6}],
+                'time': {'year': 1985, 'month': 10, 'day': 1}
+            }
+
+    forecast = CashFlowForecast(BillsSystem(DemoGameData()))
+    result = forecast.forecast(24)
+    print(f"Insolvent from: {result['insolvency_date']} (month {result['insolvency_month']})")
+    print(f"Salaries first/last month: ${result['salaries'][0]:,.0f} / ${result['salaries'][-1]:,.0f}")
+
+    sensitivity = forecast.hiring_sensitivity([800, 1500, 3000], 24)
+    print(f"With each hire: {sensitivity['with_hire']} (months lost: {sensitivity['months_lost']})")
+    print(f"Max affordable salary: ${sensitivity['max_affordable_salary']:,.0f}")
@@ -247,7 +247,7 @@ class DevMenu:
         """Set the time speed multiplier"""
         try:
             # Access the time system if it exists in the current screen
-            if hasattr(self.app, 'studio_room'):
+            if getattr(self.app, 'studio_room', None):
                 self.app.studio_room.time_system.time_scale = speed
                 messagebox.showinfo("Dev Mode", f"Time speed set to x{speed}")
 
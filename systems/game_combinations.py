@@ -5,7 +5,15 @@ Rating Scale: 1-5 (1=Terrible, 2=Poor, 3=Average, 4=Good, 5=Perfect)
 Score Modifiers: 5/5 = +2, 4/5 = +1, 3/5 = 0, 2/5 = -1, 1/5 = -2
 """
 
-from typing import Tuple, Dict
+import os
+import re
+from typing import Tuple, Dict, List, Optional
+
+# combos.txt lists every game type and topic (the matrix axes), in display order
+COMBOS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'combos.txt')
+
+# Rating for combinations that aren't listed below
+DEFAULT_RATING = 3
 
 # Combination ratings: (game_type, topic) -> rating (1-5)
 COMBINATION_RATINGS: Dict[Tuple[str, str], int] = {
@@ -287,9 +295,129 @@ COMBINATION_RATINGS: Dict[Tuple[str, str], int] = {
 }
 
 
+def load_combination_names(path: str = COMBOS_FILE) -> Tuple[List[str], List[str]]:
+    """
+    Read the game type and topic lists from combos.txt
+
+    Returns:
+        (game_types, topics) in file order; empty lists if the file is missing
+    """
+    if not os.path.exists(path):
+        return [], []
+
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    # Numbered entries like "15. RPG - Unlock: ..." under each section
+    entry = re.compile(r'^\d+\.\s+(.+?)(?:\s+-\s+.*)?$', re.MULTILINE)
+
+    def section(start: str, end: str) -> List[str]:
+        if start not in text:
+            return []
+        body = text.split(start, 1)[1].split(end, 1)[0]
+        return [match.group(1).strip() for match in entry.finditer(body)]
+
+    return section('## GAME TYPES', '## TOPICS'), section('## TOPICS', '## ALL POSSIBLE')
+
+
+class CombinationMatrix:
+    """Dense game type x topic rating matrix with name -> index maps"""
+
+    def __init__(self, ratings: Dict[Tuple[str, str], int], game_types: List[str], topics: List[str]):
+        import numpy as np
+
+        # Axes: names from combos.txt, plus any rated names it doesn't list
+        self.game_types = list(dict.fromkeys(game_types + [game_type for game_type, _ in ratings]))
+        self.topics = list(dict.fromkeys(topics + [topic for _, topic in ratings]))
+        self.type_index = {name: index for index, name in enumerate(self.game_types)}
+        self.topic_index = {name: index for index, name in enumerate(self.topics)}
+
+        self.ratings = np.full((len(self.game_types), len(self.topics)), DEFAULT_RATING, dtype=np.int8)
+
+        # Inverted indexes of explicitly rated combinations (in definition order)
+        self.rated_by_type: Dict[str, Dict[str, int]] = {}
+        self.rated_by_topic: Dict[str, Dict[str, int]] = {}
+
+        for (game_type, topic), rating in ratings.items():
+            self.ratings[self.type_index[game_type], self.topic_index[topic]] = rating
+            self.rated_by_type.setdefault(game_type, {})[topic] = rating
+            self.rated_by_topic.setdefault(topic, {})[game_type] = rating
+
+    def get_rating(self, game_type: str, topic: str) -> int:
+        """Rating for a combination (DEFAULT_RATING for unknown names)"""
+        type_index = self.type_index.get(game_type)
+        topic_index = self.topic_index.get(topic)
+        if type_index is None or topic_index is None:
+            return DEFAULT_RATING
+        return int(self.ratings[type_index, topic_index])
+
+    def top_topics(self, game_type: str, k: int = 5, topics: Optional[List[str]] = None) -> List[Tuple[str, int]]:
+        """
+        Best topics for a game type
+
+        Args:
+            game_type: The game type
+            k: Number of results
+            topics: Optional candidate topics (e.g. those unlocked this year)
+
+        Returns:
+            List of (topic, rating), best first; ties keep combos.txt order
+        """
+        type_index = self.type_index.get(game_type)
+        row = self.ratings[type_index] if type_index is not None else None
+        return self._top_k(row, self.topics, self.topic_index, k, topics)
+
+    def top_types(self, topic: str, k: int = 5, game_types: Optional[List[str]] = None) -> List[Tuple[str, int]]:
+        """
+        Best game types for a topic
+
+        Args:
+            topic: The topic
+            k: Number of results
+            game_types: Optional candidate game types (e.g. those unlocked this year)
+
+        Returns:
+            List of (game_type, rating), best first; ties keep combos.txt order
+        """
+        topic_index = self.topic_index.get(topic)
+        column = self.ratings[:, topic_index] if topic_index is not None else None
+        return self._top_k(column, self.game_types, self.type_index, k, game_types)
+
+    @staticmethod
+    def _top_k(line, names: List[str], index: Dict[str, int], k: int,
+               candidates: Optional[List[str]]) -> List[Tuple[str, int]]:
+        """Top k entries of one matrix row/column, optionally limited to candidates"""
+        import numpy as np
+
+        if candidates is None:
+            candidates = names
+            positions = np.arange(len(names))
+        else:
+            positions = np.array([index.get(name, -1) for name in candidates], dtype=np.int64)
+
+        if line is None:
+            values = np.full(len(candidates), DEFAULT_RATING, dtype=np.int8)
+        else:
+            values = np.where(positions >= 0, line[positions], DEFAULT_RATING)
+
+        order = np.argsort(-values.astype(np.int64), kind='stable')[:k]
+        return [(candidates[i], int(values[i])) for i in order]
+
+
 class CombinationRatingSystem:
     """System for rating game type and topic combinations"""
 
+    # Built on first use by get_matrix()
+    _matrix = None
+
+    @staticmethod
+    def get_matrix() -> CombinationMatrix:
+        """Get the shared combination matrix (built once)"""
+        if CombinationRatingSystem._matrix is None:
+            game_types, topics = load_combination_names()
+            CombinationRatingSystem._matrix = CombinationMatrix(COMBINATION_RATINGS, game_types, topics)
+        return CombinationRatingSystem._matrix
+
     @staticmethod
     def get_combination_rating(game_type: str, topic: str) -> int:
         """
@@ -302,7 +430,7 @@ class CombinationRatingSystem:
         Returns:
             Rating from 1-5, defaults to 3 if not specified
         """
-        return COMBINATION_RATINGS.get((game_type, topic), 3)
+        return COMBINATION_RATINGS.get((game_type, topic), DEFAULT_RATING)
 
     @staticmethod
     def get_score_modifier(game_type: str, topic: str) -> int:
@@ -341,20 +469,24 @@ class CombinationRatingSystem:
     @staticmethod
     def get_all_combinations_for_type(game_type: str) -> Dict[str, int]:
         """Get all rated combinations for a specific game type"""
-        results = {}
-        for (g_type, topic), rating in COMBINATION_RATINGS.items():
-            if g_type == game_type:
-                results[topic] = rating
-        return results
+        return dict(CombinationRatingSystem.get_matrix().rated_by_type.get(game_type, {}))
 
     @staticmethod
     def get_all_combinations_for_topic(topic: str) -> Dict[str, int]:
         """Get all rated combinations for a specific topic"""
-        results = {}
-        for (game_type, t), rating in COMBINATION_RATINGS.items():
-            if t == topic:
-                results[game_type] = rating
-        return results
+        return dict(CombinationRatingSystem.get_matrix().rated_by_topic.get(topic, {}))
+
+    @staticmethod
+    def get_best_topics_for_type(game_type: str, k: int = 5,
+                                 topics: Optional[List[str]] = None) -> List[Tuple[str, int]]:
+        """Get the k best-rated topics for a game type, optionally among the given topics"""
+        return CombinationRatingSystem.get_matrix().top_topics(game_type, k, topics)
+
+    @staticmethod
+    def get_best_types_for_topic(topic: str, k: int = 5,
+                                 game_types: Optional[List[str]] = None) -> List[Tuple[str, int]]:
+        """Get the k best-rated game types for a topic, optionally among the given types"""
+        return CombinationRatingSystem.get_matrix().top_types(topic, k, game_types)
 
 
 # Example usage:
@@ -379,4 +511,10 @@ if __name__ == "__main__":
         print(f"{game_type} + {topic}:")
         print(f"  Rating: {rating}/5 - {description}")
         print(f"  Score Modifier: {modifier:+d}")
-        print()
\ No newline at end of file
+        print()
+
+    # Best picks from the matrix
+    print(f"Best RPG topics: {CombinationRatingSystem.get_best_topics_for_type('RPG', 5)}")
+    print(f"Best types for Zombies: {CombinationRatingSystem.get_best_types_for_topic('Zombies', 3)}")
+    starting_topics = ['Table Tennis', 'Fantasy', 'Space', 'Temple']
+    print(f"Best Arcade topic at start: {CombinationRatingSystem.get_best_topics_for_type('Arcade', 1, starting_topics)}")
@@ -61,8 +61,16 @@ class GameScore:
 class GameDevelopment:
     """Handles game development mechanics and scoring"""
 
-    def __init__(self, game_data):
+    # Years covered by the dense threshold table (earlier/later years clamp to the ends)
+    THRESHOLD_FIRST_YEAR = 1978
+    THRESHOLD_LAST_YEAR = 2030
+
+    # Parsed CSV thresholds shared by all instances, keyed by (path, mtime)
+    _threshold_cache = {}
+
+    def __init__(self, game_data, rng=None):
         self.game_data = game_data
+        self.rng = rng or random  # random.Random stream (see RNGSystem), or the global module
 
         # Load rating thresholds from CSV
         self.rating_thresholds_by_year = self._load_rating_thresholds()
@@ -81,6 +89,9 @@ class GameDevelopment:
             GameRating.POOR: {'min_total': 0, 'min_avg': 0}
         }
 
+        # Dense per-year lookup tables for O(1) grading
+        self._compile_threshold_table()
+
     def _load_rating_thresholds(self) -> Dict[int, Dict[GameRating, Dict[str, float]]]:
         """Load rating thresholds from CSV file"""
         thresholds_by_year = {}
@@ -89,6 +100,16 @@ class GameDevelopment:
         if not os.path.exists(csv_path):
             return thresholds_by_year
 
+        cache_key = (csv_path, os.path.getmtime(csv_path))
+        if cache_key in GameDevelopment._threshold_cache:
+            return GameDevelopment._threshold_cache[cache_key]
+
+        # Match both enum values ("Meh...") and names ("MEH")
+        ratings_by_name = {}
+        for rating in GameRating:
+            ratings_by_name[rating.value.upper()] = rating
+            ratings_by_name[rating.name] = rating
+
         try:
             with open(csv_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
@@ -97,11 +118,7 @@ class GameDevelopment:
                     rating_name = row['rating'].upper()
 
                     # Find matching GameRating enum
-                    rating_enum = None
-                    for rating in GameRating:
-                        if rating.value.upper() == rating_name or rating.name == rating_name:
-                            rating_enum = rating
-                            break
+                    rating_enum = ratings_by_name.get(rating_name)
 
                     if rating_enum:
                         if year not in thresholds_by_year:
@@ -114,9 +131,48 @@ class GameDevelopment:
                         }
         except Exception as e:
             print(f"Error loading rating thresholds from CSV: {e}")
+            return thresholds_by_year
 
+        GameDevelopment._threshold_cache = {cache_key: thresholds_by_year}
         return thresholds_by_year
 
+    def _compile_threshold_table(self):
+        """
+        Resolve the thresholds for every year once
+        Each year uses the closest CSV year that's not in the future (or the earliest)
+        """
+        years = self.rating_thresholds_by_year
+        first_year = min([self.THRESHOLD_FIRST_YEAR] + list(years))
+        last_year = max([self.THRESHOLD_LAST_YEAR] + list(years))
+        available_years = sorted(years)
+
+        self.threshold_first_year = first_year
+        self.thresholds_by_year_index = []
+        closest = 0
+        for year in range(first_year, last_year + 1):
+            while closest + 1 < len(available_years) and available_years[closest + 1] <= year:
+                closest += 1
+            if available_years:
+                self.thresholds_by_year_index.append(years[available_years[closest]])
+            else:
+                self.thresholds_by_year_index.append(self.default_rating_thresholds)
+
+        # Numeric cutoffs per year in GameRating order (missing tiers can never match)
+        self.rating_order = list(GameRating)
+        self.min_total_by_year = [
+            [thresholds[rating]['min_total'] if rating in thresholds else float('inf') for rating in self.rating_order]
+            for thresholds in self.thresholds_by_year_index
+        ]
+        self.min_avg_by_year = [
+            [thresholds[rating]['min_avg'] if rating in thresholds else float('inf') for rating in self.rating_order]
+            for thresholds in self.thresholds_by_year_index
+        ]
+        self._threshold_arrays = None
+
+    def _year_index(self, year: int) -> int:
+        """Row of a year in the dense threshold table"""
+        return min(max(year - self.threshold_first_year, 0), len(self.thresholds_by_year_index) - 1)
+
     def develop_game(self, game_name: str, game_type: str, game_topic: str,
                      lead_developer: str, engine: str = "OpenEngine") -> GameScore:
         """
@@ -200,14 +256,14 @@ class GameDevelopment:
         max_val = max(min_val + 1, max_val)
 
         # Generate base score
-        base_score = random.randint(min_val, max_val)
+        base_score = self.rng.randint(min_val, max_val)
 
         # Add some variance for excitement (small chance of critical success/failure)
-        crit_roll = random.random()
+        crit_roll = self.rng.random()
         if crit_roll < 0.05:  # 5% chance of critical failure
-            base_score = max(1, base_score - random.randint(5, 10))
+            base_score = max(1, base_score - self.rng.randint(5, 10))
         elif crit_roll > 0.95:  # 5% chance of critical success
-            base_score = min(50, base_score + random.randint(5, 10))
+            base_score = min(50, base_score + self.rng.randint(5, 10))
 
         # Cap at reasonable limits for early game
         return min(40, max(1, base_score))
@@ -389,46 +445,56 @@ class GameDevelopment:
         if year is None:
             year = self._get_current_year()
 
-        # Adjust thresholds based on year (will be loaded from CSV later)
-        adjusted_thresholds = self._adjust_thresholds_for_year(year)
+        year_index = self._year_index(year)
+        total = score.total
+        average = score.average
 
         # Check each rating tier from best to worst
-        for rating in GameRating:
-            threshold = adjusted_thresholds.get(rating)
-            if threshold:
-                if score.total >= threshold['min_total'] and score.average >= threshold['min_avg']:
-                    return rating
+        for rating, min_total, min_avg in zip(self.rating_order, self.min_total_by_year[year_index],
+                                              self.min_avg_by_year[year_index]):
+            if total >= min_total and average >= min_avg:
+                return rating
 
         return GameRating.POOR
 
-    def _adjust_thresholds_for_year(self, year: int) -> Dict[GameRating, Dict[str, float]]:
-        """Get rating thresholds for a specific year from loaded CSV data"""
-        # If we have thresholds for this exact year, use them
-        if year in self.rating_thresholds_by_year:
-            return self.rating_thresholds_by_year[year]
+    def get_game_rating_many(self, scores, years=None) -> List[GameRating]:
+        """
+        Rate many games at once
 
-        # Otherwise, find the closest year
-        if self.rating_thresholds_by_year:
-            available_years = sorted(self.rating_thresholds_by_year.keys())
+        Args:
+            scores: Sequence of GameScore objects, or an array of total scores
+            years: Year for each game, a single year, or None for the current year
 
-            # Find the closest year that's not in the future
-            closest_year = None
-            for available_year in available_years:
-                if available_year <= year:
-                    closest_year = available_year
-                else:
-                    break
+        Returns:
+            List of GameRating values in the same order as scores
+        """
+        import numpy as np
 
-            # If we found a suitable year, use it
-            if closest_year:
-                return self.rating_thresholds_by_year[closest_year]
+        if self._threshold_arrays is None:
+            self._threshold_arrays = (np.array(self.min_total_by_year), np.array(self.min_avg_by_year))
+        min_totals, min_avgs = self._threshold_arrays
 
-            # If the requested year is before all available years, use the earliest
-            if year < available_years[0]:
-                return self.rating_thresholds_by_year[available_years[0]]
+        if isinstance(scores, np.ndarray):
+            totals = scores.astype(float)
+        else:
+            totals = np.array([score.total if isinstance(score, GameScore) else score for score in scores], dtype=float)
 
-        # Fallback to default thresholds
-        return self.default_rating_thresholds
+        if years is None:
+            years = self._get_current_year()
+        year_indices = np.clip(np.asarray(years, dtype=np.int64) - self.threshold_first_year,
+                               0, len(self.thresholds_by_year_index) - 1)
+        year_indices = np.broadcast_to(year_indices, totals.shape)
+
+        # First tier (best to worst) whose cutoffs are met, else Poor
+        meets = (totals[:, None] >= min_totals[year_indices]) & \
+                ((totals / 6)[:, None] >= min_avgs[year_indices])
+        tiers = np.where(meets.any(axis=1), meets.argmax(axis=1), self.rating_order.index(GameRating.POOR))
+
+        return [self.rating_order[tier] for tier in tiers]
+
+    def _adjust_thresholds_for_year(self, year: int) -> Dict[GameRating, Dict[str, float]]:
+        """Get rating thresholds for a specific year from loaded CSV data"""
+        return self.thresholds_by_year_index[self._year_index(year)]
 
     def get_rating_description(self, rating: GameRating) -> str:
         """Get a random description for the rating"""
@@ -549,4 +615,4 @@ class GameDevelopment:
         rating_descriptions = descriptions.get(rating, ["No description available."])
 
         # Return a random description from the list
-        return random.choice(rating_descriptions)
\ No newline at end of file
+        return self.rng.choice(rating_descriptions)
\ No newline at end of file
@@ -0,0 +1,296 @@
+"""
+Game State
+Typed, slot-based records for the hot sections of the game data (time, money, player, happiness, employees)
+Needs Python 3.10+ (dataclass slots)
+"""
+
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Set
+
+
+class StateRecord(MutableMapping):
+    """
+    A section of the game data with fixed attributes instead of dict keys
+    Still reads and writes like the dict it replaces, so older code and old saves keep working;
+    keys without an attribute (older or newer saves) are kept in `extra`, created on first use.
+    Fields the save didn't have are listed in `unset`: their attribute holds the default for the
+    systems, but as a dict they are absent (get() gives the caller's default) until written
+    """
+
+    __slots__ = ()
+
+    # Attribute names, set for each record class by _record
+    FIELDS = ()
+    FIELD_SET = frozenset()
+
+    @classmethod
+    def from_dict(cls, data: Mapping):
+        """Build a record from a saved section - missing keys get their defaults, but stay unset"""
+        if isinstance(data, cls):
+            return data
+        known = {}
+        extra = {}
+        for key, value in data.items():
+            if key in cls.FIELD_SET:
+                known[key] = value
+            else:
+                extra[key] = value
+        unset = set(cls.FIELDS).difference(known)
+        return cls(**known, extra=extra or None, unset=unset or None)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Writing a field sets it (unset itself is assigned last while the dataclass initialises)
+        try:
+            unset = self.unset
+        except AttributeError:
+            return
+        if unset and name in unset:
+            unset.discard(name)
+
+    def to_dict(self) -> Dict:
+        """The section in the saved dict layout (unset fields are left out)"""
+        unset = self.unset
+        result = {name: to_plain(getattr(self, name)) for name in self.FIELDS
+                  if not unset or name not in unset}
+        if self.extra:
+            for key, value in self.extra.items():
+                result[key] = to_plain(value)
+        return result
+
+    def __getitem__(self, key):
+        if key in self.FIELD_SET:
+            if self.unset and key in self.unset:
+                raise KeyError(key)
+            return getattr(self, key)
+        if self.extra is None:
+            raise KeyError(key)
+        return self.extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self.FIELD_SET:
+            setattr(self, key, value)
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self.FIELD_SET:
+            # The attribute keeps its value for the systems; the key is gone from the dict view
+            if self.unset and key in self.unset:
+                raise KeyError(key)
+            if self.unset is None:
+                self.unset = {key}
+            else:
+                self.unset.add(key)
+            return
+        if self.extra is None:
+            raise KeyError(key)
+        del self.extra[key]
+
+    def __contains__(self, key):
+        if key in self.FIELD_SET:
+            return not self.unset or key not in self.unset
+        return self.extra is not None and key in self.extra
+
+    def __iter__(self):
+        if self.unset:
+            yield from (name for name in self.FIELDS if name not in self.unset)
+        else:
+            yield from self.FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return (len(self.FIELDS) - (len(self.unset) if self.unset else 0)
+                + (len(self.extra) if self.extra else 0))
+
+    def get(self, key, default=None):
+        # Called all over the systems - skip Mapping.get's exception handling
+        if key in self.FIELD_SET:
+            if self.unset and key in self.unset:
+                return default
+            return getattr(self, key)
+        if self.extra is None:
+            return default
+        return self.extra.get(key, default)
+
+    def copy(self) -> Dict:
+        """Shallow copy as a plain dict, like dict.copy()"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+def _record(cls):
+    """Make a StateRecord subclass a slotted dataclass and fill in its field names"""
+    cls = dataclass(slots=True, eq=False)(cls)
+    cls.FIELDS = tuple(f.name for f in fields(cls) if f.name not in ('extra', 'unset'))
+    cls.FIELD_SET = frozenset(cls.FIELDS)
+    return cls
+
+
+@_record
+class TimeState(StateRecord):
+    """data['time'] - the game clock (see TimeSystem)"""
+    year: int = 1978
+    month: int = 1
+    day: int = 1
+    hour: int = 8
+    minute: int = 0
+    second: float = 0
+    current_day: int = 1
+    current_week: int = 1
+    current_month: int = 1
+    total_days: int = 0
+    last_week: int = 0
+    sleep_schedule: str = 'Normal'
+    crunch_weeks: int = 0
+    hours_worked_today: float = 0
+    breaks_taken_today: int = 0
+    is_real_time: bool = True
+    time_multiplier: float = 1.0
+    extra: Optional[Dict[str, Any]] = None
+    unset: Optional[Set[str]] = None
+
+
+@_record
+class MoneyState(StateRecord):
+    """data['money'] - cash, bank and transactions (see MoneySystem)"""
+    # monthly_totals stays in extra: when it's missing, MoneySystem rebuilds it from the history
+    cash_on_hand: float = 30
+    bank_balance: float = 1500
+    monthly_rent: float = 150
+    transaction_history: List[Dict] = field(default_factory=list)
+    recurring_expenses: List[Dict] = field(default_factory=list)
+    last_rent_paid: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+    unset: Optional[Set[str]] = None
+
+
+@_record
+class PlayerState(StateRecord):
+    """data['player_data'] - the studio and its founder"""
+    studio_name: str = 'My Game Studio'
+    player_name: str = 'Game Developer'
+    current_money: float = 10000
+    reputation: int = 0
+    stress_level: float = 0
+    energy: float = 100
+    extra: Optional[Dict[str, Any]] = None
+    unset: Optional[Set[str]] = None
+
+
+@_record
+class HappinessState(StateRecord):
+    """data['happiness_system'] - happiness and relationships (see HappinessSystem)"""
+    current_happiness: float = 60
+    max_happiness: float = 100
+    relationships: Dict[str, Any] = field(default_factory=lambda: {
+        'friends': 0, 'romantic_partner': None, 'family_contact': True})
+    recent_activities: List[str] = field(default_factory=list)
+    last_social_day: int = 0
+    extra: Optional[Dict[str, Any]] = None
+    unset: Optional[Set[str]] = None
+
+
+@_record
+class EmployeeState(StateRecord):
+    """One entry of data['employees']"""
+    id: Any = None
+    name: str = 'Employee'
+    salary: float = 500
+    active: bool = True
+    extra: Optional[Dict[str, Any]] = None
+    unset: Optional[Set[str]] = None
+
+
+# Top-level sections held as records
+SECTION_RECORDS = {
+    'time': TimeState,
+    'money': MoneyState,
+    'player_data': PlayerState,
+    'happiness_system': HappinessState,
+}
+
+
+def to_plain(value):
+    """Convert records (at any depth) back to plain dicts and lists"""
+    if isinstance(value, StateRecord):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    return value
+
+
+def json_default(value):
+    """json.dump default= hook that writes records as their dicts"""
+    if isinstance(value, StateRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def ensure_state(data: Dict, section: str):
+    """
+    The record for a top-level section, converting it in place if it's still a plain dict
+
+    Args:
+        data: Game data dict
+        section: Key in SECTION_RECORDS (must be present in data)
+    """
+    record_class = SECTION_RECORDS[section]
+    value = data[section]
+    if type(value) is not record_class:
+        value = data[section] = record_class.from_dict(value)
+    return value
+
+
+def wrap_state(data: Dict) -> Dict:
+    """
+    Convert the typed sections of loaded game data to records, in place
+    Sections that are missing stay missing - the systems create them with their own defaults
+    """
+    for section in SECTION_RECORDS:
+        if isinstance(data.get(section), Mapping):
+            ensure_state(data, section)
+
+    employees = data.get('employees')
+    if isinstance(employees, list):
+        data['employees'] = [EmployeeState.from_dict(employee) if isinstance(employee, Mapping) else employee
+                             for employee in employees]
+    return data
+
+
+# Example usage
+if __name__ == "__main__":
+    import json
+    import sys
+    import timeit
+
+    saved = {
+        'time': {'year': 1984, 'month': 3, 'day': 9, 'hour': 14},
+        'money': {'cash_on_hand': 30, 'bank_balance': 2500, 'transaction_history': [], 'monthly_totals': {}},
+        'employees': [{'id': i, 'name': f"Employee {i}", 'salary': 900 + i, 'skills': {'design': i % 10}}
+                      for i in range(1000)]
+    }
+    data = wrap_state(json.loads(json.dumps(saved)))
+
+    time_state = data['time']
+    print(f"Date: {time_state.year}-{time_state.month:02d}-{time_state.day:02d}, "
+          f"schedule {time_state.sleep_schedule} (default, {'sleep_schedule' in time_state} as a key)")
+    restored = json.loads(json.dumps(data, default=json_default))
+    print(f"Round trip keeps the saved keys: "
+          f"{all(restored['money'][key] == value for key, value in saved['money'].items())}")
+
+    plain = saved['time']
+    print(f"dict .get: {timeit.timeit(lambda: plain.get('hour', 8), number=200000) * 1000:.1f} ms | "
+          f"attribute: {timeit.timeit(lambda: time_state.hour, number=200000) * 1000:.1f} ms")
+
+    employee_dict = {'id': 1, 'name': 'Ada', 'salary': 1200, 'active': True}
+    print(f"Employee size: dict {sys.getsizeof(employee_dict)} bytes | "
+          f"record {sys.getsizeof(EmployeeState.from_dict(employee_dict))} bytes")
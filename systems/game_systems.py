@@ -2,6 +2,8 @@ import datetime
 from enum import Enum
 import time
 
+from systems.game_state import TimeState, HappinessState, ensure_state
+
 """
 Future Employee System Notes:
 - Employees will have visible "Energy Level" rating (0-100)
@@ -22,6 +24,7 @@ class TimeSystem:
         self.game_data = game_data
         self.last_update_time = time.time()
         self.accumulated_seconds = 0.0  # Track fractional seconds
+        self.boundary_listeners = []  # Called with the crossed boundaries whenever days pass
 
         # Time scale presets:
         # 1 = Real-time (1:1)
@@ -49,24 +52,24 @@ class TimeSystem:
             now = datetime.datetime.now()
 
             # Set game time to same month/day/hour as real time but in 1978
-            self.game_data.data['time'] = {
-                'year': 1978,
-                'month': now.month,
-                'day': now.day,
-                'hour': now.hour,
-                'minute': now.minute,
-                'second': now.second,
-                'current_day': now.day,
-                'current_week': (now.day - 1) // 7 + 1,
-                'current_month': now.month,
-                'total_days': 0,
-                'sleep_schedule': SleepSchedule.NORMAL.value,
-                'crunch_weeks': 0,
-                'hours_worked_today': 0,
-                'breaks_taken_today': 0,
-                'is_real_time': True,
-                'time_multiplier': 1.0  # Can speed up/slow down time
-            }
+            self.game_data.data['time'] = TimeState(
+                year=1978,
+                month=now.month,
+                day=now.day,
+                hour=now.hour,
+                minute=now.minute,
+                second=now.second,
+                current_day=now.day,
+                current_week=(now.day - 1) // 7 + 1,
+                current_month=now.month,
+                total_days=0,
+                sleep_schedule=SleepSchedule.NORMAL.value,
+                crunch_weeks=0,
+                hours_worked_today=0,
+                breaks_taken_today=0,
+                is_real_time=True,
+                time_multiplier=1.0  # Can speed up/slow down time
+            )
 
         # Sleep schedule configurations
         self.schedules = {
@@ -100,6 +103,11 @@ class TimeSystem:
             }
         }
 
+    @property
+    def state(self) -> TimeState:
+        """The time section as a typed record (a plain dict put there is converted in place)"""
+        return ensure_state(self.game_data.data, 'time')
+
     def update_real_time(self):
         """Update game time based on real time elapsed"""
         current_time = time.time()
@@ -107,7 +115,7 @@ class TimeSystem:
         self.last_update_time = current_time
 
         # Calculate game time elapsed (with time scale)
-        game_seconds_elapsed = elapsed * self.time_scale * self.game_data.data['time'].get('time_multiplier', 1.0)
+        game_seconds_elapsed = elapsed * self.time_scale * self.state.time_multiplier
 
         # At higher speeds, skip seconds and go straight to minutes for efficiency
         if self.time_scale > 960:  # Faster than 2x speed
@@ -116,7 +124,7 @@ class TimeSystem:
             if game_minutes_elapsed >= 1:
                 self.advance_time_minutes(int(game_minutes_elapsed))
                 # Don't track seconds at high speeds
-                self.game_data.data['time']['second'] = 0
+                self.state.second = 0
         else:  # At 1x or 2x speed, track seconds
             # Accumulate fractional seconds
             self.accumulated_seconds += game_seconds_elapsed
@@ -126,84 +134,148 @@ class TimeSystem:
                 self.accumulated_seconds -= seconds_to_advance
 
     def advance_time_seconds(self, seconds):
-        """Advance game time by specified seconds"""
-        time_data = self.game_data.data['time']
-
-        time_data['second'] = time_data.get('second', 0) + seconds
+        """
+        Advance game time by specified seconds
+        Rollovers are computed directly, so large skips cost the same as small ones
 
-        # Handle minute rollover
-        while time_data['second'] >= 60:
-            time_data['second'] -= 60
-            time_data['minute'] = time_data.get('minute', 0) + 1
+        Returns:
+            Crossed day/week/month/year boundaries (see advance_days)
+        """
+        time_data = self.state
 
-            # Handle hour rollover
-            if time_data['minute'] >= 60:
-                time_data['minute'] = 0
-                time_data['hour'] = time_data.get('hour', 8) + 1
+        # Carry whole minutes out of the seconds
+        total_seconds = time_data.second + seconds
+        minutes = int(total_seconds // 60)
+        time_data.second = total_seconds - minutes * 60
 
-                # Handle day rollover
-                if time_data['hour'] >= 24:
-                    time_data['hour'] = 0
-                    self.advance_day()
+        return self._carry_minutes(minutes)
 
     def advance_time_minutes(self, minutes):
         """Advance game time by specified minutes"""
         # At high speeds, skip seconds tracking
         if self.time_scale > 960:
-            time_data = self.game_data.data['time']
-            time_data['minute'] = time_data.get('minute', 0) + minutes
-
-            # Handle hour rollover
-            while time_data['minute'] >= 60:
-                time_data['minute'] -= 60
-                time_data['hour'] = time_data.get('hour', 8) + 1
-
-                # Handle day rollover
-                if time_data['hour'] >= 24:
-                    time_data['hour'] = 0
-                    self.advance_day()
+            return self._carry_minutes(minutes)
         else:
             # At lower speeds, go through seconds
-            self.advance_time_seconds(minutes * 60)
+            return self.advance_time_seconds(minutes * 60)
 
-    def advance_day(self):
-        """Advance by one day"""
-        time_data = self.game_data.data['time']
-        time_data['day'] = time_data.get('day', 1) + 1
-        time_data['total_days'] = time_data.get('total_days', 0) + 1
-        time_data['hours_worked_today'] = 0
-        time_data['breaks_taken_today'] = 0
+    def _carry_minutes(self, minutes):
+        """Add minutes, carrying whole hours and days"""
+        time_data = self.state
+        if minutes == 0:
+            return self.advance_days(0)
 
-        # Get days in current month
-        days_in_month = self.get_days_in_month(time_data.get('month', 1), time_data.get('year', 1978))
+        # Handle minute rollover
+        total_minutes = time_data.minute + minutes
+        hours = int(total_minutes // 60)
+        time_data.minute = total_minutes - hours * 60
+
+        # Handle hour and day rollover
+        total_hours = time_data.hour + hours
+        days = int(total_hours // 24)
+        time_data.hour = total_hours - days * 24
 
-        # Handle month rollover
-        if time_data['day'] > days_in_month:
-            time_data['day'] = 1
-            time_data['month'] = time_data.get('month', 1) + 1
+        return self.advance_days(days)
 
-            # Handle year rollover
-            if time_data['month'] > 12:
-                time_data['month'] = 1
-                time_data['year'] = time_data.get('year', 1978) + 1
+    def advance_day(self):
+        """Advance by one day"""
+        return self.advance_days(1)
+
+    def advance_days(self, days):
+        """
+        Advance the calendar by whole days in one step
+
+        Args:
+            days: Number of days to advance
+
+        Returns:
+            Dict of crossed boundaries: 'days' and 'weeks' counts, plus the
+            'months' ((year, month) pairs) and 'years' entered, in order
+        """
+        boundaries = {'days': 0, 'weeks': 0, 'months': [], 'years': []}
+        if days <= 0:
+            return boundaries
+
+        time_data = self.state
+        year = time_data.year
+        month = time_data.month
+        day = min(max(1, time_data.day), self.get_days_in_month(month, year))
+
+        start = datetime.date(year, month, day)
+        end = start + datetime.timedelta(days=days)
+
+        time_data.day = end.day
+        time_data.month = end.month
+        time_data.year = end.year
+        time_data.total_days += days
+        time_data.hours_worked_today = 0
+        time_data.breaks_taken_today = 0
+
+        # Months and years entered along the way
+        months = []
+        entered_year, entered_month = year, month
+        while (entered_year, entered_month) != (end.year, end.month):
+            entered_month += 1
+            if entered_month > 12:
+                entered_month = 1
+                entered_year += 1
+            months.append((entered_year, entered_month))
 
         # Update week tracking
-        time_data['current_week'] = (time_data['day'] - 1) // 7 + 1
+        time_data.current_week = (end.day - 1) // 7 + 1
+
+        # Week changes: the first new day against the stored week, then every
+        # later day that starts a week of its month (1st, 8th, 15th, 22nd, 29th)
+        first_day = start + datetime.timedelta(days=1)
+        weeks = 1 if (first_day.day - 1) // 7 + 1 != time_data.last_week else 0
+        weeks += self.count_week_starts(first_day, end)
 
         # Check crunch time limits
-        if time_data['current_week'] != time_data.get('last_week', 0):
-            time_data['last_week'] = time_data['current_week']
-            schedule = time_data['sleep_schedule']
-            if schedule == SleepSchedule.CRUNCH.value:
-                time_data['crunch_weeks'] += 1
+        if weeks:
+            time_data.last_week = time_data.current_week
+            if time_data.sleep_schedule == SleepSchedule.CRUNCH.value:
+                time_data.crunch_weeks += weeks
             else:
-                time_data['crunch_weeks'] = 0
+                time_data.crunch_weeks = 0
 
         # Trigger daily updates for other systems
         if 'hygiene_system' in self.game_data.data:
-            from systems.game_systems import HygieneSystem
             hygiene_system = HygieneSystem(self.game_data)
-            hygiene_system.daily_update()
+            hygiene_system.daily_update(days)
+
+        boundaries['days'] = days
+        boundaries['weeks'] = weeks
+        boundaries['months'] = months
+        boundaries['years'] = [entered_year for entered_year, entered_month in months if entered_month == 1]
+
+        for listener in self.boundary_listeners:
+            listener(boundaries)
+
+        return boundaries
+
+    def add_boundary_listener(self, listener):
+        """Register a callable that receives advance_days' boundaries dict whenever days pass"""
+        self.boundary_listeners.append(listener)
+
+    def remove_boundary_listener(self, listener):
+        """Unregister a boundary listener"""
+        if listener in self.boundary_listeners:
+            self.boundary_listeners.remove(listener)
+
+    def count_week_starts(self, after, until):
+        """Count days in (after, until] that fall on the 1st, 8th, 15th, 22nd or 29th"""
+        count = 0
+        year, month = after.year, after.month
+        while (year, month) <= (until.year, until.month):
+            first = after.day + 1 if (year, month) == (after.year, after.month) else 1
+            last = until.day if (year, month) == (until.year, until.month) else self.get_days_in_month(month, year)
+            count += sum(1 for week_start in (1, 8, 15, 22, 29) if first <= week_start <= last)
+
+            month += 1
+            if month > 12:
+                month = 1
+                year += 1
+        return count
 
     def get_days_in_month(self, month, year):
         """Get number of days in a given month"""
@@ -222,11 +294,11 @@ class TimeSystem:
         """Advance game time by specified hours (for sleep, etc.)"""
         self.advance_time_minutes(hours * 60)
         # Reset seconds after sleeping
-        self.game_data.data['time']['second'] = 0
+        self.state.second = 0
 
     def get_schedule_info(self):
         """Get current schedule information"""
-        schedule_name = self.game_data.data['time']['sleep_schedule']
+        schedule_name = self.state.sleep_schedule
         return self.schedules.get(schedule_name, self.schedules[SleepSchedule.NORMAL.value])
 
     def set_schedule(self, schedule_type):
@@ -243,9 +315,9 @@ class TimeSystem:
 
     def get_time_string(self):
         """Get formatted time string"""
-        time_data = self.game_data.data['time']
-        hour = int(time_data.get('hour', 8))
-        minute = int(time_data.get('minute', 0))
+        time_data = self.state
+        hour = int(time_data.hour)
+        minute = int(time_data.minute)
         am_pm = "AM" if hour < 12 else "PM"
         display_hour = hour if hour <= 12 else hour - 12
         if display_hour == 0:
@@ -253,14 +325,19 @@ class TimeSystem:
 
         return f"{display_hour:02d}:{minute:02d} {am_pm}"
 
+    def get_iso_date(self):
+        """Get the current game date as 'YYYY-MM-DD'"""
+        time_data = self.state
+        return f"{time_data.year:04d}-{time_data.month:02d}-{time_data.day:02d}"
+
     def get_date_string(self):
         """Get formatted date string"""
-        time_data = self.game_data.data['time']
+        time_data = self.state
         months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        month = months[time_data.get('month', 1) - 1]
-        day = time_data.get('day', 1)
-        year = time_data.get('year', 1978)
+        month = months[time_data.month - 1]
+        day = time_data.day
+        year = time_data.year
         return f"{month} {day}, {year}"
 
 class EnergySystem:
@@ -414,25 +491,29 @@ class HygieneSystem:
 
         return True, f"Quick freshening up! Hygiene: {self.get_hygiene()}%"
 
-    def daily_degradation(self):
-        """Daily hygiene degradation"""
+    def daily_degradation(self, days=1):
+        """Daily hygiene degradation (for one or more days at once)"""
         hygiene_data = self.game_data.data['hygiene_system']
 
         # Hygiene decreases by 1% daily
-        base_decrease = 1
+        base_decrease = days
 
-        # Worse if haven't showered in days
+        # Worse if haven't showered in days: +0.5% for each day past 3,
+        # summed over the days_since_shower values these days go through
         days_since_shower = hygiene_data['last_shower_day']
-        if days_since_shower > 3:
-            # After 3 days, increase degradation
-            base_decrease += (days_since_shower - 3) * 0.5
+        first_late = max(days_since_shower, 4)
+        last_late = days_since_shower + days - 1
+        if last_late >= first_late:
+            late_days = last_late - first_late + 1
+            base_decrease += (first_late - 3 + last_late - 3) * late_days / 2 * 0.5
 
+        # Hygiene only goes down here, so clamping once matches clamping daily
         self.set_hygiene(self.get_hygiene() - base_decrease)
-        hygiene_data['last_shower_day'] += 1
+        hygiene_data['last_shower_day'] += days
 
-    def daily_update(self):
+    def daily_update(self, days=1):
         """Daily update for hygiene system"""
-        self.daily_degradation()
+        self.daily_degradation(days)
 
     def get_recruitment_modifier(self):
         """Get modifier for NPC recruitment based on hygiene"""
@@ -471,34 +552,39 @@ class HappinessSystem:
 
         # Initialize happiness data if not present
         if 'happiness_system' not in self.game_data.data:
-            self.game_data.data['happiness_system'] = {
-                'current_happiness': 60,  # Start at 60%
-                'max_happiness': 100,
-                'relationships': {
+            self.game_data.data['happiness_system'] = HappinessState(
+                current_happiness=60,  # Start at 60%
+                max_happiness=100,
+                relationships={
                     'friends': 0,  # Number of friends
                     'romantic_partner': None,  # None, 'girlfriend', 'wife'
                     'family_contact': True  # In contact with family
                 },
-                'recent_activities': [],  # Track recent fun activities
-                'last_social_day': 0  # Days since last social interaction
-            }
+                recent_activities=[],  # Track recent fun activities
+                last_social_day=0  # Days since last social interaction
+            )
+
+    @property
+    def state(self) -> HappinessState:
+        """The happiness section as a typed record"""
+        return ensure_state(self.game_data.data, 'happiness_system')
 
     def get_happiness(self):
         """Get current happiness level"""
-        return self.game_data.data['happiness_system']['current_happiness']
+        return self.state.current_happiness
 
     def set_happiness(self, value):
         """Set happiness to specific value"""
-        happiness_data = self.game_data.data['happiness_system']
-        happiness_data['current_happiness'] = max(0, min(happiness_data['max_happiness'], value))
+        happiness_data = self.state
+        happiness_data.current_happiness = max(0, min(happiness_data.max_happiness, value))
 
     def calculate_happiness(self):
         """Calculate happiness based on various factors"""
-        happiness_data = self.game_data.data['happiness_system']
+        happiness_data = self.state
         base_happiness = 30  # Base level
 
         # Relationship bonuses
-        relationships = happiness_data['relationships']
+        relationships = happiness_data.relationships
 
         # Friends bonus (max +20)
         friend_bonus = min(20, relationships['friends'] * 4)
@@ -538,13 +624,13 @@ class HappinessSystem:
             base_happiness -= 10
 
         # Social isolation penalty
-        days_since_social = happiness_data['last_social_day']
+        days_since_social = happiness_data.last_social_day
         if days_since_social > 7:
             base_happiness -= min(20, (days_since_social - 7) * 2)
 
         # Recent activities bonus (temporary)
-        if len(happiness_data['recent_activities']) > 0:
-            base_happiness += min(10, len(happiness_data['recent_activities']) * 3)
+        if len(happiness_data.recent_activities) > 0:
+            base_happiness += min(10, len(happiness_data.recent_activities) * 3)
 
         # Update happiness
         self.set_happiness(base_happiness)
@@ -601,14 +687,14 @@ class HappinessSystem:
 
     def daily_update(self):
         """Daily happiness update"""
-        happiness_data = self.game_data.data['happiness_system']
+        happiness_data = self.state
 
         # Increment days since social interaction
-        happiness_data['last_social_day'] += 1
+        happiness_data.last_social_day += 1
 
         # Recent activities fade over time
-        if len(happiness_data['recent_activities']) > 0 and happiness_data['last_social_day'] > 3:
-            happiness_data['recent_activities'].pop(0)
+        if len(happiness_data.recent_activities) > 0 and happiness_data.last_social_day > 3:
+            happiness_data.recent_activities.pop(0)
 
         # Recalculate happiness
         self.calculate_happiness()
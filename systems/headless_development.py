@@ -0,0 +1,224 @@
+"""
+Headless Development Simulator
+Runs complete Planning -> Development -> Production -> Bug Squashing cycles without Tk,
+using the same stage logic as MultiStageDevelopment, for balancing and regression tests
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from systems.points_generation import BounceCalculator, DeveloperStats, create_player_developer
+from systems.stage_scoring import StageScoreCalculator, DevelopmentStage
+from systems.game_development import GameDevelopment, GameScore, GameRating
+from systems.rng_system import RNGSystem
+
+
+class HeadlessGameData:
+    """Minimal stand-in for GameData when no save is loaded"""
+
+    def __init__(self, year: int = 1984):
+        self.data = {
+            'game_time': {
+                'start_date': f'{year}-01-01',
+                'current_date': f'{year}-01-01'
+            },
+            'time': {'year': year}
+        }
+
+
+@dataclass
+class StageResult:
+    """Outcome of a single development stage"""
+    stage: DevelopmentStage
+    developer: str
+    bounces: int
+    bounce_scores: List[int]
+    points: Dict[str, int]
+    bugs: int  # Bugs outstanding when the stage finished
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of a complete game development cycle"""
+    score: GameScore
+    bugs: int
+    rating: GameRating
+    stages: List[StageResult] = field(default_factory=list)
+    review: Optional[Dict] = None  # GameRatingSystem.calculate_overall_rating output, if requested
+    project: str = ''
+    seed: int = 0  # Project seed - simulate(project=..., seed=...) replays this run exactly
+
+
+class HeadlessDevelopment:
+    """Drives the multi-stage development logic without any UI"""
+
+    STAGES = list(DevelopmentStage)
+
+    def __init__(self, game_data=None, year: Optional[int] = None, seed: Optional[int] = None):
+        self.game_data = game_data or HeadlessGameData(year or 1984)
+        self.year = year or self._get_current_year()
+        self.rng_system = RNGSystem(self.game_data, master_seed=seed)
+        self.runs = 0
+
+        # Built once and reused - GameDevelopment reads the thresholds CSV on creation
+        self.bounce_calculator = BounceCalculator()
+        self.bounce_rng = None
+        self.score_calculator = StageScoreCalculator(self.game_data)
+        self.game_development = GameDevelopment(self.game_data)
+        self.rating_system = None
+
+    def _get_current_year(self) -> int:
+        """Get the current game year"""
+        if 'game_time' in self.game_data.data:
+            date_str = self.game_data.data['game_time'].get('current_date', '1984-01-01')
+            return int(date_str.split('-')[0])
+        return 1984
+
+    def run_stage(self, stage: DevelopmentStage, developer_stats: DeveloperStats,
+                  bugs: int = 0) -> StageResult:
+        """
+        Run one stage the way DevelopmentStageWindow does, minus the animation
+
+        Args:
+            stage: Stage to run
+            developer_stats: Lead developer (or averaged team) for the stage
+            bugs: Bugs carried into the stage
+
+        Returns:
+            StageResult with the points earned and bugs left
+        """
+        max_bounces, _ = self.bounce_calculator.calculate_bounces(developer_stats, self.bounce_rng)
+        bounce_scores = self.score_calculator.precalculate_stage_scores(
+            stage, developer_stats, max_bounces, self.year
+        )
+        if not bounce_scores:
+            bounce_scores = [2] * max(1, max_bounces)
+        else:
+            bounce_scores = [max(2, score) for score in bounce_scores]
+
+        points = {category: 0 for category in StageScoreCalculator.CATEGORIES}
+        for total_points in bounce_scores:
+            for category, value in self.score_calculator.split_bounce_points(total_points, stage).items():
+                points[category] += value
+            bugs += self.score_calculator.roll_bounce_bugs(stage, bugs)
+
+        return StageResult(
+            stage=stage,
+            developer=developer_stats.name,
+            bounces=max_bounces,
+            bounce_scores=bounce_scores,
+            points=points,
+            bugs=bugs
+        )
+
+    def simulate(self, developers: Optional[Dict[DevelopmentStage, DeveloperStats]] = None,
+                 game_specs: Optional[Dict] = None, project: Optional[str] = None,
+                 seed: Optional[int] = None) -> SimulationResult:
+        """
+        Simulate a full development cycle
+
+        Bugs carry over from stage to stage so Bug Squashing has something to fix;
+        each remaining bug costs 2 technical points, as in MultiStageDevelopment.
+
+        Args:
+            developers: Optional stage -> developer mapping (defaults to the player everywhere)
+            game_specs: Optional specs for a GameRatingSystem review; the simulated
+                        bug count is filled in automatically
+            project: Project key for the RNG streams (defaults to a new one per run)
+            seed: Project seed to replay a recorded run
+
+        Returns:
+            SimulationResult with final scores, rating and per-stage breakdown
+        """
+        developers = developers or {}
+        self.runs += 1
+        project = project or f"simulation-{self.runs}"
+        project_seed = self.use_project_streams(project, seed)
+
+        totals = {category: 0 for category in StageScoreCalculator.CATEGORIES}
+        stages = []
+        bugs = 0
+
+        for stage in self.STAGES:
+            developer_stats = developers.get(stage)
+            if developer_stats is None:
+                developer_stats = create_player_developer()
+                if stage == DevelopmentStage.BUG_SQUASHING:
+                    developer_stats.name = "Entire Team"
+
+            stage_result = self.run_stage(stage, developer_stats, bugs)
+            for category, value in stage_result.points.items():
+                totals[category] += value
+            bugs = stage_result.bugs
+            stages.append(stage_result)
+
+        # Each remaining bug reduces technical score
+        if bugs > 0:
+            totals['technical'] = max(0, totals['technical'] - bugs * 2)
+
+        score = GameScore(**totals)
+        rating = self.game_development.get_game_rating(score, self.year)
+
+        review = None
+        if game_specs is not None:
+            if self.rating_system is None:
+                from games.rating_system import GameRatingSystem
+                self.rating_system = GameRatingSystem(self.game_data)
+            self.rating_system.rng = self.rng_system.stream(RNGSystem.RATING, project)
+            review = self.rating_system.calculate_overall_rating(dict(game_specs, bugs=bugs))
+
+        # Seed stays recorded, streams are no longer needed
+        self.rng_system.release_project(project)
+
+        return SimulationResult(score=score, bugs=bugs, rating=rating, stages=stages, review=review,
+                                project=project, seed=project_seed)
+
+    def use_project_streams(self, project: str, seed: Optional[int] = None) -> int:
+        """Point every calculator at the project's own random streams"""
+        project_seed = self.rng_system.start_project(project, seed)
+
+        self.bounce_rng = self.rng_system.stream(RNGSystem.BOUNCES, project)
+        self.score_calculator.rng = self.rng_system.stream(RNGSystem.STAGE_SCORING, project)
+        self.game_development.rng = self.rng_system.stream(RNGSystem.GAME_DEVELOPMENT, project)
+
+        return project_seed
+
+    def simulate_many(self, count: int,
+                      developers: Optional[Dict[DevelopmentStage, DeveloperStats]] = None) -> List[SimulationResult]:
+        """Simulate several independent development cycles"""
+        return [self.simulate(developers) for _ in range(count)]
+
+    @staticmethod
+    def summarize(results: List[SimulationResult]) -> Dict:
+        """Summarize a batch of results for balance work"""
+        if not results:
+            return {'runs': 0, 'ratings': {}, 'average_total': 0.0, 'average_bugs': 0.0}
+
+        ratings = Counter(result.rating.value for result in results)
+        return {
+            'runs': len(results),
+            'ratings': {rating.value: ratings.get(rating.value, 0) for rating in GameRating},
+            'average_total': sum(result.score.total for result in results) / len(results),
+            'average_bugs': sum(result.bugs for result in results) / len(results)
+        }
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    for year in [1978, 1988, 2000]:
+        simulator = HeadlessDevelopment(year=year)
+
+        start = time.perf_counter()
+        results = simulator.simulate_many(5000)
+        elapsed = time.perf_counter() - start
+
+        summary = HeadlessDevelopment.summarize(results)
+        print(f"{year}: {summary['runs']} games in {elapsed:.2f}s "
+              f"({summary['runs'] / elapsed:,.0f}/s), avg total {summary['average_total']:.1f}, "
+              f"avg bugs {summary['average_bugs']:.1f}")
+        for rating, count in summary['ratings'].items():
+            if count:
+                print(f"  {rating:12} {count}")
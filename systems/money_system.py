@@ -4,38 +4,100 @@ Handles cash, bank balance, transactions, and financial history
 """
 
 import json
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import date, datetime
 from pathlib import Path
 
+from systems.game_state import MoneyState, ensure_state
+
+
+class TransactionLedger:
+    """
+    Time-ordered index over the saved transaction list
+    Dates are parsed once into ordinals; expiry moves a head pointer and
+    windowed reads are bisects, so cost doesn't grow with the history
+    """
+
+    def __init__(self, history):
+        """
+        Args:
+            history: The saved transaction list (oldest first) - stays the storage
+        """
+        self.history = history
+        self.ordinals = []  # Date ordinal of each history entry (never decreasing)
+        self.head = 0  # Entries before this have expired
+        for transaction in history:
+            self._index(transaction)
+        self.last = history[-1] if history else None  # Newest entry this ledger has seen
+
+    def _index(self, transaction):
+        ordinal = date.fromisoformat(transaction['date']).toordinal()
+        # Keep the index sorted even if the calendar was ever set back
+        if self.ordinals and ordinal < self.ordinals[-1]:
+            ordinal = self.ordinals[-1]
+        self.ordinals.append(ordinal)
+
+    def is_for(self, history):
+        """Check the ledger still indexes this exact list, untouched from outside"""
+        return (self.history is history and len(self.ordinals) == len(history) and
+                (history[-1] if history else None) is self.last)
+
+    def append(self, transaction):
+        self.history.append(transaction)
+        self._index(transaction)
+        self.last = transaction
+
+    def expire_through(self, cutoff_ordinal):
+        """Expire every transaction dated on or before the cutoff day"""
+        self.head = max(self.head, bisect_right(self.ordinals, cutoff_ordinal, self.head))
+
+        # Drop the expired prefix once it's half the list (amortized O(1) per expiry)
+        if self.head and self.head * 2 >= len(self.ordinals):
+            del self.history[:self.head]
+            del self.ordinals[:self.head]
+            self.head = 0
+
+    def since(self, cutoff_ordinal):
+        """Live transactions dated after the cutoff day, oldest first"""
+        start = bisect_right(self.ordinals, cutoff_ordinal, self.head)
+        return self.history[start:]
+
+
 class MoneySystem:
     """Manages player's money including cash and bank accounts"""
 
     def __init__(self, game_data):
         self.game_data = game_data
+        self.ledger = None  # TransactionLedger over the history, built on first use
         self.initialize_money_data()
 
     def initialize_money_data(self):
         """Initialize money data if not present"""
         if 'money' not in self.game_data.data:
-            self.game_data.data['money'] = {
-                'cash_on_hand': 30,
-                'bank_balance': 1500,
-                'monthly_rent': 150,
-                'transaction_history': [],
-                'recurring_expenses': [
+            self.game_data.data['money'] = MoneyState(
+                cash_on_hand=30,
+                bank_balance=1500,
+                monthly_rent=150,
+                transaction_history=[],
+                recurring_expenses=[
                     {'name': 'Apartment Rent', 'amount': 150, 'day_of_month': 1}
                 ],
-                'last_rent_paid': None
-            }
+                last_rent_paid=None
+            )
             # GameData doesn't have save_game method, data is saved elsewhere
 
+    @property
+    def state(self) -> MoneyState:
+        """The money section as a typed record"""
+        return ensure_state(self.game_data.data, 'money')
+
     def get_cash(self):
         """Get current cash on hand"""
-        return self.game_data.data['money']['cash_on_hand']
+        return self.state.cash_on_hand
 
     def get_bank_balance(self):
         """Get current bank balance"""
-        return self.game_data.data['money']['bank_balance']
+        return self.state.bank_balance
 
     def get_total_money(self):
         """Get total money (cash + bank)"""
@@ -49,8 +111,8 @@ class MoneySystem:
         if amount > self.get_bank_balance():
             return False, "Insufficient funds in bank"
 
-        self.game_data.data['money']['bank_balance'] -= amount
-        self.game_data.data['money']['cash_on_hand'] += amount
+        self.state.bank_balance -= amount
+        self.state.cash_on_hand += amount
 
         # Record transaction
         self.add_transaction('Withdrawal', -amount, 'bank')
@@ -67,8 +129,8 @@ class MoneySystem:
         if amount > self.get_cash():
             return False, "Insufficient cash on hand"
 
-        self.game_data.data['money']['cash_on_hand'] -= amount
-        self.game_data.data['money']['bank_balance'] += amount
+        self.state.cash_on_hand -= amount
+        self.state.bank_balance += amount
 
         # Record transaction
         self.add_transaction('Deposit', -amount, 'cash')
@@ -85,12 +147,12 @@ class MoneySystem:
         if from_cash:
             if amount > self.get_cash():
                 return False, "Insufficient cash on hand"
-            self.game_data.data['money']['cash_on_hand'] -= amount
+            self.state.cash_on_hand -= amount
             self.add_transaction(description, -amount, 'cash')
         else:
             if amount > self.get_bank_balance():
                 return False, "Insufficient funds in bank"
-            self.game_data.data['money']['bank_balance'] -= amount
+            self.state.bank_balance -= amount
             self.add_transaction(description, -amount, 'bank')
 
         # Data is saved elsewhere, not here
@@ -102,91 +164,164 @@ class MoneySystem:
             return False, "Invalid amount"
 
         if to_bank:
-            self.game_data.data['money']['bank_balance'] += amount
+            self.state.bank_balance += amount
             self.add_transaction(description, amount, 'bank')
         else:
-            self.game_data.data['money']['cash_on_hand'] += amount
+            self.state.cash_on_hand += amount
             self.add_transaction(description, amount, 'cash')
 
         # Data is saved elsewhere, not here
         return True, f"Earned ${amount} from {description}"
 
+    @staticmethod
+    def date_of(data):
+        """Current date of a game data dict as 'YYYY-MM-DD' (the clock's date when there is one)"""
+        if data.get('time'):
+            time_data = ensure_state(data, 'time')
+            return f"{time_data.year:04d}-{time_data.month:02d}-{time_data.day:02d}"
+        if 'game_time' in data:
+            return data['game_time'].get('current_date', '1984-01-01')
+        return '1984-01-01'
+
+    def get_current_date(self):
+        """Get the current game date as 'YYYY-MM-DD'"""
+        return self.date_of(self.game_data.data)
+
+    def get_ledger(self):
+        """Get the indexed ledger over the saved transaction history"""
+        money_data = self.game_data.data['money']
+        if 'transaction_history' not in money_data:
+            money_data['transaction_history'] = []
+        history = money_data['transaction_history']
+
+        # Rebuilt when another MoneySystem (bank, turbo...) or a load changed the list
+        if self.ledger is None or not self.ledger.is_for(history):
+            self.ledger = TransactionLedger(history)
+        return self.ledger
+
+    def _cutoff_ordinal(self, days):
+        """Date ordinal `days` before today - transactions on later days are kept"""
+        return date.fromisoformat(self.get_current_date()).toordinal() - days
+
     def add_transaction(self, description, amount, account_type):
         """Add a transaction to history"""
-        from systems.game_systems import TimeSystem
-
-        # Get current game date
-        if 'game_time' in self.game_data.data:
-            current_date = self.game_data.data['game_time'].get('current_date', '1984-01-01')
-        else:
-            current_date = '1984-01-01'
-
         transaction = {
-            'date': current_date,
+            'date': self.get_current_date(),
             'description': description,
             'amount': amount,
             'account': account_type,
             'balance_after': self.get_bank_balance() if account_type == 'bank' else self.get_cash()
         }
 
-        if 'transaction_history' not in self.game_data.data['money']:
-            self.game_data.data['money']['transaction_history'] = []
+        self.add_to_monthly_totals(transaction)
+        self.get_ledger().append(transaction)
 
-        self.game_data.data['money']['transaction_history'].append(transaction)
+        # Autosave journal: the transaction and the balances and totals it changed
+        journal = getattr(self.game_data, 'journal', None)
+        if journal:
+            money_data = self.game_data.data['money']
+            month_key = transaction['date'][:7]
+            journal.record_append(['money', 'transaction_history'], transaction)
+            journal.record_set(['money', 'cash_on_hand'], money_data['cash_on_hand'])
+            journal.record_set(['money', 'bank_balance'], money_data['bank_balance'])
+            journal.record_set(['money', 'monthly_totals', month_key], money_data['monthly_totals'][month_key])
 
         # Keep only last 90 days of transactions
         self.cleanup_old_transactions()
 
     def cleanup_old_transactions(self):
         """Remove transactions older than 3 months"""
-        if 'transaction_history' not in self.game_data.data['money']:
+        self.get_ledger().expire_through(self._cutoff_ordinal(90))
+
+    @classmethod
+    def trim_expired(cls, data, days=90):
+        """
+        Drop expired transactions from a game data dict now - while playing they are only
+        dropped once they make up half the history, so call this before writing a save
+
+        Args:
+            data: Game data dict with a 'money' section
+            days: Transactions on days after this many days ago are kept
+        """
+        history = data['money'].get('transaction_history')
+        if not history:
             return
+        cutoff = date.fromisoformat(cls.date_of(data)).toordinal() - days
 
-        # Get current game date
-        if 'game_time' in self.game_data.data:
-            current_date = self.game_data.data['game_time'].get('current_date', '1984-01-01')
-        else:
-            current_date = '1984-01-01'
-
-        # Convert to datetime
-        current = datetime.strptime(current_date, '%Y-%m-%d')
-        cutoff = current - timedelta(days=90)
-
-        # Filter transactions
-        self.game_data.data['money']['transaction_history'] = [
-            t for t in self.game_data.data['money']['transaction_history']
-            if datetime.strptime(t['date'], '%Y-%m-%d') > cutoff
-        ]
+        # Same rule as the ledger: the history is oldest first
+        expired = 0
+        for transaction in history:
+            if date.fromisoformat(transaction['date']).toordinal() > cutoff:
+                break
+            expired += 1
+        if expired:
+            del history[:expired]
 
     def get_transaction_history(self, days=90):
         """Get transaction history for last N days"""
         if 'transaction_history' not in self.game_data.data['money']:
             return []
 
-        # Get current game date
-        if 'game_time' in self.game_data.data:
-            current_date = self.game_data.data['game_time'].get('current_date', '1984-01-01')
+        return self.get_ledger().since(self._cutoff_ordinal(days))
+
+    def get_monthly_totals_data(self):
+        """
+        Get the running per-month totals kept in the save
+        ({'YYYY-MM': {'income', 'expenses', 'count'}}), built once from history for old saves
+        """
+        money_data = self.game_data.data['money']
+        if 'monthly_totals' not in money_data:
+            money_data['monthly_totals'] = {}
+            for transaction in money_data.get('transaction_history', []):
+                self.add_to_monthly_totals(transaction)
+        return money_data['monthly_totals']
+
+    def add_to_monthly_totals(self, transaction):
+        """Add one transaction to its month's running totals"""
+        monthly_totals = self.get_monthly_totals_data()
+        month_key = transaction['date'][:7]
+        if month_key not in monthly_totals:
+            monthly_totals[month_key] = {'income': 0, 'expenses': 0, 'count': 0}
+
+        totals = monthly_totals[month_key]
+        if transaction['amount'] > 0:
+            totals['income'] += transaction['amount']
         else:
-            current_date = '1984-01-01'
-
-        current = datetime.strptime(current_date, '%Y-%m-%d')
-        cutoff = current - timedelta(days=days)
-
-        # Filter and return transactions
-        return [
-            t for t in self.game_data.data['money']['transaction_history']
-            if datetime.strptime(t['date'], '%Y-%m-%d') > cutoff
-        ]
+            totals['expenses'] += abs(transaction['amount'])
+        totals['count'] += 1
+
+    def get_monthly_totals(self, months=3):
+        """
+        Get income and expense totals for the current calendar month and the ones before it,
+        without touching transactions
+        Months are whole, so the oldest one can reach back further than the 90 days
+        of transaction history; months without transactions are left out
+
+        Args:
+            months: Number of calendar months, counting the current one
+
+        Returns:
+            Dict of 'YYYY-MM' -> {'income', 'expenses', 'count'}, newest first
+        """
+        monthly_totals = self.get_monthly_totals_data()
+        year, month = (int(part) for part in self.get_current_date().split('-')[:2])
+
+        recent = {}
+        for _ in range(months):
+            month_key = f"{year:04d}-{month:02d}"
+            if month_key in monthly_totals:
+                recent[month_key] = dict(monthly_totals[month_key])
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        return recent
 
     def get_monthly_summary(self):
         """Get income and expenses summary for last 3 months"""
         transactions = self.get_transaction_history(90)
 
-        # Group by month
+        # Group by month ('YYYY-MM' prefix of the date)
         monthly_data = {}
         for trans in transactions:
-            date = datetime.strptime(trans['date'], '%Y-%m-%d')
-            month_key = date.strftime('%Y-%m')
+            month_key = trans['date'][:7]
 
             if month_key not in monthly_data:
                 monthly_data[month_key] = {
@@ -210,12 +345,12 @@ class MoneySystem:
             self.game_data.data['money']['last_rent_paid'] = None
 
         # Parse current date
-        date = datetime.strptime(current_date, '%Y-%m-%d')
-        current_month = date.strftime('%Y-%m')
+        today = datetime.strptime(current_date, '%Y-%m-%d')
+        current_month = today.strftime('%Y-%m')
 
         # Check if rent needs to be paid
         last_rent = self.game_data.data['money']['last_rent_paid']
-        if last_rent != current_month and date.day >= 1:
+        if last_rent != current_month and today.day >= 1:
             # Pay rent
             rent_amount = self.game_data.data['money']['monthly_rent']
 
@@ -223,6 +358,8 @@ class MoneySystem:
             if self.get_bank_balance() >= rent_amount:
                 self.spend_money(rent_amount, 'Apartment Rent', from_cash=False)
                 self.game_data.data['money']['last_rent_paid'] = current_month
+                if getattr(self.game_data, 'journal', None):
+                    self.game_data.journal.record_set(['money', 'last_rent_paid'], current_month)
                 return True, f"Rent of ${rent_amount} paid from bank account"
             elif self.get_total_money() >= rent_amount:
                 # Try to use cash + bank
@@ -10,6 +10,8 @@ from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from datetime import datetime, timedelta
 
+import numpy as np
+
 class DeveloperSkill(Enum):
     """Developer skill categories"""
     ENGINEERING = "engineering"
@@ -135,9 +137,114 @@ class TeamMorale:
             # Linear scale between 0.8 and 1.2
             return 0.8 + (morale / 100) * 0.4
 
+def _lead_attr(attribute: str):
+    """Extractor for a lead developer attribute (None without a lead)"""
+    def extract(context: Dict):
+        lead = context.get("lead_developer")
+        return getattr(lead, attribute) if lead else None
+    return extract
+
+def _team_tenure(context: Dict):
+    """Shortest tenure on the team (None for an empty team)"""
+    team = context.get("team") or []
+    return min(dev.months_with_company for dev in team) if team else None
+
+def _at_least(default=None, scale=1):
+    """Predicate factory: field >= value (missing fields use default, or fail)"""
+    def factory(condition_value):
+        threshold = condition_value * scale
+        return lambda value: (default if value is None else value) is not None and \
+            (default if value is None else value) >= threshold
+    return factory
+
+def _at_most(default=None):
+    """Predicate factory: field <= value (missing fields use default, or fail)"""
+    def factory(condition_value):
+        return lambda value: (default if value is None else value) is not None and \
+            (default if value is None else value) <= condition_value
+    return factory
+
+def _equals(condition_value):
+    """Predicate factory: field == value"""
+    return lambda value: value == condition_value
+
+def _one_of(condition_value):
+    """Predicate factory: field in value (or == for a single value)"""
+    if isinstance(condition_value, list):
+        return lambda value: value in condition_value
+    return lambda value: value == condition_value
+
+# Context fields that event conditions depend on, and how to read them
+EVENT_CONTEXT_FIELDS = {
+    "morale": lambda context: context.get("morale"),
+    "team_tenure": _team_tenure,
+    "team_size": lambda context: len(context.get("team") or []),
+    "research": _lead_attr("research"),
+    "engineering": _lead_attr("engineering"),
+    "communication": _lead_attr("communication"),
+    "leadership": _lead_attr("leadership"),
+    "lead_tenure": _lead_attr("months_with_company"),
+    "projects_completed": _lead_attr("projects_completed"),
+    "consecutive_projects": _lead_attr("consecutive_projects"),
+    "consecutive_successes": lambda context: context.get("consecutive_successes", 0),
+    "bug_count": lambda context: context.get("bug_count", 0),
+    "stage": lambda context: context.get("stage"),
+    "last_rating": lambda context: context.get("last_rating"),
+    "year": lambda context: context.get("year"),
+    "day_of_week": lambda context: context.get("day_of_week"),
+    "month": lambda context: context.get("month", 1),
+    "engine": lambda context: context.get("engine"),
+    "has_backup": lambda context: context.get("has_backup", False),
+    "reputation": lambda context: context.get("reputation", 0),
+}
+
+# Event condition name -> (context field, predicate factory)
+EVENT_CONDITIONS = {
+    # Morale conditions
+    "min_morale": ("morale", _at_least(default=0)),
+    "max_morale": ("morale", _at_most(default=100)),
+
+    # Team conditions
+    "min_team_tenure": ("team_tenure", _at_least()),
+    "min_team_size": ("team_size", _at_least()),
+
+    # Skill conditions
+    "min_research": ("research", _at_least()),
+    "min_engineering": ("engineering", _at_least()),
+    "max_engineering": ("engineering", _at_most()),
+    "min_communication": ("communication", _at_least()),
+    "max_communication": ("communication", _at_most()),
+    "min_leadership": ("leadership", _at_least()),
+
+    # Experience conditions
+    "min_experience": ("lead_tenure", _at_least(scale=4)),  # Convert to months
+    "min_projects_completed": ("projects_completed", _at_least()),
+    "min_consecutive_projects": ("consecutive_projects", _at_least()),
+    "min_consecutive_successes": ("consecutive_successes", _at_least()),
+
+    # Game state conditions
+    "has_bugs": ("bug_count", lambda condition_value: lambda value: value > 0),
+    "stage": ("stage", _equals),
+    "last_rating": ("last_rating", _one_of),
+
+    # Time conditions
+    "min_year": ("year", _at_least(default=1978)),
+    "max_year": ("year", _at_most(default=2024)),
+    "friday": ("day_of_week", lambda condition_value: lambda value: value == "Friday"),
+    "summer": ("month", lambda condition_value: lambda value: value in (6, 7, 8)),
+
+    # Other conditions
+    "engine": ("engine", _equals),
+    "no_backup": ("has_backup", lambda condition_value: lambda value: not value),
+    "min_reputation": ("reputation", _at_least()),
+}
+
 class RandomEvent:
     """Random events during development with conditional requirements"""
 
+    # Compiled EventIndex shared by check_for_event
+    _event_index = None
+
     @staticmethod
     def get_all_events():
         """Get all possible events with their conditions"""
@@ -394,122 +501,103 @@ class RandomEvent:
     @staticmethod
     def check_condition(condition_name: str, condition_value, context: Dict) -> bool:
         """Check if a single condition is met"""
+        if condition_name not in EVENT_CONDITIONS:
+            return True  # Unknown conditions pass by default
 
-        # Morale conditions
-        if condition_name == "min_morale":
-            return context.get("morale", 0) >= condition_value
-        elif condition_name == "max_morale":
-            return context.get("morale", 100) <= condition_value
-
-        # Team conditions
-        elif condition_name == "min_team_tenure":
-            team = context.get("team", [])
-            if not team:
-                return False
-            return all(dev.months_with_company >= condition_value for dev in team)
-        elif condition_name == "min_team_size":
-            return len(context.get("team", [])) >= condition_value
-
-        # Skill conditions
-        elif condition_name == "min_research":
-            lead = context.get("lead_developer")
-            return lead and lead.research >= condition_value
-        elif condition_name == "min_engineering":
-            lead = context.get("lead_developer")
-            return lead and lead.engineering >= condition_value
-        elif condition_name == "max_engineering":
-            lead = context.get("lead_developer")
-            return lead and lead.engineering <= condition_value
-        elif condition_name == "min_communication":
-            lead = context.get("lead_developer")
-            return lead and lead.communication >= condition_value
-        elif condition_name == "max_communication":
-            lead = context.get("lead_developer")
-            return lead and lead.communication <= condition_value
-        elif condition_name == "min_leadership":
-            lead = context.get("lead_developer")
-            return lead and lead.leadership >= condition_value
-
-        # Experience conditions
-        elif condition_name == "min_experience":
-            lead = context.get("lead_developer")
-            return lead and lead.months_with_company >= condition_value * 4  # Convert to months
-        elif condition_name == "min_projects_completed":
-            lead = context.get("lead_developer")
-            return lead and lead.projects_completed >= condition_value
-        elif condition_name == "min_consecutive_projects":
-            lead = context.get("lead_developer")
-            return lead and lead.consecutive_projects >= condition_value
-        elif condition_name == "min_consecutive_successes":
-            return context.get("consecutive_successes", 0) >= condition_value
-
-        # Game state conditions
-        elif condition_name == "has_bugs":
-            return context.get("bug_count", 0) > 0
-        elif condition_name == "stage":
-            return context.get("stage") == condition_value
-        elif condition_name == "last_rating":
-            last_rating = context.get("last_rating")
-            return last_rating in condition_value if isinstance(condition_value, list) else last_rating == condition_value
-
-        # Time conditions
-        elif condition_name == "min_year":
-            return context.get("year", 1978) >= condition_value
-        elif condition_name == "max_year":
-            return context.get("year", 2024) <= condition_value
-        elif condition_name == "friday":
-            return context.get("day_of_week") == "Friday"
-        elif condition_name == "summer":
-            month = context.get("month", 1)
-            return month in [6, 7, 8]
-
-        # Other conditions
-        elif condition_name == "engine":
-            return context.get("engine") == condition_value
-        elif condition_name == "no_backup":
-            return not context.get("has_backup", False)
-        elif condition_name == "min_reputation":
-            return context.get("reputation", 0) >= condition_value
-
-        return True  # Unknown conditions pass by default
+        field_name, factory = EVENT_CONDITIONS[condition_name]
+        return factory(condition_value)(EVENT_CONTEXT_FIELDS[field_name](context))
 
     @staticmethod
-    def check_for_event(context: Dict = None) -> Optional[Dict]:
-        """Check if a random event occurs based on current context"""
-        if context is None:
-            context = {}
+    def get_event_index() -> 'EventIndex':
+        """Get the shared compiled event index (built on first use)"""
+        if RandomEvent._event_index is None:
+            RandomEvent._event_index = EventIndex(RandomEvent.get_all_events())
+        return RandomEvent._event_index
 
-        eligible_events = []
-
-        for event in RandomEvent.get_all_events():
-            # Check if all conditions are met
-            conditions_met = True
-            if "conditions" in event:
-                for cond_name, cond_value in event["conditions"].items():
-                    if not RandomEvent.check_condition(cond_name, cond_value, context):
-                        conditions_met = False
-                        break
+    @staticmethod
+    def check_for_event(context: Dict = None, rng=None) -> Optional[Dict]:
+        """Check if a random event occurs based on current context"""
+        return RandomEvent.get_event_index().check_for_event(context, rng)
+
+class EventIndex:
+    """Random events compiled into predicates, indexed by the context fields they read"""
+
+    def __init__(self, events: List[Dict]):
+        self.events = events
+
+        # Per event: list of (field, predicate); per field: events that read it
+        self.predicates = []
+        self.dependents = {}
+        for event_index, event in enumerate(events):
+            compiled = []
+            for cond_name, cond_value in event.get("conditions", {}).items():
+                if cond_name not in EVENT_CONDITIONS:
+                    continue  # Unknown conditions pass by default
+                field_name, factory = EVENT_CONDITIONS[cond_name]
+                compiled.append((field_name, factory(cond_value)))
+                self.dependents.setdefault(field_name, []).append(event_index)
+            self.predicates.append(compiled)
+
+        self.extractors = [(field_name, EVENT_CONTEXT_FIELDS[field_name]) for field_name in self.dependents]
+        self.values = {}
+        self.eligible = [not compiled for compiled in self.predicates]
+        self.eligible_events = [event for event, ok in zip(events, self.eligible) if ok]
+        self._primed = False
+
+    def update(self, context: Dict) -> List[Dict]:
+        """
+        Re-evaluate only the events whose context fields changed
 
-            # If conditions are met, add to eligible events
-            if conditions_met:
-                eligible_events.append(event)
+        Returns:
+            Eligible events, in definition order
+        """
+        values = self.values
+        dirty = set()
+        for field_name, extract in self.extractors:
+            value = extract(context)
+            if not self._primed or values[field_name] != value:
+                values[field_name] = value
+                dirty.update(self.dependents[field_name])
+        self._primed = True
+
+        if dirty:
+            for event_index in dirty:
+                self.eligible[event_index] = all(
+                    predicate(values[field_name]) for field_name, predicate in self.predicates[event_index]
+                )
+            self.eligible_events = [event for event, ok in zip(self.events, self.eligible) if ok]
+
+        return self.eligible_events
+
+    def check_for_event(self, context: Dict = None, rng=None) -> Optional[Dict]:
+        """Check if a random event occurs based on current context"""
+        rng = rng or random
 
         # Check each eligible event for occurrence
-        for event in eligible_events:
-            if random.random() < event["chance"]:
-                return event
+        for event in self.update(context or {}):
+            if rng.random() < event["chance"]:
+                return dict(event)
 
         return None
 
 class BounceCalculator:
     """Calculates number of bounces based on developer stats"""
 
+    INV_SQRT2 = 1 / math.sqrt(2)
+
+    # Normal CDF lookup table for calculate_bounces_many, built on first use
+    _cdf_grid = None
+
     @staticmethod
-    def calculate_bounces(developer: DeveloperStats) -> Tuple[int, Dict]:
+    def calculate_bounces(developer: DeveloperStats, rng=None) -> Tuple[int, Dict]:
         """
         Calculate number of bounces using bell curve distribution
         Based on composite score (max 60 points)
 
+        Args:
+            developer: Developer to roll for
+            rng: Optional random.Random stream (defaults to the global random module)
+
         Returns: (bounce_count, calculation_details)
         """
         composite_score = developer.get_composite_score()
@@ -522,7 +610,7 @@ class BounceCalculator:
         std_dev = 1.5
 
         # Generate random value from normal distribution
-        random_normal = random.gauss(mean_bounces, std_dev)
+        random_normal = (rng or random).gauss(mean_bounces, std_dev)
 
         # Store the raw value before clamping for accurate percentile
         raw_value = random_normal
@@ -536,30 +624,7 @@ class BounceCalculator:
 
         # Use error function to calculate CDF
         # CDF = 0.5 * (1 + erf(z / sqrt(2)))
-        from scipy import special
-        try:
-            percentile = 50 * (1 + special.erf(z_score / math.sqrt(2)))
-        except:
-            # Fallback if scipy not available - use approximation
-            # Approximation of erf for percentile calculation
-            def erf_approx(x):
-                # Approximation with maximum error of 1.5×10⁻⁷
-                a1 =  0.254829592
-                a2 = -0.284496736
-                a3 =  1.421413741
-                a4 = -1.453152027
-                a5 =  1.061405429
-                p  =  0.3275911
-
-                sign = 1 if x >= 0 else -1
-                x = abs(x)
-
-                t = 1.0 / (1.0 + p * x)
-                y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * math.exp(-x * x)
-
-                return sign * y
-
-            percentile = 50 * (1 + erf_approx(z_score / math.sqrt(2)))
+        percentile = BounceCalculator.normal_percentile(z_score)
 
         # Calculate luck factor
         expected = round(mean_bounces)
@@ -583,14 +648,64 @@ class BounceCalculator:
             }
         }
 
+    @staticmethod
+    def normal_percentile(z_score: float) -> float:
+        """Percentile (0-100) of a z-score under the standard normal CDF"""
+        return 50 * (1 + math.erf(z_score * BounceCalculator.INV_SQRT2))
+
+    @classmethod
+    def calculate_bounces_many(cls, developers, rng=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate bounce counts for a whole roster in one vectorized pass
+        Same bell curve as calculate_bounces, without the per-developer details dict
+
+        Args:
+            developers: Iterable of DeveloperStats, or an array of composite scores (0-60)
+            rng: Optional numpy Generator or seed
+
+        Returns:
+            (bounce_counts, percentiles) arrays in the same order as developers
+        """
+        if not isinstance(rng, np.random.Generator):
+            rng = np.random.default_rng(rng)
+
+        if isinstance(developers, np.ndarray):
+            composite_scores = developers.astype(float)
+        else:
+            composite_scores = np.array([
+                developer.get_composite_score() if isinstance(developer, DeveloperStats) else developer
+                for developer in developers
+            ], dtype=float)
+
+        # Mean bounces based on percentage (max 60 points -> 10 bounces), std dev 1.5
+        mean_bounces = composite_scores / 6.0
+        z_scores = rng.standard_normal(len(composite_scores))
+
+        bounce_counts = np.clip(np.rint(mean_bounces + z_scores * 1.5), 1, 10).astype(np.int64)
+        percentiles = np.round(np.interp(z_scores, *cls._cdf_table()), 1)
+
+        return bounce_counts, percentiles
+
+    @classmethod
+    def _cdf_table(cls):
+        """Cached (z, percentile) grid of the normal CDF for np.interp"""
+        if cls._cdf_grid is None:
+            z_grid = np.linspace(-8.0, 8.0, 4097)
+            cls._cdf_grid = (z_grid, np.array([cls.normal_percentile(z) for z in z_grid]))
+        return cls._cdf_grid
+
 class PointsGenerator:
     """Main class for generating points based on developer stats"""
 
-    def __init__(self, game_data=None):
+    def __init__(self, game_data=None, rng=None, event_rng=None):
         self.game_data = game_data
         self.team_morale = TeamMorale()
         self.bounce_calculator = BounceCalculator()
 
+        # Random streams (see RNGSystem); default to the global random module
+        self.rng = rng or random
+        self.event_rng = event_rng or self.rng
+
     def calculate_stage_points(self,
                               stage: DevelopmentStage,
                               lead_developer: DeveloperStats,
@@ -626,7 +741,7 @@ class PointsGenerator:
         }
 
         # Check for random events with full context
-        event = RandomEvent.check_for_event(event_context)
+        event = RandomEvent.check_for_event(event_context, self.event_rng)
         event_mod = self._get_event_modifier(event) if event else 1.0
 
         # Generate points for each category
@@ -846,25 +961,25 @@ class PointsGenerator:
 
     def _generate_with_variance(self, min_val: int, max_val: int) -> int:
         """Generate points with variance and critical chances"""
-        base = random.randint(min_val, max_val)
+        base = self.rng.randint(min_val, max_val)
 
         # Critical chances (reduced for early years)
         current_year = self._get_current_year()
 
         if current_year <= 1985:
             # Very limited critical chances in early years
-            crit_roll = random.random()
+            crit_roll = self.rng.random()
             if crit_roll < 0.03:  # 3% critical failure
                 base = max(0, base - 1)
             elif crit_roll > 0.97:  # 3% critical success
                 base = min(2, base + 1)  # Still cap at 2 for early years
         else:
             # Standard critical chances
-            crit_roll = random.random()
+            crit_roll = self.rng.random()
             if crit_roll < 0.05:  # 5% critical failure
-                base = max(0, base - random.randint(1, 3))
+                base = max(0, base - self.rng.randint(1, 3))
             elif crit_roll > 0.95:  # 5% critical success
-                base = base + random.randint(2, 5)
+                base = base + self.rng.randint(2, 5)
 
         return base
 
@@ -955,4 +1070,8 @@ if __name__ == "__main__":
 
     print(f"Planning Stage Points: {points}")
     if event:
-        print(f"Random Event: {event['name']} - {event['description']}")
\ No newline at end of file
+        print(f"Random Event: {event['name']} - {event['description']}")
+    # Roll bounces for a whole studio at once
+    studio = [create_player_developer() for _ in range(200)]
+    bounce_counts, percentiles = BounceCalculator.calculate_bounces_many(studio)
+    print(f"Studio bounces: mean {bounce_counts.mean():.2f}, best roll {percentiles.max()}th percentile")
@@ -0,0 +1,165 @@
+"""
+RNG System
+Hands out independent, seedable random streams per subsystem and per game project
+"""
+
+import hashlib
+import random
+from typing import Dict, Optional
+
+
+class RNGSystem:
+    """Central source of reproducible random streams"""
+
+    # Subsystems that draw from their own stream
+    BOUNCES = 'bounces'
+    STAGE_SCORING = 'stage_scoring'
+    EVENTS = 'events'
+    POINTS = 'points'
+    GAME_DEVELOPMENT = 'game_development'
+    RATING = 'rating'
+
+    # Seeds kept in the save for replay - the oldest projects are forgotten beyond this
+    MAX_RECORDED_PROJECTS = 50
+
+    def __init__(self, game_data=None, master_seed: Optional[int] = None):
+        """
+        Args:
+            game_data: Optional GameData; seeds are recorded under data['rng']
+            master_seed: Seed for the whole run (read from the save, or random if not given)
+        """
+        self.game_data = game_data
+        self.rng_data = self._load_rng_data(master_seed)
+        self.streams = {}  # (subsystem, project) -> random.Random
+        self.numpy_streams = {}  # (subsystem, project) -> numpy Generator
+
+    def _load_rng_data(self, master_seed: Optional[int]) -> Dict:
+        """Get (or create) the seed record, in the save when there is one"""
+        if self.game_data is not None and hasattr(self.game_data, 'data'):
+            rng_data = self.game_data.data.setdefault('rng', {})
+        else:
+            rng_data = {}
+
+        if master_seed is not None:
+            rng_data['master_seed'] = master_seed
+        elif 'master_seed' not in rng_data:
+            rng_data['master_seed'] = random.SystemRandom().getrandbits(63)
+        rng_data.setdefault('projects', {})
+        rng_data.setdefault('next_project', 1)
+
+        return rng_data
+
+    @property
+    def master_seed(self) -> int:
+        """Seed for the whole run"""
+        return self.rng_data['master_seed']
+
+    @staticmethod
+    def derive_seed(*parts) -> int:
+        """Stable 63-bit seed from any parts (same on every machine and Python run)"""
+        key = ':'.join(str(part) for part in parts).encode('utf-8')
+        return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big') >> 1
+
+    def new_project(self, name: str) -> str:
+        """
+        Register a new game project under a unique id, so two games with the same title
+        don't replay the same rolls
+
+        Args:
+            name: The game's display name
+
+        Returns:
+            The project id ("<number>:<name>") to pass to start_project and stream
+        """
+        number = self.rng_data.get('next_project', 1)
+        self.rng_data['next_project'] = number + 1
+        project = f"{number}:{name}"
+        self.start_project(project)
+        return project
+
+    def start_project(self, project: str, seed: Optional[int] = None) -> int:
+        """
+        Register a game project and record its seed in the save
+        A project that already has a seed keeps it, so loading a save replays it
+
+        Args:
+            project: Project id (from new_project)
+            seed: Explicit seed to replay a recorded project
+
+        Returns:
+            The project's seed
+        """
+        projects = self.rng_data['projects']
+        if seed is not None:
+            projects.pop(project, None)
+            projects[project] = seed
+        elif project not in projects:
+            projects[project] = self.derive_seed(self.master_seed, 'project', project)
+        else:
+            return projects[project]
+
+        # Dicts keep insertion order - drop the oldest recorded projects
+        while len(projects) > self.MAX_RECORDED_PROJECTS:
+            del projects[next(iter(projects))]
+
+        # Fresh seed - restart any streams already handed out for this project
+        self.release_project(project)
+
+        return projects[project]
+
+    def release_project(self, project: str):
+        """Drop a finished project's cached streams (its seed stays recorded for replay)"""
+        for streams in (self.streams, self.numpy_streams):
+            for key in [key for key in streams if key[1] == project]:
+                del streams[key]
+
+    def get_project_seed(self, project: str) -> Optional[int]:
+        """Get the recorded seed for a project"""
+        return self.rng_data['projects'].get(project)
+
+    def _stream_seed(self, subsystem: str, project: Optional[str]) -> int:
+        """Seed for one subsystem stream"""
+        if project is None:
+            return self.derive_seed(self.master_seed, subsystem)
+        return self.derive_seed(self.start_project(project), subsystem)
+
+    def stream(self, subsystem: str, project: Optional[str] = None) -> random.Random:
+        """
+        Get the random.Random stream for a subsystem (optionally within a project)
+        The same subsystem and project always return the same stream object
+        """
+        key = (subsystem, project)
+        if key not in self.streams:
+            self.streams[key] = random.Random(self._stream_seed(subsystem, project))
+        return self.streams[key]
+
+    def numpy_stream(self, subsystem: str, project: Optional[str] = None):
+        """Get a numpy Generator stream for batched subsystems"""
+        key = (subsystem, project)
+        if key not in self.numpy_streams:
+            import numpy as np
+            self.numpy_streams[key] = np.random.default_rng(self._stream_seed(subsystem, project))
+        return self.numpy_streams[key]
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = RNGSystem(master_seed=1984)
+    project = rng.new_project("Space Adventure")
+    seed = rng.get_project_seed(project)
+
+    first = [rng.stream(RNGSystem.BOUNCES, project).randint(1, 10) for _ in range(5)]
+
+    # Replay the project from its recorded seed
+    replay = RNGSystem(master_seed=1984)
+    replay.start_project(project, seed)
+    second = [replay.stream(RNGSystem.BOUNCES, project).randint(1, 10) for _ in range(5)]
+
+    # A second game with the same title gets its own rolls
+    sequel = rng.new_project("Space Adventure")
+    third = [rng.stream(RNGSystem.BOUNCES, sequel).randint(1, 10) for _ in range(5)]
+
+    print(f"Project {project}: seed {seed}")
+    print(f"First run:  {first}")
+    print(f"Replay:     {second}")
+    print(f"Same title, project {sequel}: {third}")
@@ -0,0 +1,269 @@
+"""
+Save Formats
+Pluggable save file backends (compact JSON, YAML with the C loader when available), format detection and conversion
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+from systems.game_state import StateRecord, json_default
+
+# libyaml bindings are much faster than the pure-Python loader, when PyYAML was built with them
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class SaveDumper(getattr(yaml, 'CDumper', yaml.Dumper)):
+    """Dumper for saves - a subclass, so its representers don't change yaml.dump anywhere else"""
+
+
+# Typed state records are written as the plain dicts they stand for
+SaveDumper.add_multi_representer(StateRecord, lambda dumper, record: dumper.represent_dict(record.to_dict()))
+YAML_DUMPER = SaveDumper
+
+
+class SaveFormat:
+    """One way of writing game data to disk"""
+
+    name = ''
+    extension = ''
+
+    def load(self, path: Path) -> Dict:
+        raise NotImplementedError
+
+    def dump(self, data: Dict, path: Path):
+        raise NotImplementedError
+
+    def dump_atomic(self, data: Dict, path: Path):
+        """
+        Write to a temp file beside the save, fsync it, then rename it over the save
+        A crash leaves either the old save or the new one, never half a file
+        """
+        path = Path(path)
+        temp_path = path.with_name(path.name + '.tmp')
+        try:
+            self.dump(data, temp_path)
+            with open(temp_path, 'rb+') as f:
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        # Make the rename itself durable (not supported on every platform)
+        try:
+            dir_fd = os.open(path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+class JsonSaveFormat(SaveFormat):
+    """Compact JSON - the C parser makes this the fastest to load and write"""
+
+    name = 'json'
+    extension = '.json'
+
+    def load(self, path: Path) -> Dict:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def dump(self, data: Dict, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'), default=json_default)
+
+
+class YamlSaveFormat(SaveFormat):
+    """The original readable YAML saves"""
+
+    name = 'yaml'
+    extension = '.yaml'
+
+    def load(self, path: Path) -> Dict:
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=YAML_LOADER)
+
+    def dump(self, data: Dict, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.dump(data, f, Dumper=YAML_DUMPER, default_flow_style=False, indent=2)
+
+
+SAVE_FORMATS = {save_format.name: save_format for save_format in (JsonSaveFormat(), YamlSaveFormat())}
+
+# Format new saves are written in
+DEFAULT_FORMAT = 'json'
+
+
+def get_format(name: str) -> SaveFormat:
+    """Get a save format by name ('json' or 'yaml')"""
+    if name not in SAVE_FORMATS:
+        raise ValueError(f"Unknown save format: {name}")
+    return SAVE_FORMATS[name]
+
+
+def save_extensions() -> List[str]:
+    """File extensions of every known save format"""
+    return [save_format.extension for save_format in SAVE_FORMATS.values()]
+
+
+def detect_format(path: Path) -> SaveFormat:
+    """
+    Work out a save file's format - from its extension, or by sniffing the first character
+
+    Args:
+        path: Save file path
+
+    Returns:
+        The matching SaveFormat (YAML when unsure, since YAML also reads JSON)
+    """
+    path = Path(path)
+    for save_format in SAVE_FORMATS.values():
+        if path.suffix == save_format.extension:
+            return save_format
+
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.read(64).lstrip()[:1]
+    return SAVE_FORMATS['json'] if first in ('{', '[') else SAVE_FORMATS['yaml']
+
+
+def load_save(path: Path) -> Dict:
+    """Load a save file in whatever format it's in"""
+    return detect_format(path).load(Path(path))
+
+
+def convert_save(path: Path, target: str = DEFAULT_FORMAT, keep_original: bool = False) -> Path:
+    """
+    Rewrite one save in another format
+
+    Args:
+        path: Existing save file
+        target: Format name to convert to
+        keep_original: Leave the old file in place
+
+    Returns:
+        Path of the converted save
+    """
+    path = Path(path)
+    save_format = get_format(target)
+    target_path = path.with_suffix(save_format.extension)
+    if target_path == path:
+        return path
+
+    save_format.dump_atomic(load_save(path), target_path)
+    if not keep_original:
+        path.unlink()
+    return target_path
+
+
+def convert_saves(save_dir: Path, target: str = DEFAULT_FORMAT, keep_original: bool = False) -> List[Path]:
+    """Convert every save in a directory that isn't already in the target format"""
+    save_dir = Path(save_dir)
+    extension = get_format(target).extension
+    converted = []
+    for other in save_extensions():
+        if other == extension:
+            continue
+        for path in sorted(save_dir.glob(f"*{other}")):
+            converted.append(convert_save(path, target, keep_original))
+    return converted
+
+
+def benchmark(data: Dict, work_dir: Path, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Time saving and loading the same data in every format
+
+    Args:
+        data: Game data to write
+        work_dir: Directory for the temporary files
+        repeat: Runs per format (best time is kept)
+
+    Returns:
+        {format name: {'save': seconds, 'load': seconds, 'size': bytes}}
+    """
+    results = {}
+    for save_format in SAVE_FORMATS.values():
+        path = Path(work_dir) / f"benchmark{save_format.extension}"
+        save_times, load_times = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            save_format.dump(data, path)
+            save_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            save_format.load(path)
+            load_times.append(time.perf_counter() - start)
+
+        results[save_format.name] = {'save': min(save_times), 'load': min(load_times), 'size': path.stat().st_size}
+        path.unlink()
+    return results
+
+
+def make_benchmark_data(transactions: int = 5000, games: int = 500, npcs: int = 500) -> Dict:
+    """Late-game-sized data: long transaction history, many released games and a big roster"""
+    return {
+        'game_metadata': {'version': '1.0.0', 'save_name': 'Benchmark', 'playtime_hours': 120.5},
+        'player_data': {'studio_name': 'Benchmark Studio', 'player_name': 'Tester', 'reputation': 80},
+        'money': {
+            'cash_on_hand': 30,
+            'bank_balance': 1500000,
+            'transaction_history': [
+                {'date': f"{1980 + i // 365}-{i % 12 + 1:02d}-{i % 28 + 1:02d}", 'description': 'Game sales',
+                 'amount': 100 + i, 'account': 'bank', 'balance_after': 1000 + i * 7}
+                for i in range(transactions)
+            ]
+        },
+        'completed_games': [
+            {'name': f"Game {i}", 'type': 'RPG', 'topic': 'Fantasy', 'year': 1980 + i % 40,
+             'score': 50 + i % 50, 'rating': 'Great', 'sales': i * 1000, 'bugs': i % 7}
+            for i in range(games)
+        ],
+        'employees': [
+            {'id': i, 'name': f"Employee {i}", 'salary': 900 + i, 'active': True,
+             'skills': {'engineering': i % 10, 'design': (i * 3) % 10, 'marketing': (i * 7) % 10}}
+            for i in range(npcs)
+        ]
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Benchmark save formats or convert existing saves")
+    parser.add_argument('--convert', metavar='SAVE_DIR', help="Convert every save in SAVE_DIR")
+    parser.add_argument('--to', default=DEFAULT_FORMAT, choices=sorted(SAVE_FORMATS), help="Target format")
+    parser.add_argument('--keep', action='store_true', help="Keep the original files")
+    args = parser.parse_args()
+
+    if args.convert:
+        for converted_path in convert_saves(args.convert, args.to, args.keep):
+            print(f"Converted: {converted_path}")
+    else:
+        print(f"YAML loader: {YAML_LOADER.__name__}, dumper: {YAML_DUMPER.__bases__[0].__name__}")
+        data = make_benchmark_data()
+        with tempfile.TemporaryDirectory() as work_dir:
+            for name, result in benchmark(data, Path(work_dir)).items():
+                print(f"{name:>5}: save {result['save'] * 1000:8.1f} ms | "
+                      f"load {result['load'] * 1000:8.1f} ms | {result['size'] / 1024:7.1f} KB")
+
+            # The old path: yaml.dump / yaml.safe_load (pure Python)
+            path = Path(work_dir) / "old.yaml"
+            start = time.perf_counter()
+            with open(path, 'w') as f:
+                yaml.dump(data, f, default_flow_style=False, indent=2)
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            with open(path, 'r') as f:
+                yaml.safe_load(f)
+            loaded = time.perf_counter() - start
+            print(f"  old: save {saved * 1000:8.1f} ms | load {loaded * 1000:8.1f} ms")
@@ -0,0 +1,332 @@
+"""
+Save Journal
+Append-only log of game data changes between full saves, replayed on load to recover from a crash
+"""
+
+import json
+import os
+import uuid
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from systems.game_state import json_default
+
+
+class SaveJournal:
+    """
+    Records changes to a save as JSON lines next to it (saves/<name>.<journal_base>.journal)
+    Autosave only appends what changed; every so often the whole save is rewritten (compaction)
+    """
+
+    EXTENSION = '.journal'
+
+    # Rewrite the full save once the journal holds this many entries or bytes
+    COMPACT_ENTRIES = 5000
+    COMPACT_BYTES = 2 * 1024 * 1024
+
+    def __init__(self, save_manager, filename: str, base_id: Optional[str] = None, save_writer=None):
+        """
+        Args:
+            save_manager: SaveManager that writes the full save (save_game / journal_path)
+            filename: Save name the journal belongs to
+            base_id: journal_base of the full save this journal continues
+            save_writer: SaveWriter for full saves (compaction); without one they are written inline
+        """
+        self.save_manager = save_manager
+        self.save_writer = save_writer
+        self.filename = filename
+        self.base_id = base_id
+        self.path = Path(save_manager.journal_path(filename, base_id))
+
+        self.pending: List[str] = []  # Encoded entries not yet written
+        self.dirty = set()  # Top-level sections to write whole at the next flush
+        self.written = {}  # Section -> its last whole-section entry in this journal (unchanged ones are skipped)
+        self.writing = None  # Full save in flight on the writer: {'filename', 'base_id', 'done', 'error'}
+        self.entries = self._repair(base_id)
+
+    def _repair(self, base_id: Optional[str]) -> int:
+        """
+        Make an existing journal safe to append to: cut a torn last line off,
+        and drop a journal that belongs to another save
+
+        Returns:
+            Entries left in the journal
+        """
+        if not self.path.exists():
+            return 0
+
+        good_bytes = 0
+        entries = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                # Without its newline a line is torn, even if it happens to parse
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if entries == 0 and (entry.get('op') != 'base' or entry.get('id') != base_id):
+                    self.path.unlink()
+                    return 0
+                good_bytes += len(line)
+                entries += 1
+
+        if good_bytes < self.path.stat().st_size:
+            with open(self.path, 'r+b') as f:
+                f.truncate(good_bytes)
+        return entries
+
+    @staticmethod
+    def new_base_id() -> str:
+        """Id tying a journal to the full save it continues from"""
+        return uuid.uuid4().hex
+
+    def _encode(self, entry: Dict) -> Optional[str]:
+        """Encode now, so later changes to the value don't leak into the entry"""
+        try:
+            return json.dumps(entry, separators=(',', ':'), default=json_default)
+        except (TypeError, ValueError) as e:
+            print(f"Journal skipped {entry.get('op')} {entry.get('keys')}: {e}")
+            return None
+
+    def record_set(self, keys, value):
+        """Record data[keys...] = value"""
+        line = self._encode({'op': 'set', 'keys': list(keys), 'value': value})
+        if line:
+            self.pending.append(line)
+            self.written.pop(keys[0], None)
+
+    def record_append(self, keys, value):
+        """Record data[keys...].append(value) - transactions, hires, released games"""
+        line = self._encode({'op': 'append', 'keys': list(keys), 'value': value})
+        if line:
+            self.pending.append(line)
+            self.written.pop(keys[0], None)
+
+    def mark_dirty(self, *sections):
+        """
+        Write these top-level sections whole at the next flush (for state changed in place)
+        A section that still matches the last time it was written whole is skipped
+        """
+        self.dirty.update(sections)
+
+    def flush(self, data: Dict) -> int:
+        """
+        Append everything recorded since the last flush
+
+        Args:
+            data: The live game data (for dirty sections and the base id)
+
+        Returns:
+            Number of entries written (0 while a full save is in flight - entries wait for it)
+        """
+        if not self.settle(data):
+            return 0
+
+        for section in sorted(self.dirty):
+            if section in data:
+                line = self._encode({'op': 'set', 'keys': [section], 'value': data[section]})
+                if line and self.written.get(section) != line:
+                    self.pending.append(line)
+                    self.written[section] = line
+        self.dirty.clear()
+
+        if not self.pending:
+            return 0
+
+        if not self.path.exists():
+            self.entries = 0
+
+        lines = self.pending
+        if self.entries == 0:
+            # A fresh journal starts by naming the save it continues
+            lines = [json.dumps({'op': 'base', 'id': self.base_id})] + lines
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        written = len(self.pending)
+        self.entries += len(lines)
+        self.pending = []
+        return written
+
+    def needs_compaction(self) -> bool:
+        if self.writing is not None:
+            return False
+        if self.entries >= self.COMPACT_ENTRIES:
+            return True
+        return self.path.exists() and self.path.stat().st_size >= self.COMPACT_BYTES
+
+    def compact(self, data: Dict):
+        """Rewrite the full save and start an empty journal after it"""
+        if self.save_writer is not None:
+            self.save_full(data)
+            return
+
+        self.save_manager.save_game(self.filename, data)
+        self.reset()
+        self._continue_in(self.filename, data['game_metadata']['journal_base'])
+
+    def save_full(self, data: Dict, filename: Optional[str] = None):
+        """
+        Write a full save on the save writer, and continue in its journal once it has landed
+        Entries recorded while it is written are held back - they go to the new save's journal
+        if the write succeeds, or to this one if it fails
+
+        Args:
+            data: The live game data
+            filename: Save name to write (defaults to this journal's save)
+        """
+        # One full save at a time - a queued one replaced by the next would only come back as SaveSuperseded
+        if self.writing is not None:
+            self.save_writer.wait()
+            self.settle(data)
+
+        # Everything up to now goes to the current journal; the snapshot taken next includes it
+        self.flush(data)
+
+        writing = {'filename': filename or self.filename, 'base_id': None, 'done': False, 'error': None}
+
+        def on_done(error):
+            writing['error'] = error
+            writing['done'] = True
+
+        self.writing = writing
+        try:
+            self.save_writer.save(writing['filename'], data, on_done=on_done)
+        except Exception:
+            self.writing = None
+            data['game_metadata']['journal_base'] = self.base_id
+            raise
+        writing['base_id'] = data['game_metadata']['journal_base']
+
+    def settle(self, data: Dict) -> bool:
+        """
+        Finish up after a full save from save_full, once the writer is done with it
+
+        Returns:
+            False while the save is still being written
+        """
+        writing = self.writing
+        if writing is None:
+            return True
+        if not writing['done']:
+            return False
+
+        self.writing = None
+        if writing['error'] is None:
+            self._continue_in(writing['filename'], writing['base_id'])
+        else:
+            # Nothing was replaced on disk (failed, or superseded) - keep journaling against the save that is there
+            data['game_metadata']['journal_base'] = self.base_id
+        return True
+
+    def _continue_in(self, filename: str, base_id: str):
+        """Switch to the (new, empty) journal of a full save that was just written"""
+        self.filename = filename
+        self.base_id = base_id
+        self.path = Path(self.save_manager.journal_path(filename, base_id))
+        self.entries = 0
+        self.written = {}
+
+    def reset(self):
+        """Forget unwritten entries - the full save just written already has them"""
+        self.pending = []
+        self.dirty.clear()
+        self.entries = 0
+
+    @staticmethod
+    def apply(data: Dict, entry: Dict):
+        """Apply one journal entry to game data"""
+        keys = entry['keys']
+        current = data
+        for key in keys[:-1]:
+            if key not in current or not isinstance(current[key], Mapping):
+                current[key] = {}
+            current = current[key]
+
+        if entry['op'] == 'set':
+            current[keys[-1]] = entry['value']
+        elif entry['op'] == 'append':
+            if not isinstance(current.get(keys[-1]), list):
+                current[keys[-1]] = []
+            current[keys[-1]].append(entry['value'])
+
+    @staticmethod
+    def replay(path: Path, data: Dict) -> int:
+        """
+        Replay a journal onto the full save it was written after
+
+        Args:
+            path: Journal file
+            data: Loaded save data (changed in place)
+
+        Returns:
+            Number of entries applied (0 if the journal belongs to another save)
+        """
+        path = Path(path)
+        if not path.exists():
+            return 0
+
+        applied = 0
+        base_id = data.get('game_metadata', {}).get('journal_base')
+        with open(path, 'r', encoding='utf-8') as f:
+            for number, line in enumerate(f):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A crash mid-write leaves a torn last line - everything before it is good
+                    break
+
+                if number == 0:
+                    if entry.get('op') != 'base' or entry.get('id') != base_id:
+                        return 0
+                    continue
+
+                SaveJournal.apply(data, entry)
+                applied += 1
+
+        return applied
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    class DemoSaveManager:
+        def __init__(self, save_dir):
+            self.save_dir = Path(save_dir)
+            self.saves = {}
+
+        def journal_path(self, filename, base_id):
+            return self.save_dir / f"{filename}.{base_id}{SaveJournal.EXTENSION}"
+
+        def save_game(self, filename, data):
+            data['game_metadata']['journal_base'] = SaveJournal.new_base_id()
+            self.saves[filename] = json.loads(json.dumps(data))
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        manager = DemoSaveManager(save_dir)
+        data = {'game_metadata': {}, 'time': {'day': 1}, 'money': {'bank_balance': 100, 'transaction_history': []}}
+        manager.save_game('demo', data)
+
+        journal = SaveJournal(manager, 'demo', data['game_metadata']['journal_base'])
+        for day in range(2, 6):
+            data['time']['day'] = day
+            data['money']['bank_balance'] -= 10
+            transaction = {'date': f"1978-01-{day:02d}", 'amount': -10}
+            data['money']['transaction_history'].append(transaction)
+
+            journal.record_set(['money', 'bank_balance'], data['money']['bank_balance'])
+            journal.record_append(['money', 'transaction_history'], transaction)
+            journal.mark_dirty('time')
+            journal.flush(data)
+
+        # "Crash" - recover from the last full save plus the journal
+        recovered = json.loads(json.dumps(manager.saves['demo']))
+        applied = SaveJournal.replay(journal.path, recovered)
+        print(f"Replayed {applied} entries, recovered == live: {recovered == data}")
@@ -0,0 +1,161 @@
+"""
+Save Writer
+Writes saves on a background thread from a snapshot of the game data, one write at a time
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Callable, Dict, Optional
+
+
+def snapshot(value):
+    """
+    Structural copy of the game data: new dicts and lists, shared scalars
+    Cheaper than deepcopy or serializing, and later changes to the live data can't reach it
+    State records (systems.game_state) come out as plain dicts
+    """
+    if isinstance(value, Mapping):
+        return {key: snapshot(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [snapshot(item) for item in value]
+    return value
+
+
+class SaveSuperseded(Exception):
+    """Passed to on_done of a queued save that a newer save replaced before it was written"""
+
+
+class SaveWriter:
+    """Serializes, fsyncs and renames saves into place off the UI thread"""
+
+    def __init__(self, save_manager):
+        """
+        Args:
+            save_manager: SaveManager providing prepare_save and write_save
+        """
+        self.save_manager = save_manager
+        self.lock = threading.Lock()
+        self.thread = None
+        self.pending = None  # Newest save requested while another was being written
+        self.progress = {'filename': None, 'fraction': 1.0, 'message': '', 'error': None}
+
+    def save(self, filename: str, game_data: Dict,
+             on_progress: Optional[Callable] = None, on_done: Optional[Callable] = None) -> bool:
+        """
+        Snapshot the game data now and write it in the background
+
+        Args:
+            filename: Save name
+            game_data: Live game data dict (stamped, then snapshotted on this thread)
+            on_progress: Optional callback(fraction, message), called on the writer thread
+            on_done: Optional callback(error or None), called on the writer thread - or with
+                SaveSuperseded on this thread, if a newer save replaces this one while it is queued
+
+        Returns:
+            True if the write started, False if it was queued behind the one in flight
+            (a newer queued save replaces an older queued one)
+        """
+        self.save_manager.prepare_save(game_data)
+        job = (filename, snapshot(game_data), on_progress, on_done)
+
+        with self.lock:
+            if self.thread is None:
+                self._start(job)
+                return True
+            dropped, self.pending = self.pending, job
+
+        # The replaced save is never written - its caller still hears back
+        if dropped and dropped[3]:
+            dropped[3](SaveSuperseded(f"Save of {dropped[0]} replaced by a newer save of {filename}"))
+        return False
+
+    def _start(self, job):
+        """Start the writer thread for a job (lock held)"""
+        self.progress = {'filename': job[0], 'fraction': 0.0, 'message': "Saving...", 'error': None}
+        self.thread = threading.Thread(target=self._run, args=(job,))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _run(self, job):
+        filename, data, on_progress, on_done = job
+
+        def progress(fraction, message):
+            self.progress.update(fraction=fraction, message=message)
+            if on_progress:
+                on_progress(fraction, message)
+
+        error = None
+        try:
+            self.save_manager.write_save(filename, data, progress)
+        except Exception as e:
+            error = e
+            self.progress.update(error=str(e), message=f"Save failed: {e}")
+            print(f"Error writing save {filename}: {e}")
+
+        if on_done:
+            on_done(error)
+
+        # Hand over to the queued save, if any
+        with self.lock:
+            job, self.pending = self.pending, None
+            if job:
+                self._start(job)
+            else:
+                self.thread = None
+
+    def is_busy(self) -> bool:
+        with self.lock:
+            return self.thread is not None
+
+    def get_progress(self) -> Dict:
+        """Progress of the current (or last) write"""
+        return dict(self.progress)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every requested save is written (e.g. before quitting)
+
+        Returns:
+            True if nothing is left in flight
+        """
+        while True:
+            with self.lock:
+                thread = self.thread
+            if thread is None:
+                return True
+            thread.join(timeout)
+            if timeout is not None and thread.is_alive():
+                return False
+
+
+# Example usage
+if __name__ == "__main__":
+    import json
+    import tempfile
+    import time
+    from pathlib import Path
+
+    class DemoSaveManager:
+        def __init__(self, save_dir):
+            self.save_dir = Path(save_dir)
+
+        def prepare_save(self, game_data):
+            game_data['saved_at'] = time.time()
+
+        def write_save(self, filename, game_data, on_progress=None):
+            on_progress(0.1, "Writing save...")
+            time.sleep(0.2)  # A big save
+            (self.save_dir / f"{filename}.json").write_text(json.dumps(game_data))
+            on_progress(1.0, "Saved")
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        writer = SaveWriter(DemoSaveManager(save_dir))
+        data = {'money': {'bank_balance': 100}, 'saved_at': None}
+
+        print(f"First save started: {writer.save('demo', data)}")
+        data['money']['bank_balance'] = 50  # Doesn't reach the snapshot being written
+        print(f"Second save started: {writer.save('demo', data)} (queued)")
+        writer.wait()
+
+        saved = json.loads((Path(save_dir) / "demo.json").read_text())
+        print(f"Saved balance: {saved['money']['bank_balance']}, last message: {writer.get_progress()['message']}")
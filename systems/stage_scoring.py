@@ -86,8 +86,25 @@ class StageScoreCalculator:
         }
     }
 
-    def __init__(self, game_data):
+    # Chance per bounce of creating 1-3 bugs (Planning is the most chaotic stage)
+    BUG_CHANCES = {
+        DevelopmentStage.PLANNING: 0.20,
+        DevelopmentStage.DEVELOPMENT: 0.15,
+        DevelopmentStage.PRODUCTION: 0.15
+    }
+
+    CATEGORIES = ['gameplay', 'technical', 'graphics', 'innovation', 'sound_audio', 'story']
+
+    # Column order for skill arrays in the batched API
+    SKILL_ORDER = ['engineering', 'marketing', 'leadership', 'design', 'research', 'communication']
+
+    # Lazily built numpy lookup tables for the batched API
+    _range_arrays = None
+    _weight_matrix = None
+
+    def __init__(self, game_data, rng=None):
         self.game_data = game_data
+        self.rng = rng or random  # random.Random stream (see RNGSystem), or the global module
 
     def get_year_range(self, year: int) -> YearRange:
         """Get the appropriate range for a given year"""
@@ -162,7 +179,7 @@ class StageScoreCalculator:
             std_dev = 0.5
 
         # Generate using normal distribution
-        score = random.gauss(adjusted_mean, std_dev)
+        score = self.rng.gauss(adjusted_mean, std_dev)
 
         # Clamp to valid range
         score = max(year_range.min_points, min(year_range.max_points, round(score)))
@@ -188,6 +205,106 @@ class StageScoreCalculator:
 
         return scores
 
+    def calculate_weighted_skills_many(self, skills, stages):
+        """
+        Vectorized calculate_weighted_skill for many developers
+
+        Args:
+            skills: (n, 6) array of skills in SKILL_ORDER (0-10 each)
+            stages: Single DevelopmentStage or sequence of n stages
+
+        Returns:
+            Array of n weighted skills (0-100)
+        """
+        import numpy as np
+
+        skills = np.asarray(skills, dtype=float).reshape(-1, len(self.SKILL_ORDER))
+
+        if isinstance(stages, DevelopmentStage):
+            return skills @ (self._stage_weight_matrix()[self._stage_index(stages)] * 10)
+
+        stage_indices = np.fromiter((self._stage_index(stage) for stage in stages), dtype=np.intp)
+        weights = self._stage_weight_matrix()[stage_indices] * 10
+        return np.einsum('ij,ij->i', skills, weights)
+
+    def precalculate_stage_scores_many(self, years, weighted_skills, num_bounces, rng=None):
+        """
+        Pre-calculate bounce scores for many stages in one vectorized draw
+        Same bell curve as generate_bounce_score, one row per stage
+
+        Args:
+            years: Game year for each stage (array-like of n ints, or a single int)
+            weighted_skills: Weighted skill for each stage (0-100, from calculate_weighted_skills_many)
+            num_bounces: Bounces for each stage (array-like of n ints, or a single int)
+            rng: Optional numpy Generator or seed for reproducible sweeps
+
+        Returns:
+            (n, max(num_bounces)) int array; entries past a row's num_bounces are -1
+        """
+        import numpy as np
+
+        if not isinstance(rng, np.random.Generator):
+            rng = np.random.default_rng(rng)
+
+        years, weighted_skills, num_bounces = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(years, dtype=np.int64)),
+            np.atleast_1d(np.asarray(weighted_skills, dtype=float)),
+            np.atleast_1d(np.asarray(num_bounces, dtype=np.int64))
+        )
+        width = int(num_bounces.max(initial=0))
+
+        # Resolve each year's range once (same "closest year not in the future" rule)
+        range_years, min_points, max_points = self._year_range_arrays()
+        indices = np.clip(np.searchsorted(range_years, years, side='right') - 1, 0, None)
+        low = min_points[indices]
+        high = max_points[indices]
+        span = high - low
+
+        # Mean scales with skill, 1988 keeps its special 90% factor
+        factor = np.where(years == 1988, 0.9, 0.8)
+        means = low + span * factor * (weighted_skills / 100.0)
+        std_devs = np.maximum(span * 0.15, 0.5)
+
+        # One draw for every bounce of every stage
+        draws = rng.normal(size=(len(years), width)) * std_devs[:, None] + means[:, None]
+        scores = np.clip(np.rint(draws), low[:, None], high[:, None]).astype(np.int64)
+
+        # Mark padding past each stage's bounce count
+        scores[np.arange(width)[None, :] >= num_bounces[:, None]] = -1
+
+        return scores
+
+    @classmethod
+    def _year_range_arrays(cls):
+        """Sorted YEAR_RANGES as parallel (years, min_points, max_points) arrays"""
+        if cls._range_arrays is None:
+            import numpy as np
+
+            range_years = sorted(cls.YEAR_RANGES)
+            cls._range_arrays = (
+                np.array(range_years, dtype=np.int64),
+                np.array([cls.YEAR_RANGES[y].min_points for y in range_years], dtype=float),
+                np.array([cls.YEAR_RANGES[y].max_points for y in range_years], dtype=float)
+            )
+        return cls._range_arrays
+
+    @classmethod
+    def _stage_weight_matrix(cls):
+        """STAGE_WEIGHTS as a (stages, skills) array in SKILL_ORDER"""
+        if cls._weight_matrix is None:
+            import numpy as np
+
+            cls._weight_matrix = np.array([
+                [cls.STAGE_WEIGHTS[stage].get(skill, 0) for skill in cls.SKILL_ORDER]
+                for stage in DevelopmentStage
+            ])
+        return cls._weight_matrix
+
+    @staticmethod
+    def _stage_index(stage: DevelopmentStage) -> int:
+        """Row of a stage in the weight matrix"""
+        return list(DevelopmentStage).index(stage)
+
     def get_stage_focus_categories(self, stage: DevelopmentStage) -> Dict[str, float]:
         """
         Get which categories should receive points in each stage
@@ -255,6 +372,48 @@ class StageScoreCalculator:
 
         return distributed
 
+    def split_bounce_points(self, total_points: int, stage: DevelopmentStage) -> Dict[str, int]:
+        """
+        Split one bounce's points across all six categories
+        Every bounce is worth at least 2 points; small bounces land on random categories
+
+        Returns:
+            Dict of category -> points (all six categories present)
+        """
+        total_points = max(2, total_points)
+        all_points = {category: 0 for category in self.CATEGORIES}
+
+        if total_points <= 2:
+            # Either give 2 to one category or 1 each to two categories
+            if self.rng.random() < 0.5:
+                chosen = self.rng.choice(self.CATEGORIES)
+                all_points[chosen] = 2
+            else:
+                chosen_cats = self.rng.sample(self.CATEGORIES, 2)
+                all_points[chosen_cats[0]] = 1
+                all_points[chosen_cats[1]] = 1
+        else:
+            for category, value in self.distribute_points_to_categories(total_points, stage).items():
+                all_points[category] = value
+
+        return all_points
+
+    def roll_bounce_bugs(self, stage: DevelopmentStage, current_bugs: int) -> int:
+        """
+        Roll the bug change for one bounce
+
+        Returns:
+            Bugs created (positive) or bugs fixed during Bug Squashing (negative)
+        """
+        if stage != DevelopmentStage.BUG_SQUASHING:
+            if self.rng.random() < self.BUG_CHANCES[stage]:
+                return self.rng.randint(1, 3)
+            return 0
+
+        if current_bugs > 0:
+            return -min(current_bugs, self.rng.randint(2, 5))
+        return 0
+
 
 # Example usage
 if __name__ == "__main__":
@@ -311,4 +470,15 @@ if __name__ == "__main__":
     # Test distribution
     for score in scores[:3]:
         dist = calc.distribute_points_to_categories(score, DevelopmentStage.PLANNING)
-        print(f"Score {score} distributed: {dist}")
\ No newline at end of file
+        print(f"Score {score} distributed: {dist}")
+    # Batched balance sweep: one million bounces in a single draw
+    import time
+    import numpy as np
+
+    start = time.perf_counter()
+    years = np.repeat([1978, 1988, 2000, 2020], 25000)
+    skills = calc.calculate_weighted_skills_many(np.full((len(years), 6), 5), DevelopmentStage.DEVELOPMENT)
+    matrix = calc.precalculate_stage_scores_many(years, skills, 10, rng=42)
+    print(f"\nBatched {matrix.size:,} bounces in {time.perf_counter() - start:.3f}s")
+    for year in [1978, 1988, 2000, 2020]:
+        print(f"  {year} average: {matrix[years == year].mean():.2f}")
@@ -0,0 +1,264 @@
+"""
+State History
+Immutable, structurally shared snapshots of the game data at each day boundary, for undo and rewind
+"""
+
+from collections import deque
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple
+
+from systems.game_state import wrap_state
+
+
+class FrozenDict(dict):
+    """A snapshot of a dict - read-only, shared between snapshots while unchanged"""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Snapshots are read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+
+class PersistentList:
+    """
+    A snapshot of a list, stored in fixed-size chunks
+    Appending to a long list (transaction history, released games) only adds or replaces
+    the last chunk - the chunks before it are shared with the previous snapshot
+    """
+
+    __slots__ = ('chunks', 'length')
+
+    CHUNK_SIZE = 32
+
+    def __init__(self, chunks: Tuple[tuple, ...], length: int):
+        self.chunks = chunks
+        self.length = length
+
+    @classmethod
+    def freeze(cls, items: list, previous: Optional['PersistentList'] = None) -> 'PersistentList':
+        """Snapshot a list, reusing the previous snapshot's unchanged chunks"""
+        size = cls.CHUNK_SIZE
+        previous_chunks = previous.chunks if previous is not None else ()
+        chunks = []
+        for number, start in enumerate(range(0, len(items), size)):
+            part = items[start:start + size]
+            old = previous_chunks[number] if number < len(previous_chunks) else ()
+            new = tuple(freeze(item, old[index] if index < len(old) else None)
+                        for index, item in enumerate(part))
+            if len(new) == len(old) and all(item is old_item for item, old_item in zip(new, old)):
+                new = old
+            chunks.append(new)
+
+        chunks = tuple(chunks)
+        if previous is not None and len(chunks) == len(previous_chunks) and \
+                all(chunk is old for chunk, old in zip(chunks, previous_chunks)):
+            return previous
+        return cls(chunks, len(items))
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+        return self.chunks[index // self.CHUNK_SIZE][index % self.CHUNK_SIZE]
+
+    def __eq__(self, other):
+        if isinstance(other, PersistentList):
+            return self.chunks == other.chunks
+        if isinstance(other, list):
+            return self.length == len(other) and all(
+                list(chunk) == other[number * self.CHUNK_SIZE:(number + 1) * self.CHUNK_SIZE]
+                for number, chunk in enumerate(self.chunks))
+        return NotImplemented
+
+    __hash__ = None
+
+
+def freeze(value, previous=None):
+    """
+    Snapshot a value, sharing every part that equals the previous snapshot
+
+    Args:
+        value: Live game data (dicts, state records, lists, scalars)
+        previous: This value's node in the previous snapshot, if any
+
+    Returns:
+        The snapshot node - `previous` itself when nothing changed
+    """
+    if isinstance(value, Mapping):
+        if type(previous) is FrozenDict:
+            # Compared in C for flat dicts - most sections don't change on a given day
+            if previous == value:
+                return previous
+            return FrozenDict({key: freeze(item, previous.get(key)) for key, item in value.items()})
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+
+    if isinstance(value, list):
+        return PersistentList.freeze(value, previous if type(previous) is PersistentList else None)
+
+    # Scalars (and tuples) are immutable - keep the previous object so unchanged parents can be reused
+    if previous is not None and type(previous) is type(value) and previous == value:
+        return previous
+    return value
+
+
+def thaw(node):
+    """Rebuild live, mutable game data from a snapshot node"""
+    if type(node) is FrozenDict:
+        return {key: thaw(item) for key, item in node.items()}
+    if type(node) is PersistentList:
+        return [thaw(item) for item in node]
+    return node
+
+
+def count_new_nodes(node, previous) -> int:
+    """Dicts, chunks and lists in a snapshot that aren't shared with the previous one"""
+    seen = set()
+
+    def collect(current, into):
+        if id(current) in into:
+            return
+        if type(current) is FrozenDict:
+            into.add(id(current))
+            for item in current.values():
+                collect(item, into)
+        elif type(current) is PersistentList:
+            into.add(id(current))
+            for chunk in current.chunks:
+                if id(chunk) not in into:
+                    into.add(id(chunk))
+                    for item in chunk:
+                        collect(item, into)
+
+    if previous is not None:
+        collect(previous, seen)
+    before = len(seen)
+    shared_and_new = set(seen)
+    collect(node, shared_and_new)
+    return len(shared_and_new) - before
+
+
+class StateHistory:
+    """Bounded list of day-by-day snapshots of GameData.data, newest last"""
+
+    # Days of play kept for rewinding
+    MAX_SNAPSHOTS = 120
+
+    def __init__(self, game_data, max_snapshots: int = MAX_SNAPSHOTS):
+        """
+        Args:
+            game_data: GameData whose data is snapshotted and restored
+            max_snapshots: Oldest snapshots are dropped beyond this many
+        """
+        self.game_data = game_data
+        self.snapshots = deque(maxlen=max_snapshots)  # (label, root node)
+        self.time_system = None
+
+    def attach(self, time_system):
+        """Take a snapshot whenever the clock moves past a day boundary"""
+        self.detach()
+        self.time_system = time_system
+        time_system.add_boundary_listener(self.on_boundaries)
+
+    def detach(self):
+        if self.time_system is not None:
+            self.time_system.remove_boundary_listener(self.on_boundaries)
+            self.time_system = None
+
+    def on_boundaries(self, boundaries: Dict):
+        """TimeSystem listener"""
+        if boundaries['days'] > 0:
+            self.take()
+
+    def _label(self) -> str:
+        """Game date of the data being snapshotted"""
+        time_data = self.game_data.data.get('time')
+        if not time_data:
+            return self.game_data.data.get('game_time', {}).get('current_date', '')
+        return f"{time_data.get('year', 1978):04d}-{time_data.get('month', 1):02d}-{time_data.get('day', 1):02d}"
+
+    def take(self, label: Optional[str] = None):
+        """
+        Snapshot the game data now
+
+        Args:
+            label: Name shown when rewinding (defaults to the game date)
+
+        Returns:
+            The snapshot's root node
+        """
+        previous = self.snapshots[-1][1] if self.snapshots else None
+        root = freeze(self.game_data.data, previous)
+        self.snapshots.append((label or self._label(), root))
+        return root
+
+    def list_snapshots(self) -> List[str]:
+        """Labels of the kept snapshots, oldest first"""
+        return [label for label, root in self.snapshots]
+
+    def rewind(self, steps: int = 1) -> Optional[str]:
+        """
+        Restore the game data to a snapshot `steps` before the newest one
+        Snapshots after it are dropped; the restored one stays, so rewinding again goes further back
+
+        Returns:
+            Label of the restored snapshot, or None if there's no history that far back
+        """
+        if steps < 0 or steps >= len(self.snapshots):
+            return None
+        for _ in range(steps):
+            self.snapshots.pop()
+
+        label, root = self.snapshots[-1]
+        self.game_data.data = wrap_state(thaw(root))
+        return label
+
+    def clear(self):
+        self.snapshots.clear()
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    from systems.game_systems import TimeSystem
+    from systems.money_system import MoneySystem
+
+    class DemoGameData:
+        def __init__(self):
+            self.data = {
+                'player_data': {'stress_level': 0},
+                'completed_games': [{'name': f"Game {i}", 'sales': i * 1000} for i in range(2000)]
+            }
+
+    game_data = DemoGameData()
+    time_system = TimeSystem(game_data)
+    money_system = MoneySystem(game_data)
+    history = StateHistory(game_data)
+    history.attach(time_system)
+    history.take()
+
+    start = time.perf_counter()
+    for day in range(60):
+        money_system.earn_money(100, f"Sales day {day}")
+        time_system.advance_days(1)
+    elapsed = time.perf_counter() - start
+
+    newest, before = history.snapshots[-1][1], history.snapshots[-2][1]
+    print(f"{len(history.snapshots)} snapshots in {elapsed * 1000:.0f} ms, "
+          f"{count_new_nodes(newest, before)} new nodes in the last one "
+          f"(of {count_new_nodes(newest, None)} in total)")
+
+    balance = money_system.get_bank_balance()
+    label = history.rewind(30)
+    print(f"Rewound to {label}: bank ${balance} -> ${MoneySystem(game_data).get_bank_balance()}, "
+          f"date {time_system.get_iso_date()}")
@@ -0,0 +1,160 @@
+"""
+Time Scheduler
+Fires registered callbacks only when game time crosses their day/week/month/year boundary or deadline
+"""
+
+import datetime
+from typing import Callable, Dict, List
+
+
+class TimeScheduler:
+    """Timer wheel driven by TimeSystem boundaries instead of per-frame polling"""
+
+    BOUNDARIES = ('day', 'week', 'month', 'year')
+
+    def __init__(self, time_system):
+        self.time_system = time_system
+
+        # Recurring callbacks per boundary kind
+        self.recurring: Dict[str, List[Callable]] = {kind: [] for kind in self.BOUNDARIES}
+
+        # One-shot deadlines bucketed by game day number (time['total_days'])
+        self.wheel: Dict[int, List[Callable]] = {}
+
+        self._remember_position()
+        time_system.add_boundary_listener(self.on_boundaries)
+
+    def _time_data(self) -> Dict:
+        return self.time_system.game_data.data['time']
+
+    def _remember_position(self):
+        """Remember where game time was last seen, to catch up on outside changes"""
+        time_data = self._time_data()
+        self.last_total_days = time_data.get('total_days', 0)
+        self.last_date = (time_data.get('year', 1978), time_data.get('month', 1), time_data.get('day', 1))
+
+    def every(self, boundary: str, callback: Callable) -> Callable:
+        """
+        Run a callback each time a boundary is crossed
+
+        Args:
+            boundary: 'day', 'week', 'month' or 'year'
+            callback: Called with the crossed boundaries dict (see TimeSystem.advance_days);
+                      a multi-day skip calls it once with everything crossed
+
+        Returns:
+            The callback (for cancel)
+        """
+        if boundary not in self.recurring:
+            raise ValueError(f"Unknown boundary: {boundary}")
+        self.recurring[boundary].append(callback)
+        return callback
+
+    def after_days(self, days: int, callback: Callable) -> Callable:
+        """Run a callback once, when the game day `days` from now begins"""
+        due_day = self._time_data().get('total_days', 0) + max(1, days)
+        self.wheel.setdefault(due_day, []).append(callback)
+        return callback
+
+    def cancel(self, callback: Callable):
+        """Remove a callback from every boundary and deadline"""
+        for callbacks in self.recurring.values():
+            while callback in callbacks:
+                callbacks.remove(callback)
+        for due_day in list(self.wheel):
+            bucket = [queued for queued in self.wheel[due_day] if queued is not callback]
+            if bucket:
+                self.wheel[due_day] = bucket
+            else:
+                del self.wheel[due_day]
+
+    def detach(self):
+        """Stop listening to the clock (when the screen that owns it closes)"""
+        self.time_system.remove_boundary_listener(self.on_boundaries)
+
+    def on_boundaries(self, boundaries: Dict):
+        """TimeSystem listener - fire everything whose deadline was crossed"""
+        previous_day = self.last_total_days
+        self._remember_position()
+        self._fire(boundaries, previous_day)
+
+    def sync(self) -> bool:
+        """
+        Catch up on days advanced by another TimeSystem on the same game data
+        (e.g. the week that passes when Planning completes)
+
+        Returns:
+            True if anything had to be caught up
+        """
+        time_data = self._time_data()
+        total_days = time_data.get('total_days', 0)
+        if total_days == self.last_total_days:
+            return False
+
+        previous_day = self.last_total_days
+        start = datetime.date(*self.last_date)
+        end = datetime.date(time_data.get('year', 1978), time_data.get('month', 1), time_data.get('day', 1))
+        self._remember_position()
+
+        months = []
+        year, month = start.year, start.month
+        while (year, month) < (end.year, end.month):
+            month += 1
+            if month > 12:
+                month = 1
+                year += 1
+            months.append((year, month))
+
+        boundaries = {
+            'days': max(0, total_days - previous_day),
+            'weeks': self.time_system.count_week_starts(start, end) if end > start else 0,
+            'months': months,
+            'years': [year for year, month in months if month == 1]
+        }
+        self._fire(boundaries, previous_day)
+        return True
+
+    def _fire(self, boundaries: Dict, previous_day: int):
+        """Run recurring callbacks for the crossed boundaries, then due deadlines"""
+        crossed = {
+            'day': boundaries['days'] > 0,
+            'week': boundaries['weeks'] > 0,
+            'month': bool(boundaries['months']),
+            'year': bool(boundaries['years'])
+        }
+        for kind in self.BOUNDARIES:
+            if crossed[kind]:
+                for callback in list(self.recurring[kind]):
+                    callback(boundaries)
+
+        # Only look at buckets that can be due (whichever is smaller: days crossed or queued)
+        current_day = previous_day + boundaries['days']
+        if boundaries['days'] < len(self.wheel):
+            due_days = [day for day in range(previous_day + 1, current_day + 1) if day in self.wheel]
+        else:
+            due_days = sorted(day for day in self.wheel if day <= current_day)
+
+        for due_day in due_days:
+            for callback in self.wheel.pop(due_day):
+                callback(boundaries)
+
+
+# Example usage
+if __name__ == "__main__":
+    from systems.game_systems import TimeSystem
+
+    class DemoGameData:
+        def __init__(self):
+            self.data = {}
+
+    time_system = TimeSystem(DemoGameData())
+    time_system.time_scale = time_system.time_scale_presets['max_speed']
+    scheduler = TimeScheduler(time_system)
+
+    scheduler.every('month', lambda b: print(f"Rent due for {b['months']}"))
+    scheduler.every('year', lambda b: print(f"Happy new year {b['years']}"))
+    scheduler.after_days(10, lambda b: print("Ten days have passed"))
+
+    # Skip a quarter in one step - callbacks fire once per crossing kind
+    time_system.advance_time_minutes(92 * 24 * 60)
+    print(time_system.get_date_string())
@@ -0,0 +1,187 @@
+"""
+Turbo Simulation
+Runs the daily life systems over months or years of game time in a tight loop, off the UI thread
+"""
+
+import datetime
+import threading
+import time
+from typing import Dict, List, Optional
+
+from systems.game_systems import TimeSystem, EnergySystem, HappinessSystem
+from systems.money_system import MoneySystem
+from systems.bills_system import BillsSystem
+from systems.time_scheduler import TimeScheduler
+
+
+class TurboSimulation:
+    """Skip ahead day by day without rendering - the UI only polls get_progress()"""
+
+    # Days simulated per lock hold - keeps UI reads short without locking every day
+    CHUNK_DAYS = 7
+
+    def __init__(self, game_data, money_system: Optional[MoneySystem] = None):
+        """
+        Args:
+            game_data: GameData to simulate on
+            money_system: MoneySystem to pay rent from (created if not given)
+        """
+        self.game_data = game_data
+
+        # A private clock, so month callbacks fire here and not on the UI's scheduler
+        self.time_system = TimeSystem(game_data)
+        self.energy_system = EnergySystem(game_data)
+        self.happiness_system = HappinessSystem(game_data)
+        self.money_system = money_system or MoneySystem(game_data)
+
+        # Only saves that track bills pay them - BillsSystem covers apartment rent too
+        self.bills_system = BillsSystem(game_data, self.money_system) if 'bills' in game_data.data else None
+
+        self.scheduler = TimeScheduler(self.time_system)
+        self.scheduler.every('month', self.process_month)
+
+        # Held while game data is being changed - readers on other threads take it too
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        self.messages: List[str] = []
+        self.days_total = 0
+        self.days_done = 0
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    def days_for_years(self, years: int) -> int:
+        """Number of game days from the current date to the same date `years` later"""
+        time_data = self.game_data.data['time']
+        year, month = time_data.get('year', 1978), time_data.get('month', 1)
+        day = min(time_data.get('day', 1), 28) if month == 2 else time_data.get('day', 1)
+
+        start = datetime.date(year, month, day)
+        return (start.replace(year=year + years) - start).days
+
+    def process_month(self, boundaries: Dict):
+        """Pay the month's rent (or bills) on the date it comes due"""
+        current_date = self.time_system.get_iso_date()
+
+        if self.bills_system is not None:
+            all_paid, messages = self.bills_system.process_monthly_bills(current_date)
+            # Rent was one of the bills - don't let MoneySystem charge it again
+            self.game_data.data['money']['last_rent_paid'] = current_date[:7]
+            if not all_paid:
+                self.messages.extend(f"{current_date}: {message}" for message in messages)
+            if self.game_data.data['bills'].get('game_over'):
+                self.stop_event.set()
+        else:
+            result, message = self.money_system.process_monthly_expenses(current_date)
+            if result is False:
+                self.messages.append(f"{current_date}: {message}")
+
+    def simulate_day(self):
+        """Advance one day and run every daily system"""
+        # Hygiene decays inside advance_days
+        self.time_system.advance_days(1)
+        self.energy_system.daily_update()
+        self.happiness_system.daily_update()
+
+    def run(self, days: Optional[int] = None, years: Optional[int] = None) -> Dict:
+        """
+        Simulate in the calling thread
+
+        Args:
+            days: Number of days to simulate
+            years: Or a number of years (converted with days_for_years)
+
+        Returns:
+            Progress dict (see get_progress)
+        """
+        if days is None:
+            days = self.days_for_years(years or 1)
+
+        self.stop_event.clear()
+        self.messages = []
+        self.days_total = days
+        self.days_done = 0
+        self.started_at = time.time()
+        self.finished_at = 0.0
+
+        while self.days_done < self.days_total and not self.stop_event.is_set():
+            with self.lock:
+                chunk = min(self.CHUNK_DAYS, self.days_total - self.days_done)
+                for _ in range(chunk):
+                    self.simulate_day()
+                    self.days_done += 1
+                    if self.stop_event.is_set():
+                        break
+
+        self.finished_at = time.time()
+        return self.get_progress()
+
+    def start(self, days: Optional[int] = None, years: Optional[int] = None) -> bool:
+        """
+        Simulate on a background thread
+
+        Returns:
+            False if a simulation is already running
+        """
+        if self.is_running():
+            return False
+
+        # Set before the thread starts so get_progress is right immediately
+        self.days_total = days if days is not None else self.days_for_years(years or 1)
+        self.days_done = 0
+        self.finished_at = 0.0
+
+        self.thread = threading.Thread(target=self.run, args=(self.days_total,))
+        self.thread.daemon = True
+        self.thread.start()
+        return True
+
+    def stop(self, wait: bool = False):
+        """
+        Ask a running simulation to stop after the current day
+
+        Args:
+            wait: Block until the thread has finished changing the game data
+        """
+        self.stop_event.set()
+        if wait and self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def get_progress(self) -> Dict:
+        """Days done so far, the share of the run, and real seconds spent"""
+        end = self.finished_at or time.time()
+        return {
+            'days_done': self.days_done,
+            'days_total': self.days_total,
+            'fraction': self.days_done / self.days_total if self.days_total else 1.0,
+            'seconds': end - self.started_at if self.started_at else 0.0,
+            'finished': bool(self.finished_at),
+            'messages': list(self.messages)
+        }
+
+
+# Example usage
+if __name__ == "__main__":
+    class DemoGameData:
+        def __init__(self):
+            self.data = {'player_data': {'stress_level': 0}}
+
+    game_data = DemoGameData()
+    turbo = TurboSimulation(game_data)
+    game_data.data['money']['bank_balance'] = 20000
+    start_date = turbo.time_system.get_date_string()
+
+    turbo.start(years=10)
+    while turbo.is_running():
+        time.sleep(0.05)
+        progress = turbo.get_progress()
+        print(f"  {progress['fraction']:.0%} ({progress['days_done']} days)")
+
+    progress = turbo.get_progress()
+    print(f"{start_date} -> {turbo.time_system.get_date_string()} in {progress['seconds']:.2f}s")
+    print(f"Bank balance: ${game_data.data['money']['bank_balance']}")
+    print(f"Problems: {len(progress['messages'])}")
@@ -2,16 +2,26 @@
 Console and Platform Database
 Contains all gaming platforms, computers, and handhelds from 1978-2030
 Uses randomized company names from our NPC database
+Each run's table is generated once from a seed and reused (see RunPlatforms for the saved copy)
 """
 
 import random
 import sys
 import os
+from bisect import bisect_right
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from npcs.npc_database import COMPANY_NAMES
 
 class ConsoleDatabase:
-    def __init__(self):
+    def __init__(self, seed=None, generations=None):
+        """
+        Args:
+            seed: Seed for this run's manufacturers (a new random one if not given)
+            generations: A previously generated table (e.g. from the run file) to use as is
+        """
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+
         # Define console lineages - these will evolve across generations
         self.console_lineages = {
             # Long-running lineages (span 5+ generations)
@@ -65,13 +75,68 @@ class ConsoleDatabase:
             "HandyMax": ["HandyMax", "HandyMax Color", "HandyMax XL", "HandyMax Touch", "HandyMax Cloud"]
         }
 
-        # Console generations with lineage system
-        self.console_generations = self.generate_all_console_generations()
+        # Console generations with lineage system, generated once per run (RunPlatforms keeps the table)
+        if generations is None:
+            generations = self.generate_all_console_generations()
+        self.console_generations = generations
+
+        # Generation start years, for bisecting a year to its generation
+        ordered = sorted(generations.items(), key=lambda item: item[1]["year_range"][0])
+        self.generation_starts = [gen_data["year_range"][0] for gen_name, gen_data in ordered]
+        self.generation_order = [gen_name for gen_name, gen_data in ordered]
 
     def get_random_company(self, year):
-        """Get a random company name for the given year"""
+        """Get a random company name for the given year (from this run's seeded generator)"""
         # COMPANY_NAMES is a list, just pick a random one
-        return random.choice(COMPANY_NAMES)
+        return self.rng.choice(COMPANY_NAMES)
+
+    def to_table(self):
+        """The generated table with [name, company] pairs, for saving"""
+        return {
+            gen_name: {
+                "year_range": list(gen_data["year_range"]),
+                **{kind: [[platform["name"], platform["company"]] for platform in gen_data[kind]]
+                   for kind in ("consoles", "computers", "handhelds")}
+            }
+            for gen_name, gen_data in self.console_generations.items()
+        }
+
+    @staticmethod
+    def from_table(table):
+        """Rebuild console_generations from to_table() output"""
+        return {
+            gen_name: {
+                "year_range": tuple(gen_data["year_range"]),
+                **{kind: [{"name": name, "company": company} for name, company in gen_data[kind]]
+                   for kind in ("consoles", "computers", "handhelds")}
+            }
+            for gen_name, gen_data in table.items()
+        }
+
+    def assign_companies(self, kind, selected_by_gen):
+        """
+        Give platforms the manufacturers a run already picked for them
+        (when a table is rebuilt for a run saved without one)
+
+        Args:
+            kind: 'consoles' or 'handhelds'
+            selected_by_gen: {generation name: [{'name', 'company'}]}
+        """
+        for gen_name, selected in selected_by_gen.items():
+            companies = {platform["name"]: platform["company"] for platform in selected}
+            for platform in self.console_generations.get(gen_name, {}).get(kind, []):
+                if platform["name"] in companies:
+                    platform["company"] = companies[platform["name"]]
+
+    def get_generation_for_year(self, year):
+        """Name of the generation covering a year, or None"""
+        index = bisect_right(self.generation_starts, year) - 1
+        if index < 0:
+            return None
+        gen_name = self.generation_order[index]
+        if year > self.console_generations[gen_name]["year_range"][1]:
+            return None
+        return gen_name
 
 
     def generate_all_console_generations(self):
@@ -162,49 +227,25 @@ class ConsoleDatabase:
         return generations
 
     def get_platforms_for_year(self, year):
-        """Get available platforms for a specific year with randomized companies"""
-        # Regenerate companies each time for variety
-        available = {
-            "consoles": [],
-            "computers": [],
-            "handhelds": []
+        """Get available platforms for a specific year (the same manufacturers for the whole run)"""
+        gen_name = self.get_generation_for_year(year)
+        if gen_name is None:
+            return {"consoles": [], "computers": [], "handhelds": []}
+
+        # Copies - callers may filter or sort them without changing the run's table
+        gen_data = self.console_generations[gen_name]
+        return {
+            "consoles": list(gen_data["consoles"]),
+            "computers": list(gen_data["computers"]),
+            "handhelds": list(gen_data["handhelds"])
         }
 
-        # Find the right generation
-        for gen_name, gen_data in self.console_generations.items():
-            if gen_data["year_range"][0] <= year <= gen_data["year_range"][1]:
-                # Regenerate companies for this session
-                for console in gen_data["consoles"]:
-                    available["consoles"].append({
-                        "name": console["name"],
-                        "company": self.get_random_company(year)
-                    })
-                for computer in gen_data["computers"]:
-                    if "Various" in computer["company"]:
-                        available["computers"].append(computer)
-                    else:
-                        available["computers"].append({
-                            "name": computer["name"],
-                            "company": self.get_random_company(year)
-                        })
-                for handheld in gen_data["handhelds"]:
-                    if "Various" in handheld.get("company", ""):
-                        available["handhelds"].append(handheld)
-                    else:
-                        available["handhelds"].append({
-                            "name": handheld["name"],
-                            "company": self.get_random_company(year)
-                        })
-                break
-
-        return available
-
     def print_full_database(self):
         """Print the complete console database"""
         print("=" * 80)
         print("COMPLETE CONSOLE DATABASE")
         print("=" * 80)
-        print("\nNOTE: Console names are fixed, but manufacturers randomize each game session")
+        print(f"\nNOTE: Console names are fixed; manufacturers are picked once per run (seed {self.seed})")
         print("=" * 80)
 
         # First print the lineage overview
@@ -2,8 +2,10 @@
 Run-specific Platform Selection System
 Randomly selects 5 consoles and 2 handhelds per generation for each game run
 Also selects competitor companies for the run
+Runs are stored as a small versioned JSON file (saves/current_run.run)
 """
 
+import json
 import random
 import pickle
 import os
@@ -12,11 +14,51 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tech.console_database import ConsoleDatabase
 from npcs.npc_database import COMPANY_NAMES, NPCGenerator
 
+# Years covered by each console generation, in order
+GENERATION_YEARS = {
+    "early_80s": (1978, 1983),
+    "late_80s": (1984, 1989),
+    "early_90s": (1990, 1994),
+    "late_90s": (1995, 1999),
+    "early_2000s": (2000, 2005),
+    "late_2000s": (2006, 2009),
+    "early_2010s": (2010, 2017),
+    "late_2010s": (2018, 2024),
+    "future_2025": (2025, 2030)
+}
+
+# Computers are available in every year
+COMPUTERS = [
+    {"name": "PC", "company": "Various Manufacturers"},
+    {"name": "MAC", "company": "Various Manufacturers"}
+]
+
+
+class RestrictedUnpickler(pickle.Unpickler):
+    """Reads old .pkl runs, which only hold dicts, lists and strings - refuses anything that runs code"""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Old run file references {module}.{name}")
+
+
 class RunPlatforms:
     """Manages platform selection for a specific game run"""
 
-    def __init__(self):
-        self.console_db = ConsoleDatabase()
+    # Run file layout version - bump when the layout changes, and handle the old one in load_run
+    # 1: selected platforms and companies; 2: adds the run's seeded console table
+    RUN_FILE_VERSION = 2
+    SUPPORTED_VERSIONS = (1, 2)
+    # Not .json - the save list picks up every .json file in saves/
+    RUN_FILE = "current_run.run"
+    LEGACY_RUN_FILE = "current_run.pkl"
+
+    def __init__(self, randomize=True):
+        """
+        Args:
+            randomize: Pick a run right away (skip when a saved run is about to be loaded)
+        """
+        self._console_db = None
+        self.console_table = None  # (seed, table) from the run file, turned into console_db when needed
         self.npc_gen = NPCGenerator()
 
         # Selected platforms for this run
@@ -26,22 +68,39 @@ class RunPlatforms:
         # Selected competitor companies for this run (10-20 companies)
         self.run_companies = []
 
+        # {year: platforms dict} for every year of every generation, rebuilt whenever the run changes
+        self.year_index = {}
+
         # Initialize the run
-        self.randomize_run()
+        if randomize:
+            self.randomize_run()
+
+    @property
+    def console_db(self):
+        """This run's console database - restored from the run file's table, never regenerated"""
+        if self._console_db is None:
+            if self.console_table is not None:
+                seed, table = self.console_table
+                self._console_db = ConsoleDatabase(seed, ConsoleDatabase.from_table(table))
+            else:
+                # A run saved without a table (version 1): generate one that agrees with its platforms
+                self._console_db = ConsoleDatabase()
+                self._console_db.assign_companies("consoles", self.run_consoles)
+                self._console_db.assign_companies("handhelds", self.run_handhelds)
+        return self._console_db
 
     def randomize_run(self):
         """Randomize platforms and companies for this run"""
+        # A new run gets its own seeded console table
+        self._console_db = ConsoleDatabase()
+        self.console_table = None
         self.select_run_platforms()
         self.select_run_companies()
+        self.build_year_index()
 
     def select_run_platforms(self):
         """Select 5 consoles and 2 handhelds per generation"""
-        generation_names = [
-            "early_80s", "late_80s", "early_90s", "late_90s",
-            "early_2000s", "late_2000s", "early_2010s", "late_2010s", "future_2025"
-        ]
-
-        for gen_name in generation_names:
+        for gen_name in GENERATION_YEARS:
             if gen_name in self.console_db.console_generations:
                 gen_data = self.console_db.console_generations[gen_name]
 
@@ -73,61 +132,197 @@ class RunPlatforms:
         # Sort alphabetically for easier viewing
         self.run_companies.sort()
 
+    def build_year_index(self):
+        """Precompute the platforms of every year, so get_platforms_for_year is a lookup"""
+        self.year_index = {}
+        for gen_name, (start_year, end_year) in GENERATION_YEARS.items():
+            platforms = {
+                "consoles": self.run_consoles.get(gen_name, []),
+                "computers": COMPUTERS,
+                "handhelds": self.run_handhelds.get(gen_name, [])
+            }
+            for year in range(start_year, end_year + 1):
+                self.year_index[year] = platforms
+
     def get_platforms_for_year(self, year):
         """Get available platforms for a specific year (only from selected run platforms)"""
-        # Find the right generation
-        generation_map = {
-            "early_80s": (1978, 1983),
-            "late_80s": (1984, 1989),
-            "early_90s": (1990, 1994),
-            "late_90s": (1995, 1999),
-            "early_2000s": (2000, 2005),
-            "late_2000s": (2006, 2009),
-            "early_2010s": (2010, 2017),
-            "late_2010s": (2018, 2024),
-            "future_2025": (2025, 2030)
+        platforms = self.year_index.get(year)
+        if platforms is None:
+            return {"consoles": [], "computers": [], "handhelds": []}
+        # Copies of the lists, so callers can't change the run
+        return {kind: list(entries) for kind, entries in platforms.items()}
+
+    def to_run_data(self):
+        """The run in the run file layout: platforms as [name, company] pairs per generation"""
+        return {
+            "version": self.RUN_FILE_VERSION,
+            "generations": {
+                gen_name: {
+                    "consoles": [[console["name"], console["company"]] for console in self.run_consoles.get(gen_name, [])],
+                    "handhelds": [[handheld["name"], handheld["company"]] for handheld in self.run_handhelds.get(gen_name, [])]
+                }
+                for gen_name in GENERATION_YEARS
+            },
+            "companies": self.run_companies,
+            "console_seed": self.console_db.seed,
+            "console_table": self.console_db.to_table()
         }
 
-        for gen_name, (start_year, end_year) in generation_map.items():
-            if start_year <= year <= end_year:
-                return {
-                    "consoles": self.run_consoles.get(gen_name, []),
-                    "computers": [
-                        {"name": "PC", "company": "Various Manufacturers"},
-                        {"name": "MAC", "company": "Various Manufacturers"}
-                    ],
-                    "handhelds": self.run_handhelds.get(gen_name, [])
-                }
+    @staticmethod
+    def _check_pairs(entries, what):
+        """Raise unless entries is a list of [name, company] string pairs"""
+        if not isinstance(entries, list) or not all(
+                isinstance(entry, list) and len(entry) == 2 and all(isinstance(part, str) for part in entry)
+                for entry in entries):
+            raise ValueError(f"Bad {what}")
+
+    @staticmethod
+    def validate_run_data(run_data):
+        """
+        Check a run file's contents against the current layout
+
+        Raises:
+            ValueError: Describing the first problem found
+        """
+        if not isinstance(run_data, dict):
+            raise ValueError("Run file is not an object")
+        version = run_data.get("version")
+        if version not in RunPlatforms.SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported run file version: {version}")
+
+        generations = run_data.get("generations")
+        if not isinstance(generations, dict) or set(generations) != set(GENERATION_YEARS):
+            raise ValueError("Run file generations don't match the known generations")
+        for gen_name, platforms in generations.items():
+            for kind in ("consoles", "handhelds"):
+                entries = platforms.get(kind) if isinstance(platforms, dict) else None
+                RunPlatforms._check_pairs(entries, f"{kind} for {gen_name}")
+
+        companies = run_data.get("companies")
+        if not isinstance(companies, list) or not all(isinstance(company, str) for company in companies):
+            raise ValueError("Bad company list")
+
+        if version >= 2:
+            if not isinstance(run_data.get("console_seed"), int):
+                raise ValueError("Bad console seed")
+            table = run_data.get("console_table")
+            if not isinstance(table, dict) or set(table) != set(GENERATION_YEARS):
+                raise ValueError("Console table generations don't match the known generations")
+            for gen_name, gen_data in table.items():
+                year_range = gen_data.get("year_range") if isinstance(gen_data, dict) else None
+                if not isinstance(year_range, list) or len(year_range) != 2 or \
+                        not all(isinstance(year, int) for year in year_range):
+                    raise ValueError(f"Bad year range for {gen_name}")
+                for kind in ("consoles", "computers", "handhelds"):
+                    RunPlatforms._check_pairs(gen_data.get(kind), f"console table {kind} for {gen_name}")
+
+            # The table is the run's source of truth for manufacturers - it must agree with the selections
+            for gen_name, platforms in generations.items():
+                for kind in ("consoles", "handhelds"):
+                    listed = {tuple(entry) for entry in table[gen_name][kind]}
+                    for name, company in platforms[kind]:
+                        if (name, company) not in listed:
+                            raise ValueError(f"{name} ({company}) in {gen_name} doesn't match the console table")
+
+    def apply_run_data(self, run_data):
+        """Take over a validated run and index it"""
+        generations = run_data["generations"]
+        self.run_consoles = {
+            gen_name: [{"name": name, "company": company} for name, company in platforms["consoles"]]
+            for gen_name, platforms in generations.items()
+        }
+        self.run_handhelds = {
+            gen_name: [{"name": name, "company": company} for name, company in platforms["handhelds"]]
+            for gen_name, platforms in generations.items()
+        }
+        self.run_companies = list(run_data["companies"])
+        self.build_year_index()
 
-        return {"consoles": [], "computers": [], "handhelds": []}
+        # Version 1 files have no console table - one is generated if it's ever needed
+        self._console_db = None
+        self.console_table = None
+        if "console_table" in run_data:
+            self.console_table = (run_data["console_seed"], run_data["console_table"])
+
+    def save_run(self, filename=RUN_FILE):
+        """
+        Save the current run configuration (written to a temp file, then renamed over the old one)
+
+        Raises:
+            ValueError: If the run doesn't validate - nothing is written
+        """
+        run_data = self.to_run_data()
+        self.validate_run_data(run_data)
 
-    def save_run(self, filename="current_run.pkl"):
-        """Save the current run configuration"""
         save_path = os.path.join("saves", filename)
         os.makedirs("saves", exist_ok=True)
 
-        save_data = {
-            "run_consoles": self.run_consoles,
-            "run_handhelds": self.run_handhelds,
-            "run_companies": self.run_companies
-        }
+        temp_path = save_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(run_data, f, separators=(',', ':'))
+        os.replace(temp_path, save_path)
 
-        with open(save_path, 'wb') as f:
-            pickle.dump(save_data, f)
+    def load_run(self, filename=RUN_FILE):
+        """
+        Load a saved run configuration
+        An old pickled run is converted to the run file on first load
 
-    def load_run(self, filename="current_run.pkl"):
-        """Load a saved run configuration"""
+        Returns:
+            True if a valid run was loaded
+        """
         save_path = os.path.join("saves", filename)
 
         if os.path.exists(save_path):
-            with open(save_path, 'rb') as f:
-                save_data = pickle.load(f)
-                self.run_consoles = save_data["run_consoles"]
-                self.run_handhelds = save_data["run_handhelds"]
-                self.run_companies = save_data["run_companies"]
-                return True
+            try:
+                with open(save_path, 'r', encoding='utf-8') as f:
+                    run_data = json.load(f)
+                self.validate_run_data(run_data)
+            except ValueError as e:
+                print(f"Ignoring run file {save_path}: {e}")
+                return False
+            self.apply_run_data(run_data)
+            if run_data["version"] < self.RUN_FILE_VERSION:
+                # Upgrade in place, so the console table is generated once and kept
+                try:
+                    self.save_run(filename)
+                except ValueError as e:
+                    print(f"Keeping run file {save_path} at version {run_data['version']}: {e}")
+            return True
+
+        if filename == self.RUN_FILE:
+            return self.migrate_legacy_run()
         return False
 
+    def migrate_legacy_run(self):
+        """
+        Convert saves/current_run.pkl from before run files existed
+
+        Returns:
+            True if an old run was found and converted
+        """
+        legacy_path = os.path.join("saves", self.LEGACY_RUN_FILE)
+        if not os.path.exists(legacy_path):
+            return False
+
+        try:
+            with open(legacy_path, 'rb') as f:
+                save_data = RestrictedUnpickler(f).load()
+            self.run_consoles = save_data["run_consoles"]
+            self.run_handhelds = save_data["run_handhelds"]
+            self.run_companies = save_data["run_companies"]
+
+            # The old run has no console table - one is built around its platforms
+            self._console_db = None
+            self.console_table = None
+            self.build_year_index()
+            self.save_run()
+        except (pickle.UnpicklingError, EOFError, KeyError, TypeError, ValueError) as e:
+            print(f"Ignoring old run file {legacy_path}: {e}")
+            return False
+
+        os.remove(legacy_path)
+        return True
+
     def print_run_platforms(self):
         """Print the selected platforms for this run"""
         print("=" * 80)
@@ -181,4 +376,12 @@ if __name__ == "__main__":
 
     # Save the run
     run.save_run()
-    print("\n\nRun configuration saved to saves/current_run.pkl")
\ No newline at end of file
+    print(f"\n\nRun configuration saved to saves/{RunPlatforms.RUN_FILE}")
+
+    # Loading a run is reading one small JSON file - no console database is built
+    import time
+    start = time.perf_counter()
+    loaded = RunPlatforms(randomize=False)
+    loaded.load_run()
+    print(f"Loaded in {(time.perf_counter() - start) * 1000:.2f} ms, "
+          f"same platforms in 1985: {loaded.get_platforms_for_year(1985) == run.get_platforms_for_year(1985)}")
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Test the memoized bill totals
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from systems.bills_system import BillsSystem
+
+class DemoGameData:
+    def __init__(self):
+        self.data = {
+            'money': {'monthly_rent': 150},
+            'employees': [
+                {'id': 1, 'name': 'Ada', 'salary': 1000, 'active': True},
+                {'id': 2, 'name': 'Alan', 'salary': 800, 'active': True}
+            ],
+            'loans': [{'id': 1, 'lender': 'Bank', 'monthly_payment': 200, 'active': True}]
+        }
+
+def test_changes_update_totals():
+    """Raises, deactivations and paid-off loans reach the totals, and in-place edits do once announced"""
+    print("Testing BillsSystem memoized totals...")
+    game_data = DemoGameData()
+    bills = BillsSystem(game_data)
+    assert bills.get_total_monthly_bills() == 150 + 1000 + 800 + 200
+
+    bills.update_employee(1, salary=1500)
+    print(f"  After raise: {bills.get_total_monthly_bills()}")
+    assert bills.get_total_monthly_bills() == 150 + 1500 + 800 + 200
+    assert bills.get_total_salaries() == 2300
+
+    bills.update_employee(2, active=False)
+    bills.close_loan(1)
+    assert bills.get_total_monthly_bills() == 150 + 1500
+    assert bills.has_employees()
+    assert [bill['amount'] for bill in bills.calculate_monthly_bills()] == [150, 1500]
+
+    # Edits made straight on the data count once the bills version is bumped
+    game_data.data['employees'][0]['salary'] = 2000
+    bills.bump_bills_version()
+    assert bills.get_total_monthly_bills() == 150 + 2000
+
+    # The office and the rent are checked on every read
+    game_data.data['office'] = {'has_office': True, 'size': 'small'}
+    game_data.data['money']['monthly_rent'] = 200
+    assert bills.get_total_monthly_bills() == BillsSystem(game_data).get_total_monthly_bills()
+
+    print("\nTest completed!")
+
+def test_changes_reach_other_instances():
+    """A change made through one BillsSystem rebuilds the memoized bills of another"""
+    print("Testing BillsSystem shared bills version...")
+    game_data = DemoGameData()
+    bank_bills, studio_bills = BillsSystem(game_data), BillsSystem(game_data)
+    assert bank_bills.get_total_salaries() == 1800
+
+    studio_bills.hire_employee({'id': 3, 'name': 'Grace', 'salary': 1200, 'active': True})
+    assert bank_bills.get_total_salaries() == 3000
+
+    # A loaded game replaces the data
+    game_data.data = DemoGameData().data
+    assert bank_bills.get_total_salaries() == 1800
+
+    print("\nTest completed!")
+
+def test_delta_methods_match_rebuild():
+    """hire/fire/update/add_loan keep the same totals a full rebuild gives"""
+    print("Testing BillsSystem delta methods...")
+    game_data = DemoGameData()
+    bills = BillsSystem(game_data)
+
+    bills.hire_employee({'id': 3, 'name': 'Grace', 'salary': 1200, 'active': True})
+    bills.fire_employee(2)
+    bills.update_employee(1, salary=900)
+    bills.add_loan({'id': 2, 'lender': 'Shark', 'monthly_payment': 300, 'active': True})
+
+    rebuilt = BillsSystem(game_data)
+    assert bills.get_total_monthly_bills() == rebuilt.get_total_monthly_bills() == 150 + 900 + 1200 + 200 + 300
+    assert bills.get_mandatory_bills_total() == rebuilt.get_mandatory_bills_total()
+
+    print("\nTest completed!")
+
+if __name__ == "__main__":
+    test_changes_update_totals()
+    test_changes_reach_other_instances()
+    test_delta_methods_match_rebuild()
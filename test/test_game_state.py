@@ -0,0 +1,66 @@
+"""
+Test that typed state records read and save like the dicts they replace
+"""
+
+import sys
+import os
+import copy
+import json
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from systems.game_state import json_default, wrap_state
+from systems.money_system import MoneySystem
+
+class DemoGameData:
+    def __init__(self, data):
+        self.data = wrap_state(data)
+
+def test_missing_keys_stay_missing():
+    """Keys an old save never had aren't invented - get() gives the caller's default and saves leave them out"""
+    print("Testing keys missing from a save...")
+    data = wrap_state({'player_data': {'studio_name': 'X'}})
+    player = data['player_data']
+
+    assert player.get('current_money', 0) == 0
+    assert 'energy' not in player and 'current_money' not in player
+    assert list(player) == ['studio_name'] and len(player) == 1
+    assert player.to_dict() == {'studio_name': 'X'}
+    assert json.loads(json.dumps(data, default=json_default)) == {'player_data': {'studio_name': 'X'}}
+    try:
+        player['player_name']
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("Missing key was read")
+
+    # The systems still see their defaults as attributes
+    assert player.energy == 100
+
+    # Writing a key, by item or attribute, makes it part of the save
+    player['current_money'] = 250
+    player.energy = 80
+    assert player.to_dict() == {'studio_name': 'X', 'current_money': 250, 'energy': 80}
+    assert copy.deepcopy(player).to_dict() == player.to_dict()
+
+    del player['energy']
+    assert 'energy' not in player and player.to_dict() == {'studio_name': 'X', 'current_money': 250}
+
+    print("\nTest completed!")
+
+def test_missing_keys_initialised():
+    """Initialisation checks for keys absent from an old save run again"""
+    print("Testing initialisation of missing keys...")
+    game_data = DemoGameData({'money': {'cash_on_hand': 5, 'bank_balance': 1000,
+                                        'monthly_rent': 150, 'transaction_history': []}})
+    money = game_data.data['money']
+    assert 'last_rent_paid' not in money
+
+    MoneySystem(game_data).process_monthly_expenses('1978-02-03')
+    assert money.to_dict()['last_rent_paid'] == '1978-02'
+    assert money['bank_balance'] == 850
+
+    print("\nTest completed!")
+
+if __name__ == "__main__":
+    test_missing_keys_stay_missing()
+    test_missing_keys_initialised()
@@ -0,0 +1,58 @@
+"""
+Test the headless development simulator
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from systems.headless_development import HeadlessDevelopment
+from systems.stage_scoring import DevelopmentStage
+from systems.game_development import GameRating
+
+def test_headless_simulation():
+    """Run full development cycles and check the results are consistent"""
+    print("Testing HeadlessDevelopment...")
+    simulator = HeadlessDevelopment(year=1988, seed=1234)
+    results = simulator.simulate_many(200)
+
+    for result in results:
+        # Every stage runs, in order
+        assert [stage.stage for stage in result.stages] == list(DevelopmentStage)
+
+        # Every bounce is worth at least 2 points
+        for stage in result.stages:
+            assert all(score >= 2 for score in stage.bounce_scores)
+            assert len(stage.bounce_scores) == stage.bounces
+
+        assert result.bugs >= 0
+        assert isinstance(result.rating, GameRating)
+
+    summary = HeadlessDevelopment.summarize(results)
+    print(f"  Runs: {summary['runs']}")
+    print(f"  Average total: {summary['average_total']:.1f}")
+    print(f"  Average bugs: {summary['average_bugs']:.1f}")
+    assert summary['runs'] == 200
+    assert sum(summary['ratings'].values()) == 200
+
+    print("\nTest completed!")
+
+def test_headless_replay():
+    """Replaying a run from its recorded project seed gives the same game"""
+    print("Testing HeadlessDevelopment replay...")
+
+    first = HeadlessDevelopment(year=1990, seed=7).simulate()
+    replay = HeadlessDevelopment(year=1990).simulate(project=first.project, seed=first.seed)
+
+    print(f"  Project: {first.project} (seed {first.seed})")
+    print(f"  First:  {first.score}, bugs {first.bugs}")
+    print(f"  Replay: {replay.score}, bugs {replay.bugs}")
+    assert replay.score == first.score
+    assert replay.bugs == first.bugs
+    assert [stage.bounce_scores for stage in replay.stages] == [stage.bounce_scores for stage in first.stages]
+
+    print("\nTest completed!")
+
+if __name__ == "__main__":
+    test_headless_simulation()
+    test_headless_replay()
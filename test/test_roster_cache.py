@@ -0,0 +1,85 @@
+"""
+Test the SQLite cache of the NPC roster
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from npcs.roster_cache import RosterCache
+
+NPC_DIR = Path(__file__).parent.parent / "npcs" / "npcslist"
+
+def copy_roster(work_dir):
+    npc_dir = Path(work_dir) / "npcslist"
+    shutil.copytree(NPC_DIR, npc_dir, ignore=shutil.ignore_patterns(RosterCache.CACHE_FILE))
+    return npc_dir
+
+def test_edit_reparses_one_file():
+    """Editing one NPC file re-parses only that file, and the cache picks up the change"""
+    print("Testing an edited NPC file...")
+    with tempfile.TemporaryDirectory() as work_dir:
+        npc_dir = copy_roster(work_dir)
+        cache = RosterCache(npc_dir)
+        npcs = cache.load()
+        assert cache.last_parsed == len(npcs) > 1
+
+        cache.load()
+        assert cache.last_parsed == 0
+
+        changed = sorted(npc_dir.glob("*.yml"))[0]
+        text = changed.read_text(encoding='utf-8')
+        old_name = RosterCache.parse_file(changed)['name']
+        changed.write_text(text.replace(old_name, "Renamed Person", 1), encoding='utf-8')
+
+        reloaded = cache.load()
+        print(f"  Parsed after the edit: {cache.last_parsed}")
+        assert cache.last_parsed == 1
+        assert len(reloaded) == len(npcs)
+        assert [npc['name'] for npc in reloaded].count("Renamed Person") == 1
+        assert old_name not in [npc['name'] for npc in reloaded]
+
+    print("\nTest completed!")
+
+def test_delete_drops_one_row():
+    """Deleting one NPC file drops only its row, without parsing anything else"""
+    print("Testing a deleted NPC file...")
+    with tempfile.TemporaryDirectory() as work_dir:
+        npc_dir = copy_roster(work_dir)
+        cache = RosterCache(npc_dir)
+        npcs = cache.load()
+
+        removed = sorted(npc_dir.glob("*.yml"))[0]
+        removed_id = RosterCache.parse_file(removed)['id']
+        removed.unlink()
+
+        reloaded = cache.load()
+        assert cache.last_parsed == 0
+        assert reloaded == [npc for npc in npcs if npc['id'] != removed_id]
+
+    print("\nTest completed!")
+
+def test_cache_matches_parsing():
+    """The cached roster comes back in the same order as parsing the files, NPCs without an id last"""
+    print("Testing cached vs parsed order...")
+    with tempfile.TemporaryDirectory() as work_dir:
+        npc_dir = copy_roster(work_dir)
+        (npc_dir / "00_no_id.yml").write_text("character:\n  name: No Id\n  job: Tester\n", encoding='utf-8')
+        cache = RosterCache(npc_dir)
+
+        cached = cache.load()
+        parsed = [{"id": character.get('id'), "name": character.get('name'),
+                   "gender": character.get('gender'), "job": character.get('job')}
+                  for character in cache._parse_all()]
+        assert cached == parsed
+        assert cached[-1]['name'] == "No Id"
+
+    print("\nTest completed!")
+
+if __name__ == "__main__":
+    test_edit_reparses_one_file()
+    test_delete_drops_one_row()
+    test_cache_matches_parsing()
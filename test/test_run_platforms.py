@@ -0,0 +1,158 @@
+"""
+Test run files: validation, upgrades and converting old pickled runs
+"""
+
+import sys
+import os
+import json
+import pickle
+import tempfile
+from collections import OrderedDict
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tech.run_platforms import RestrictedUnpickler, RunPlatforms
+
+class InSaveDir:
+    """Run files live under a relative saves/ folder - work in a throwaway one"""
+
+    def __enter__(self):
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        os.makedirs("saves")
+        return self
+
+    def __exit__(self, *exc):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+def run_path(filename=RunPlatforms.RUN_FILE):
+    return os.path.join("saves", filename)
+
+def test_corrupt_run_file_ignored():
+    """A run file that isn't valid JSON, or doesn't validate, isn't loaded"""
+    print("Testing corrupt run files...")
+    with InSaveDir():
+        with open(run_path(), 'w', encoding='utf-8') as f:
+            f.write('{"version":2,"generations":{"early_80s"')
+        assert not RunPlatforms(randomize=False).load_run()
+
+        with open(run_path(), 'w', encoding='utf-8') as f:
+            json.dump({"version": 2, "generations": [], "companies": []}, f)
+        assert not RunPlatforms(randomize=False).load_run()
+
+    print("\nTest completed!")
+
+def test_wrong_version_rejected():
+    """Only known run file versions pass validation"""
+    print("Testing run file versions...")
+    with InSaveDir():
+        run_data = RunPlatforms().to_run_data()
+        RunPlatforms.validate_run_data(run_data)
+
+        for version in (0, RunPlatforms.RUN_FILE_VERSION + 1, "2", None):
+            run_data["version"] = version
+            try:
+                RunPlatforms.validate_run_data(run_data)
+            except ValueError as e:
+                print(f"  Rejected: {e}")
+            else:
+                raise AssertionError(f"Version {version!r} was accepted")
+
+        with open(run_path(), 'w', encoding='utf-8') as f:
+            json.dump(run_data, f)
+        assert not RunPlatforms(randomize=False).load_run()
+
+    print("\nTest completed!")
+
+def test_table_must_match_selections():
+    """A run whose console table lists other manufacturers for its platforms isn't valid"""
+    print("Testing console table consistency...")
+    with InSaveDir():
+        run_data = RunPlatforms().to_run_data()
+        name, company = run_data["generations"]["early_80s"]["consoles"][0]
+        for entry in run_data["console_table"]["early_80s"]["consoles"]:
+            if entry[0] == name:
+                entry[1] = company + " (other)"
+        try:
+            RunPlatforms.validate_run_data(run_data)
+        except ValueError as e:
+            print(f"  Rejected: {e}")
+        else:
+            raise AssertionError("Mismatched console table was accepted")
+
+    print("\nTest completed!")
+
+def test_version_1_upgrade():
+    """A version 1 run is upgraded in place with a table that agrees with its platforms"""
+    print("Testing version 1 upgrade...")
+    with InSaveDir():
+        run_data = RunPlatforms().to_run_data()
+        run_data["version"] = 1
+        del run_data["console_seed"], run_data["console_table"]
+        with open(run_path(), 'w', encoding='utf-8') as f:
+            json.dump(run_data, f)
+
+        run = RunPlatforms(randomize=False)
+        assert run.load_run()
+        with open(run_path(), 'r', encoding='utf-8') as f:
+            upgraded = json.load(f)
+        RunPlatforms.validate_run_data(upgraded)
+        assert upgraded["version"] == RunPlatforms.RUN_FILE_VERSION
+        assert upgraded["generations"] == run_data["generations"]
+
+    print("\nTest completed!")
+
+def test_legacy_pickle_converted():
+    """An old current_run.pkl becomes a run file, and the pickle is removed"""
+    print("Testing pkl -> run conversion...")
+    with InSaveDir():
+        old_run = RunPlatforms()
+        with open(run_path(RunPlatforms.LEGACY_RUN_FILE), 'wb') as f:
+            pickle.dump({
+                "run_consoles": old_run.run_consoles,
+                "run_handhelds": old_run.run_handhelds,
+                "run_companies": old_run.run_companies
+            }, f)
+
+        run = RunPlatforms(randomize=False)
+        assert run.load_run()
+        assert os.path.exists(run_path())
+        assert not os.path.exists(run_path(RunPlatforms.LEGACY_RUN_FILE))
+        assert run.run_consoles == old_run.run_consoles
+        assert run.run_companies == old_run.run_companies
+
+        # The converted run loads on its own
+        assert RunPlatforms(randomize=False).load_run()
+
+    print("\nTest completed!")
+
+def test_unsafe_pickle_refused():
+    """An old run that references any class is refused and left where it is"""
+    print("Testing RestrictedUnpickler...")
+    with InSaveDir():
+        legacy_path = run_path(RunPlatforms.LEGACY_RUN_FILE)
+        with open(legacy_path, 'wb') as f:
+            pickle.dump(OrderedDict(run_consoles={}, run_handhelds={}, run_companies=[]), f)
+
+        with open(legacy_path, 'rb') as f:
+            try:
+                RestrictedUnpickler(f).load()
+            except pickle.UnpicklingError as e:
+                print(f"  Refused: {e}")
+            else:
+                raise AssertionError("Pickle with a class reference was loaded")
+
+        assert not RunPlatforms(randomize=False).load_run()
+        assert os.path.exists(legacy_path)
+        assert not os.path.exists(run_path())
+
+    print("\nTest completed!")
+
+if __name__ == "__main__":
+    test_corrupt_run_file_ignored()
+    test_wrong_version_rejected()
+    test_table_must_match_selections()
+    test_version_1_upgrade()
+    test_legacy_pickle_converted()
+    test_unsafe_pickle_refused()
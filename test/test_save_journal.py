@@ -0,0 +1,247 @@
+"""
+Test the autosave journal and the background save writer
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from systems.save_formats import get_format, load_save
+from systems.save_journal import SaveJournal
+from systems.save_writer import SaveSuperseded, SaveWriter
+
+class DemoSaveManager:
+    """The parts of main.SaveManager the journal and writer use, writing JSON saves atomically"""
+
+    def __init__(self, save_dir):
+        self.save_dir = Path(save_dir)
+        self.save_format = get_format('json')
+
+    def journal_path(self, filename, base_id):
+        return self.save_dir / f"{filename}.{base_id}{SaveJournal.EXTENSION}"
+
+    def save_path(self, filename):
+        return self.save_dir / f"{filename}{self.save_format.extension}"
+
+    def prepare_save(self, game_data):
+        game_data['game_metadata']['journal_base'] = SaveJournal.new_base_id()
+
+    def write_save(self, filename, game_data, on_progress=None):
+        self.save_format.dump_atomic(game_data, self.save_path(filename))
+
+    def save_game(self, filename, game_data):
+        self.prepare_save(game_data)
+        self.write_save(filename, game_data)
+
+    def load_game(self, filename):
+        data = load_save(self.save_path(filename))
+        base_id = data['game_metadata']['journal_base']
+        SaveJournal.replay(self.journal_path(filename, base_id), data)
+        return data
+
+def make_data():
+    return {'game_metadata': {}, 'time': {'day': 1},
+            'money': {'bank_balance': 100, 'transaction_history': []}}
+
+def play_day(journal, data, day):
+    """One day of changes, recorded the way the money system and studio record them"""
+    data['time']['day'] = day
+    data['money']['bank_balance'] -= 10
+    transaction = {'date': f"1978-01-{day:02d}", 'amount': -10}
+    data['money']['transaction_history'].append(transaction)
+
+    journal.record_set(['money', 'bank_balance'], data['money']['bank_balance'])
+    journal.record_append(['money', 'transaction_history'], transaction)
+    journal.mark_dirty('time')
+    journal.flush(data)
+
+def test_replay_after_crash():
+    """The last full save plus its journal gives back the live data, even with a torn last line"""
+    print("Testing SaveJournal replay...")
+    with tempfile.TemporaryDirectory() as save_dir:
+        manager = DemoSaveManager(save_dir)
+        data = make_data()
+        manager.save_game('demo', data)
+
+        journal = SaveJournal(manager, 'demo', data['game_metadata']['journal_base'])
+        for day in range(2, 8):
+            play_day(journal, data, day)
+
+        # Crash halfway through the next write
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"op":"set","keys":["money","bank_bal')
+
+        recovered = manager.load_game('demo')
+        print(f"  Recovered balance: {recovered['money']['bank_balance']}")
+        assert recovered == data
+
+        # Attaching again cuts the torn line off, so new entries still replay
+        journal = SaveJournal(manager, 'demo', data['game_metadata']['journal_base'])
+        play_day(journal, data, 8)
+        assert manager.load_game('demo') == data
+
+    print("\nTest completed!")
+
+def test_other_base_journal_ignored():
+    """A journal written after a different full save is neither replayed nor appended to"""
+    print("Testing journals of another base...")
+    with tempfile.TemporaryDirectory() as save_dir:
+        manager = DemoSaveManager(save_dir)
+        data = make_data()
+        manager.save_game('demo', data)
+        base_id = data['game_metadata']['journal_base']
+
+        # A stray journal under this save's name that starts with another base
+        path = manager.journal_path('demo', base_id)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'op': 'base', 'id': 'another-save'}) + '\n')
+            f.write(json.dumps({'op': 'set', 'keys': ['money', 'bank_balance'], 'value': 999}) + '\n')
+
+        recovered = load_save(manager.save_path('demo'))
+        assert SaveJournal.replay(path, recovered) == 0
+        assert recovered['money']['bank_balance'] == 100
+
+        # Attaching a journal to the save drops the stray one and starts clean
+        journal = SaveJournal(manager, 'demo', base_id)
+        assert not path.exists() and journal.entries == 0
+        play_day(journal, data, 2)
+        assert manager.load_game('demo') == data
+
+    print("\nTest completed!")
+
+def test_failed_write_keeps_previous_save():
+    """A write that fails part way leaves the last good save and its journal untouched"""
+    print("Testing a failed background save...")
+    with tempfile.TemporaryDirectory() as save_dir:
+        manager = DemoSaveManager(save_dir)
+        writer = SaveWriter(manager)
+        data = make_data()
+        manager.save_game('demo', data)
+
+        journal = SaveJournal(manager, 'demo', data['game_metadata']['journal_base'], writer)
+        play_day(journal, data, 2)
+        saved_bytes = manager.save_path('demo').read_bytes()
+        good = json.loads(json.dumps(data))
+
+        # Something that can't be serialized makes the dump fail after it has started writing
+        data['unsaveable'] = object()
+        journal.save_full(data)
+        data['money']['bank_balance'] -= 5
+        journal.record_set(['money', 'bank_balance'], data['money']['bank_balance'])
+        writer.wait()
+
+        assert writer.get_progress()['error']
+        assert manager.save_path('demo').read_bytes() == saved_bytes
+        assert not list(Path(save_dir).glob('*.tmp'))
+
+        # The change made during the failed write lands in the old journal
+        assert journal.flush(data) == 1
+        del data['unsaveable']
+        good['money']['bank_balance'] -= 5
+        recovered = manager.load_game('demo')
+        print(f"  Recovered balance: {recovered['money']['bank_balance']}")
+        assert recovered == good == data
+
+    print("\nTest completed!")
+
+def test_compaction_switches_journal():
+    """A compaction on the writer moves the journal to the new save's base only once it is written"""
+    print("Testing background compaction...")
+    with tempfile.TemporaryDirectory() as save_dir:
+        manager = DemoSaveManager(save_dir)
+        writer = SaveWriter(manager)
+        data = make_data()
+        manager.save_game('demo', data)
+        old_path = manager.journal_path('demo', data['game_metadata']['journal_base'])
+
+        journal = SaveJournal(manager, 'demo', data['game_metadata']['journal_base'], writer)
+        play_day(journal, data, 2)
+        journal.compact(data)
+        play_day(journal, data, 3)  # Held back while the save is written
+        writer.wait()
+        play_day(journal, data, 4)
+
+        assert journal.path != old_path
+        assert journal.base_id == data['game_metadata']['journal_base']
+        assert manager.load_game('demo') == data
+
+    print("\nTest completed!")
+
+def test_in_place_sections_journaled_once():
+    """Sections changed in place and marked dirty every autosave are written only when they changed"""
+    print("Testing dirty sections...")
+    with tempfile.TemporaryDirectory() as save_dir:
+        manager = DemoSaveManager(save_dir)
+        data = make_data()
+        data['current_game'] = {}
+        manager.save_game('demo', data)
+        journal = SaveJournal(manager, 'demo', data['game_metadata']['journal_base'])
+
+        # Money spent on a project and the project itself, changed in place elsewhere
+        data['money']['bank_balance'] -= 50
+        journal.record_set(['money', 'bank_balance'], data['money']['bank_balance'])
+        data['current_game']['name'] = "Space Quest"
+        journal.mark_dirty('current_game', 'general_notes')
+        assert journal.flush(data) == 2
+
+        journal.mark_dirty('current_game', 'general_notes')
+        assert journal.flush(data) == 0
+
+        data['general_notes'] = "Make it fun"
+        journal.mark_dirty('current_game', 'general_notes')
+        assert journal.flush(data) == 1
+
+        recovered = manager.load_game('demo')
+        assert recovered['current_game'] == {'name': "Space Quest"}
+        assert recovered == data
+
+        # After a full save the next journal starts over, so a value changed back is written again
+        data['current_game']['name'] = "Cave Quest"
+        journal.compact(data)
+        data['current_game']['name'] = "Space Quest"
+        journal.mark_dirty('current_game')
+        assert journal.flush(data) == 1
+        assert manager.load_game('demo') == data
+
+    print("\nTest completed!")
+
+def test_replaced_queued_save_reports_back():
+    """A queued save replaced by a newer one is never written, but its on_done still hears back"""
+    print("Testing superseded saves...")
+    with tempfile.TemporaryDirectory() as save_dir:
+        manager = DemoSaveManager(save_dir)
+        release = threading.Event()
+        write_save = manager.write_save
+
+        def slow_write(filename, game_data, on_progress=None):
+            release.wait(5)
+            write_save(filename, game_data, on_progress)
+
+        manager.write_save = slow_write
+        writer = SaveWriter(manager)
+        results = {}
+        data = make_data()
+        for day in (1, 2, 3):
+            data['time']['day'] = day
+            writer.save('demo', data, on_done=lambda error, day=day: results.__setitem__(day, error))
+
+        # Day 2 was replaced by day 3 while day 1 was still being written
+        assert isinstance(results.get(2), SaveSuperseded)
+        release.set()
+        writer.wait()
+        assert results[1] is None and results[3] is None
+        assert load_save(manager.save_path('demo'))['time']['day'] == 3
+
+    print("\nTest completed!")
+
+if __name__ == "__main__":
+    test_replay_after_crash()
+    test_other_base_journal_ignored()
+    test_failed_write_keeps_previous_save()
+    test_compaction_switches_journal()
+    test_in_place_sections_journaled_once()
+    test_replaced_queued_save_reports_back()
@@ -0,0 +1,94 @@
+"""
+Test the day-by-day state history used for rewinding
+"""
+
+import sys
+import os
+import copy
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from systems.game_state import EmployeeState, MoneyState, TimeState, wrap_state
+from systems.game_systems import TimeSystem
+from systems.money_system import MoneySystem
+from systems.bills_system import BillsSystem
+from systems.state_history import FrozenDict, PersistentList, StateHistory, freeze, thaw
+
+class DemoGameData:
+    def __init__(self):
+        # Typed sections, as GameData loads them
+        self.data = wrap_state({
+            'player_data': {'stress_level': 0},
+            'completed_games': [{'name': f"Game {i}", 'sales': i * 1000} for i in range(200)]
+        })
+
+def test_rewind_restores_state():
+    """Rewinding brings money, time and employees back to an earlier day"""
+    print("Testing StateHistory rewind...")
+    game_data = DemoGameData()
+    time_system = TimeSystem(game_data)
+    money_system = MoneySystem(game_data)
+    bills_system = BillsSystem(game_data, money_system)
+    history = StateHistory(game_data)
+    history.attach(time_system)
+
+    saved_days = {}
+    for day in range(10):
+        money_system.earn_money(100, f"Sales day {day}")
+        bills_system.hire_employee({'id': day, 'name': f"Employee {day}", 'salary': 500 + day})
+        time_system.advance_days(1)
+        saved_days[history.list_snapshots()[-1]] = copy.deepcopy(game_data.data)
+
+    label = history.rewind(4)
+    print(f"  Rewound to {label}")
+    restored = game_data.data
+    assert restored == saved_days[label]
+    assert time_system.get_iso_date() == label
+    assert MoneySystem(game_data).get_bank_balance() == saved_days[label]['money']['bank_balance']
+    assert len(restored['employees']) == 6
+
+    # Restored data is live and typed again, not a read-only snapshot
+    assert isinstance(restored['time'], TimeState) and isinstance(restored['money'], MoneyState)
+    assert all(isinstance(employee, EmployeeState) for employee in restored['employees'])
+    restored['money']['bank_balance'] += 1
+    restored['employees'][0]['salary'] = 9999
+
+    # Changing the live data didn't reach the kept snapshot
+    assert history.snapshots[-1][1]['employees'][0]['salary'] == 500
+    assert history.rewind(0) == label
+    assert game_data.data == saved_days[label]
+
+    print("\nTest completed!")
+
+def test_unchanged_parts_are_shared():
+    """Snapshots share every subtree (and list chunk) that didn't change since the previous one"""
+    print("Testing structural sharing...")
+    data = {
+        'player_data': {'studio_name': 'Demo', 'stress_level': 0},
+        'completed_games': [{'name': f"Game {i}"} for i in range(100)],
+        'money': {'bank_balance': 100}
+    }
+    first = freeze(data)
+    assert freeze(data, first) is first
+
+    data['money']['bank_balance'] = 50
+    data['completed_games'].append({'name': 'Game 100'})
+    second = freeze(data, first)
+
+    assert isinstance(second, FrozenDict) and isinstance(second['completed_games'], PersistentList)
+    assert second['player_data'] is first['player_data']
+    assert second['money'] is not first['money']
+
+    # Only the last chunk of a list that grew is new
+    old_chunks, new_chunks = first['completed_games'].chunks, second['completed_games'].chunks
+    assert all(new is old for new, old in zip(new_chunks[:-1], old_chunks[:-1]))
+    assert new_chunks[-1] is not old_chunks[-1]
+    assert new_chunks[-1][0] is old_chunks[-1][0]
+
+    assert thaw(second) == data
+    assert thaw(first)['money']['bank_balance'] == 100
+
+    print("\nTest completed!")
+
+if __name__ == "__main__":
+    test_rewind_restores_state()
+    test_unchanged_parts_are_shared()